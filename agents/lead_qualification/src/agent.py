@@ -1,20 +1,14 @@
 from __future__ import annotations
 
-import re
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Tuple, Union
+
+from shared.observability import logging as tracing
+from shared.policies.redaction import redact
+from shared.runtime.types import LeadBatch
 
 TARGET_INDUSTRIES = {"manufacturing", "healthcare", "financial services", "retail", "logistics", "software"}
 SENIOR_TITLES = {"cio", "cto", "vp", "vice president", "director", "head", "chief"}
 
-EMAIL_RE = re.compile(r"[\w\.-]+@[\w\.-]+\.\w+")
-PHONE_RE = re.compile(r"(\+?\d[\d\-\(\) ]{8,}\d)")
-
-
-def redact(text: str) -> str:
-    text = EMAIL_RE.sub("[REDACTED_EMAIL]", text)
-    text = PHONE_RE.sub("[REDACTED_PHONE]", text)
-    return text
-
 
 def _kw_present(s: str, kws: List[str]) -> bool:
     s = (s or "").lower()
@@ -45,6 +39,7 @@ def _timeline_bucket(timeline: str) -> str:
 
 
 def score_lead(lead: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+    tracing.stage("normalize")
     industry = (lead.get("industry") or "").lower().strip()
     employees = int(lead.get("employees") or 0)
     region = (lead.get("region") or "").lower()
@@ -57,6 +52,7 @@ def score_lead(lead: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
     budget = _budget_status(budget_raw)
     timeline = _timeline_bucket(timeline_raw)
 
+    tracing.stage("scoring")
     fit = 0
     intent = 0
     reasons: List[str] = []
@@ -140,6 +136,7 @@ def score_lead(lead: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
         reasons.append("strong fit")
 
     reasons = list(dict.fromkeys(reasons))
+    tracing.count("reasons", len(reasons))
 
     return score, {
         "reasons": reasons,
@@ -164,13 +161,16 @@ def decide(score: int, meta: Dict[str, Any]) -> Tuple[str, float]:
     return "nurture", 0.8
 
 
+@tracing.traced("lead_qualification.run")
 def run(payload: Dict[str, Any]) -> Dict[str, Any]:
     lead = payload.get("lead", {}) or {}
     score, meta = score_lead(lead)
+    tracing.stage("decision")
     decision, confidence = decide(score, meta)
 
     explanation = meta["reasons"][:10]
 
+    tracing.stage("redaction")
     slack_msg = (
         f"{decision.upper()} lead ({int(score)}). "
         f"{lead.get('industry','')}, {lead.get('title','')}. "
@@ -178,6 +178,7 @@ def run(payload: Dict[str, Any]) -> Dict[str, Any]:
     )
     slack_msg = redact(slack_msg)
 
+    tracing.stage("actions")
     actions: List[Dict[str, Any]] = [
         {"type": "slack_post", "target": "ae-channel", "risk": "low", "requires_approval": False, "payload": {"message": slack_msg}}
     ]
@@ -194,6 +195,7 @@ def run(payload: Dict[str, Any]) -> Dict[str, Any]:
                 "payload": {"fields": {"Lead_Status__c": "Qualified", "Qualification_Score__c": int(score), "Next_Step__c": "Schedule discovery"}},
             }
         )
+    tracing.count("actions", len(actions))
 
     return {
         "decision": decision,
@@ -204,3 +206,146 @@ def run(payload: Dict[str, Any]) -> Dict[str, Any]:
         "confidence": round(float(confidence), 2),
         "requires_approval": requires_approval,
     }
+
+
+# ---------------------------------------------------------------------------
+# Batch scoring
+#
+# score_leads_batch() gives the same (score, meta, decision, confidence) as
+# score_lead() + decide() per lead, but normalizes each column once and
+# classifies each distinct industry/title/budget/timeline/use_case string once.
+# ---------------------------------------------------------------------------
+
+MIGRATION_KWS = ["migrat", "cloud", "moderniz", "workload"]
+SECURITY_KWS = ["security", "infosec", "compliance", "data residency"]
+
+BUDGET_INTENT = {"approved": 15, "planning": 5, "not_approved": 2, "unknown": 3}
+TIMELINE_INTENT = {"near": 10, "mid": 5, "long": 0, "unknown": 2}
+
+
+def _classify(values: List[Any], fn: Any) -> List[Any]:
+    memo: Dict[Any, Any] = {}
+    out: List[Any] = []
+    for v in values:
+        hit = memo.get(v, memo)
+        if hit is memo:
+            hit = memo[v] = fn(v)
+        out.append(hit)
+    return out
+
+
+def _employee_fit(employees: int) -> int:
+    if employees >= 2000:
+        return 20
+    if employees >= 500:
+        return 15
+    if employees >= 50:
+        return 10
+    return 2
+
+
+def _reasons(key: Tuple[Any, ...]) -> List[str]:
+    budget, timeline, icp, senior, use_case, migration, security, strong_fit = key
+    reasons: List[str] = []
+
+    if budget == "approved" and timeline == "near":
+        reasons.append("budget and timeline")
+    reasons.append("ICP fit: fit present" if icp else "ICP fit: outside ICP")
+    if senior:
+        reasons.append("senior buyer")
+    reasons.append("clear use case: use case present" if use_case else "clear use case: missing use case")
+    if not migration:
+        reasons.append("no migration intent")
+    if security:
+        reasons.append("security as gating item")
+
+    if budget == "planning":
+        reasons.append("timeline longer or budget not approved")
+    elif budget == "not_approved":
+        reasons.append("budget not approved")
+        reasons.append("timeline longer or budget not approved")
+
+    if timeline == "mid":
+        reasons.append("timeline longer or budget not approved")
+    elif timeline == "long":
+        reasons.append("timeline too long")
+        reasons.append("timeline longer or budget not approved")
+
+    if not use_case:
+        reasons.append("insufficient intent")
+    if strong_fit:
+        reasons.append("strong fit")
+
+    return list(dict.fromkeys(reasons))
+
+
+@tracing.traced("lead_qualification.score_leads_batch")
+def score_leads_batch(leads: Union[List[Dict[str, Any]], LeadBatch]) -> List[Tuple[int, Dict[str, Any], str, float]]:
+    # A LeadBatch already holds normalized columns; plain dicts are read once per field.
+    if not isinstance(leads, LeadBatch):
+        rows = [lead or {} for lead in leads]
+        leads = LeadBatch()
+        leads.industry = [lead.get("industry") or "" for lead in rows]
+        leads.employees = [int(lead.get("employees") or 0) for lead in rows]
+        leads.region = [lead.get("region") or "" for lead in rows]
+        leads.title = [lead.get("title") or "" for lead in rows]
+        leads.use_case = [lead.get("use_case") or "" for lead in rows]
+        leads.budget = [lead.get("budget") or "" for lead in rows]
+        leads.timeline = [lead.get("timeline") or "" for lead in rows]
+        leads.notes = [lead.get("notes") or "" for lead in rows]
+    tracing.count("leads", len(leads.employees))
+    tracing.stage("normalize")
+
+    # Column normalization, one pass per field.
+    icp = _classify(leads.industry, lambda s: s.lower().strip() in TARGET_INDUSTRIES)
+    employee_fit = [_employee_fit(e) for e in leads.employees]
+    region_fit = _classify(leads.region, lambda s: 5 if s.lower() in {"na", "eu"} else 0)
+    senior = _classify(leads.title, lambda s: any(t in s.lower() for t in SENIOR_TITLES))
+    use_case = [uc.strip() for uc in leads.use_case]
+    migration = _classify(use_case, lambda s: _kw_present(s, MIGRATION_KWS))
+    security_uc = _classify(use_case, lambda s: _kw_present(s, SECURITY_KWS))
+    budget = _classify(leads.budget, _budget_status)
+    timeline = _classify(leads.timeline, _timeline_bucket)
+
+    # Notes only matter for the security reason; a keyword can straddle the
+    # use_case/notes join, so rows without a use_case-only hit check the join.
+    security = [
+        sec or (bool(notes) and _kw_present(uc + " " + notes, SECURITY_KWS))
+        for sec, uc, notes in zip(security_uc, use_case, leads.notes)
+    ]
+
+    tracing.stage("scoring")
+    fit = [
+        (15 if i else 0) + e + (10 if s else 4) + r
+        for i, e, s, r in zip(icp, employee_fit, senior, region_fit)
+    ]
+    intent = [
+        (15 if m else 0) + BUDGET_INTENT[b] + TIMELINE_INTENT[t]
+        for m, b, t in zip(migration, budget, timeline)
+    ]
+    intent = [i if uc else min(i, 6) for i, uc in zip(intent, use_case)]
+    score = [max(0, min(100, f + i)) for f, i in zip(fit, intent)]
+
+    tracing.stage("decision")
+    reasons_memo: Dict[Tuple[Any, ...], List[str]] = {}
+    out: List[Tuple[int, Dict[str, Any], str, float]] = []
+    for k in range(len(score)):
+        key = (budget[k], timeline[k], icp[k], senior[k], bool(use_case[k]), migration[k], security[k], fit[k] >= 40)
+        reasons = reasons_memo.get(key)
+        if reasons is None:
+            reasons = reasons_memo[key] = _reasons(key)
+
+        meta = {
+            "reasons": reasons[:],
+            "fit": fit[k],
+            "intent": intent[k],
+            "budget": budget[k],
+            "timeline": timeline[k],
+            "has_migration_intent": migration[k],
+            "is_senior": senior[k],
+        }
+        decision, confidence = decide(score[k], meta)
+        out.append((score[k], meta, decision, confidence))
+    tracing.count("reason_patterns", len(reasons_memo))
+
+    return out
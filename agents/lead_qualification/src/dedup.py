@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import hashlib
+import re
+import struct
+from array import array
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from agents.lead_qualification.src import agent
+from shared.observability import logging as tracing
+
+# Pre-scoring entity resolution. Leads that name the same company (exactly,
+# or with a near-identical spelling), the same email domain and the same
+# title collapse to one canonical lead, which is scored once; every member
+# of the cluster gets that result.
+#
+# Memory is proportional to the number of canonical leads: one exact-key
+# entry per distinct (company, domain, title) spelling, the normalized name
+# and a few LSH bucket entries per canonical lead, and one int per input lead
+# for the fan-out map.
+
+LEGAL_SUFFIXES = {
+    "inc", "incorporated", "llc", "ltd", "limited", "corp", "corporation", "co", "company",
+    "gmbh", "plc", "sa", "ag", "bv", "pty", "the",
+}
+NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+# (normalized title, band number, that band's MinHash values)
+BucketKey = Tuple[str, int, Tuple[int, ...]]
+
+
+def normalize_company(name: Any) -> str:
+    tokens = NON_ALNUM.sub(" ", str(name or "").lower()).split()
+    core = [t for t in tokens if t not in LEGAL_SUFFIXES]
+    return " ".join(core or tokens)
+
+
+def normalize_title(title: Any) -> str:
+    return " ".join(NON_ALNUM.sub(" ", str(title or "").lower()).split())
+
+
+def email_domain(lead: Dict[str, Any]) -> str:
+    email = str(lead.get("email") or "")
+    domain = email.rpartition("@")[2] if "@" in email else str(lead.get("domain") or lead.get("website") or "")
+    domain = domain.strip().lower()
+    for prefix in ("https://", "http://", "www."):
+        if domain.startswith(prefix):
+            domain = domain[len(prefix) :]
+    return domain.split("/", 1)[0]
+
+
+def shingles(name: str, k: int = 3) -> Set[str]:
+    if len(name) <= k:
+        return {name}
+    return {name[i : i + k] for i in range(len(name) - k + 1)}
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def exact_key(company: str, domain: str, title: str) -> bytes:
+    return hashlib.blake2b(f"{company}\0{domain}\0{title}".encode("utf-8"), digest_size=8).digest()
+
+
+@dataclass
+class DedupStats:
+    leads: int = 0
+    canonical: int = 0
+    exact_duplicates: int = 0
+    near_duplicates: int = 0
+
+    @property
+    def collapse_ratio(self) -> float:
+        # Input leads per canonical lead; 1.0 means nothing collapsed.
+        return self.leads / self.canonical if self.canonical else 1.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return dict(asdict(self), collapse_ratio=round(self.collapse_ratio, 3))
+
+
+class LeadIndex:
+    """Resolves leads to canonical ids in one pass.
+
+    Exact matches go through a hash of the normalized (company, domain,
+    title). A lead with neither a company nor an email domain is never
+    matched: it becomes a cluster of its own. Near-duplicate company names go through MinHash LSH over
+    character 3-grams: `bands` x `rows` hashes, with buckets scoped to the
+    title so only plausible candidates are compared. Candidates are then
+    confirmed with the exact shingle Jaccard (>= threshold), and email
+    domains must agree unless one side has none.
+
+    A bucket holds at most `max_bucket` leads, so a very common name shape
+    costs at most bands * max_bucket comparisons per lead instead of growing
+    with the input.
+    """
+
+    def __init__(self, threshold: float = 0.8, bands: int = 4, rows: int = 4, max_bucket: int = 16, seed: int = 1) -> None:
+        if bands * rows > 16:
+            raise ValueError("bands * rows must be at most 16 (one 64-byte BLAKE2b digest per shingle)")
+        self.threshold = threshold
+        self.max_bucket = max_bucket
+        self.bands = bands
+        self.rows = rows
+        self._hash_key = seed.to_bytes(8, "little")
+        self._unpack = struct.Struct(f"<{bands * rows}I").unpack
+        # 3-grams repeat heavily across company names, so each is hashed once.
+        self._shingle_hashes: Dict[str, Tuple[int, ...]] = {}
+        self._exact: Dict[bytes, int] = {}
+        self._buckets: Dict[BucketKey, List[int]] = {}
+        self._names: List[str] = []
+        self._domains: List[str] = []
+        self._company_memo: Dict[Any, str] = {}
+        self._title_memo: Dict[Any, str] = {}
+        self.stats = DedupStats()
+
+    def _signature(self, name: str) -> List[int]:
+        # One keyed BLAKE2b digest per shingle supplies all bands * rows hash
+        # functions at once; the signature is the column-wise minimum.
+        memo = self._shingle_hashes
+        rows = []
+        for s in shingles(name):
+            h = memo.get(s)
+            if h is None:
+                digest = hashlib.blake2b(s.encode("utf-8"), digest_size=4 * self.bands * self.rows, key=self._hash_key).digest()
+                h = memo[s] = self._unpack(digest)
+            rows.append(h)
+        return [min(col) for col in zip(*rows)]
+
+    def _bucket_keys(self, name: str, title: str) -> List[BucketKey]:
+        sig = self._signature(name)
+        r = self.rows
+        return [(title, i, tuple(sig[i * r : (i + 1) * r])) for i in range(self.bands)]
+
+    def _near(self, name: str, domain: str, keys: List[BucketKey]) -> Optional[int]:
+        seen: Set[int] = set()
+        best: Optional[int] = None
+        best_score = self.threshold
+        mine = shingles(name)
+        for key in keys:
+            for cid in self._buckets.get(key, ()):
+                if cid in seen:
+                    continue
+                seen.add(cid)
+                other = self._domains[cid]
+                if domain and other and domain != other:
+                    continue
+                score = jaccard(mine, shingles(self._names[cid]))
+                if score > best_score or (score == best_score and (best is None or cid < best)):
+                    best, best_score = cid, score
+        return best
+
+    def resolve(self, lead: Dict[str, Any]) -> Tuple[int, bool]:
+        """Canonical id for `lead`, and whether it started a new cluster."""
+        self.stats.leads += 1
+        raw_company = lead.get("company")
+        company = self._company_memo.get(raw_company)
+        if company is None:
+            company = self._company_memo[raw_company] = normalize_company(raw_company)
+        raw_title = lead.get("title")
+        title = self._title_memo.get(raw_title)
+        if title is None:
+            title = self._title_memo[raw_title] = normalize_title(raw_title)
+        domain = email_domain(lead)
+
+        if not company and not domain:
+            # Nothing identifies the organization, and a shared title alone
+            # proves nothing: the lead stays its own cluster.
+            return self._new(company, domain), True
+
+        key = exact_key(company, domain, title)
+        cid = self._exact.get(key)
+        if cid is not None:
+            self.stats.exact_duplicates += 1
+            return cid, False
+
+        buckets = self._bucket_keys(company, title) if company else []
+        cid = self._near(company, domain, buckets) if buckets else None
+        if cid is not None:
+            self.stats.near_duplicates += 1
+            self._exact[key] = cid
+            return cid, False
+
+        cid = self._new(company, domain)
+        self._exact[key] = cid
+        for bucket in buckets:
+            members = self._buckets.setdefault(bucket, [])
+            if len(members) < self.max_bucket:
+                members.append(cid)
+        return cid, True
+
+    def _new(self, company: str, domain: str) -> int:
+        cid = len(self._names)
+        self._names.append(company)
+        self._domains.append(domain)
+        self.stats.canonical += 1
+        return cid
+
+
+def dedup_leads(leads: Iterable[Optional[Dict[str, Any]]], threshold: float = 0.8) -> Tuple[List[Dict[str, Any]], array, DedupStats]:
+    """Collapse `leads` to canonical leads.
+
+    Returns the canonical leads, the canonical id of every input lead (in
+    input order), and the stats. A canonical lead is its cluster's first
+    lead, with any empty field filled from the first later member that has it.
+    """
+    index = LeadIndex(threshold)
+    canonical: List[Dict[str, Any]] = []
+    assignment = array("l")
+    for lead in leads:
+        lead = lead or {}
+        cid, new = index.resolve(lead)
+        assignment.append(cid)
+        if new:
+            canonical.append(dict(lead))
+            continue
+        merged = canonical[cid]
+        for k, v in lead.items():
+            if v not in (None, "") and merged.get(k) in (None, ""):
+                merged[k] = v
+    tracing.count("leads", index.stats.leads)
+    tracing.count("canonical_leads", index.stats.canonical)
+    return canonical, assignment, index.stats
+
+
+def fan_out(results: List[Any], assignment: array) -> List[Any]:
+    return [results[cid] for cid in assignment]
+
+
+@tracing.traced("lead_qualification.run_deduped")
+def run_deduped(
+    leads: Iterable[Optional[Dict[str, Any]]],
+    run_fn: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+    threshold: float = 0.8,
+) -> Tuple[List[Dict[str, Any]], DedupStats]:
+    """run() once per canonical lead; every input lead in a cluster gets the
+    same result object. Execute actions per distinct result, not per input
+    lead, so a duplicated lead yields one Slack post rather than many."""
+    run_fn = run_fn or agent.run
+    tracing.stage("dedup")
+    canonical, assignment, stats = dedup_leads(leads, threshold)
+    tracing.stage("scoring")
+    results = [run_fn({"lead": lead}) for lead in canonical]
+    return fan_out(results, assignment), stats
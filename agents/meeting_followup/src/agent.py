@@ -1,73 +1,133 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
-EMAIL_RE = re.compile(r"[\w\.-]+@[\w\.-]+\.\w+")
+from shared.observability import logging as tracing
+from shared.policies.redaction import redact
 
+REQUIREMENT_KWS = ["eu data residency", "encryption at rest", "sso"]
+COMPETITOR_KWS = ["azure", "gcp", "snowflake"]
+METRIC_KWS = ["half"]
+ACTION_KWS = ["send", "estimate", "security", "review", "workshop", "loop in", "procurement"]
+DUE_DATE_KWS = ["friday", "next tuesday", "tuesday", "jan 10", "january 10", "next week", "q1"]
+DECISION_KWS = ["cio", "procurement", "redlines"]
 
-def redact(text: str) -> str:
-    return EMAIL_RE.sub("[REDACTED_EMAIL]", text)
 
+class KeywordMatcher:
+    """Finds every occurrence of a fixed keyword set in one left-to-right pass.
+
+    The keywords compile into a single longest-first alternation. A regex scan
+    skips matches that overlap the one it just returned, so two tables built
+    up front restore them: keywords contained inside a longer keyword, and the
+    offset to resume from when a keyword's suffix can start another keyword.
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        kws = sorted(set(keywords), key=lambda k: (-len(k), k))
+        self.keywords = kws
+        self._re = re.compile("|".join(re.escape(k) for k in kws))
+        self._contained: Dict[str, List[Tuple[int, str]]] = {}
+        self._resume: Dict[str, int] = {}
+
+        for k in kws:
+            inner = [
+                (off, k2)
+                for k2 in kws
+                if k2 != k
+                for off in range(len(k) - len(k2) + 1)
+                if k.startswith(k2, off)
+            ]
+            if inner:
+                self._contained[k] = sorted(inner)
+            for off in range(1, len(k)):
+                tail = k[off:]
+                if any(len(k2) > len(tail) and k2.startswith(tail) for k2 in kws):
+                    self._resume[k] = off
+                    break
+
+    def scan(self, text: str, pos: int = 0) -> Dict[str, List[int]]:
+        hits: Dict[str, List[int]] = {}
+        search = self._re.search
+        while True:
+            m = search(text, pos)
+            if m is None:
+                return hits
+            start = m.start()
+            kw = m.group()
+            hits.setdefault(kw, []).append(start)
+            resume: Optional[int] = self._resume.get(kw)
+            for off, inner in self._contained.get(kw, ()):
+                if resume is None or off < resume:
+                    hits.setdefault(inner, []).append(start + off)
+            pos = start + resume if resume else m.end()
+
+
+MATCHER = KeywordMatcher(REQUIREMENT_KWS + COMPETITOR_KWS + METRIC_KWS + ACTION_KWS + DUE_DATE_KWS + DECISION_KWS)
+
+
+def scan_keywords(transcript: str) -> Dict[str, List[int]]:
+    return MATCHER.scan(transcript.strip().lower())
 
-def run(payload: Dict[str, Any]) -> Dict[str, Any]:
-    transcript = (payload.get("transcript") or "").strip()
-    opp = payload.get("opportunity") or payload.get("meeting", {}).get("opportunity") or {}
-    t = transcript.lower()
 
+METRIC_RE = re.compile(r"\d{1,3}\s*%")
+
+
+def extract(has: Callable[[str], bool], metrics: List[str]) -> Dict[str, Any]:
+    """Structured fields from keyword presence (`has`) and the percent
+    metrics found in the transcript, in transcript order."""
     requirements: List[str] = []
-    if "eu data residency" in t:
+    if has("eu data residency"):
         requirements.append("EU data residency")
-    if "encryption at rest" in t:
+    if has("encryption at rest"):
         requirements.append("encryption at rest")
-    if "sso" in t:
+    if has("sso"):
         requirements.append("SSO")
 
     competition: List[str] = []
-    if "azure" in t:
+    if has("azure"):
         competition.append("Azure")
-    if "gcp" in t:
+    if has("gcp"):
         competition.append("GCP")
-    if "snowflake" in t:
+    if has("snowflake"):
         competition.append("Snowflake")
 
-    metrics: List[str] = []
-    metrics.extend(re.findall(r"\d{1,3}\s*%", transcript))
-    if "half" in t:
+    metrics = list(metrics)
+    if has("half"):
         metrics.append("half")
 
     seller_actions: List[str] = []
-    if "send" in t and "estimate" in t:
+    if has("send") and has("estimate"):
         seller_actions.append("send estimate")
-    if "security" in t and ("review" in t or "workshop" in t):
+    if has("security") and (has("review") or has("workshop")):
         seller_actions.append("schedule security workshop/review")
 
     customer_actions: List[str] = []
-    if "loop in" in t:
+    if has("loop in"):
         customer_actions.append("loop in stakeholders")
-    if "procurement" in t:
+    if has("procurement"):
         customer_actions.append("engage procurement")
 
     due_dates: List[str] = []
-    for token in ["friday", "next tuesday", "tuesday", "jan 10", "january 10", "next week", "q1"]:
-        if token in t:
+    for token in DUE_DATE_KWS:
+        if has(token):
             due_dates.append(token)
 
     decision_process: Dict[str, Any] = {}
-    if "cio" in t:
+    if has("cio"):
         decision_process["approver"] = "CIO"
-    if "procurement" in t:
+    if has("procurement"):
         decision_process["paper_process"] = "Procurement"
-    if "redlines" in t:
+    if has("redlines"):
         decision_process["paper_process_detail"] = "redlines"
 
     risks: List[str] = []
     open_questions: List[str] = []
-    if "security" in t:
+    if has("security"):
         risks.append("security gating item")
         open_questions.append("Which controls are required for approval?")
 
-    extracted = {
+    return {
         "requirements": requirements,
         "competition": competition,
         "metrics": metrics,
@@ -81,6 +141,15 @@ def run(payload: Dict[str, Any]) -> Dict[str, Any]:
         },
     }
 
+
+def build_output(extracted: Dict[str, Any], opp: Dict[str, Any]) -> Dict[str, Any]:
+    requirements = extracted["requirements"]
+    competition = extracted["competition"]
+    metrics = extracted["metrics"]
+    seller_actions = extracted["next_steps"]["seller_actions"]
+    risks = extracted["next_steps"]["risks"]
+
+    tracing.stage("redaction")
     recap = (
         f"Meeting recap . Stage={opp.get('stage','')}. "
         f"Reqs={', '.join(requirements) or 'none captured'}. "
@@ -90,6 +159,7 @@ def run(payload: Dict[str, Any]) -> Dict[str, Any]:
     )
     recap = redact(recap)
 
+    tracing.stage("actions")
     actions: List[Dict[str, Any]] = [
         {"type": "slack_post", "target": "ae-channel", "risk": "low", "requires_approval": False, "payload": {"message": recap}},
         {
@@ -115,3 +185,103 @@ def run(payload: Dict[str, Any]) -> Dict[str, Any]:
         "requires_approval": True,
     }
 
+
+def _opportunity(payload: Dict[str, Any]) -> Dict[str, Any]:
+    return payload.get("opportunity") or payload.get("meeting", {}).get("opportunity") or {}
+
+
+@tracing.traced("meeting_followup.run")
+def run(payload: Dict[str, Any]) -> Dict[str, Any]:
+    tracing.stage("normalize")
+    transcript = (payload.get("transcript") or "").strip()
+    opp = _opportunity(payload)
+    t = transcript.lower()
+    tracing.count("transcript_chars", len(t))
+
+    tracing.stage("extraction")
+    extracted = extract(t.__contains__, METRIC_RE.findall(transcript))
+
+    tracing.count("requirements", len(extracted["requirements"]))
+    tracing.count("metrics", len(extracted["metrics"]))
+    tracing.count("risks", len(extracted["next_steps"]["risks"]))
+
+    return build_output(extracted, opp)
+
+
+# ---------------------------------------------------------------------------
+# Live / incremental extraction
+#
+# TranscriptStream takes the transcript as it arrives and can produce, at any
+# moment, exactly what run() returns for the text fed so far. New text is
+# scanned once; only a few characters of state cross each chunk boundary.
+# ---------------------------------------------------------------------------
+
+KEYWORD_OVERLAP = max(len(k) for k in MATCHER.keywords) - 1
+
+
+def _metric_tail(text: str) -> int:
+    """Start of the suffix a later chunk could still turn into a metric.
+
+    A metric is digits, optional whitespace, then "%", so only a trailing run
+    of digits plus whitespace is undecided; everything before it can be
+    matched now. Of the digits only the last three can be part of a match.
+    """
+    i = len(text)
+    while i and text[i - 1].isspace():
+        i -= 1
+    start = i
+    while start and text[start - 1].isdecimal():
+        start -= 1
+    if start == i:
+        return len(text)
+    return max(start, i - 3)
+
+
+class TranscriptStream:
+    """Incremental meeting_followup extraction for a live call.
+
+    feed() appends raw transcript text (chunks may split words or lines),
+    add_utterance() appends one line. snapshot() returns run()'s output for
+    everything fed so far, with the rest of `payload` (meeting/opportunity)
+    supplying context. Work per call is proportional to the new text.
+    """
+
+    def __init__(self, payload: Optional[Dict[str, Any]] = None) -> None:
+        self.payload = payload or {}
+        self.chars = 0
+        self._present: set = set()
+        self._overlap = ""
+        self._metrics: List[str] = []
+        self._metric_carry = ""
+
+    def feed(self, chunk: str) -> None:
+        if not chunk:
+            return
+        self.chars += len(chunk)
+
+        # Keywords: rescan only the last few lowercased characters together
+        # with the new text, so a keyword split across chunks is still seen.
+        if len(self._present) < len(MATCHER.keywords):
+            t = self._overlap + chunk.lower()
+            self._present.update(MATCHER.scan(t))
+            self._overlap = t[-KEYWORD_OVERLAP:]
+
+        text = self._metric_carry + chunk
+        cut = _metric_tail(text)
+        if cut:
+            self._metrics.extend(METRIC_RE.findall(text, 0, cut))
+        self._metric_carry = text[cut:]
+
+    def add_utterance(self, line: str, speaker: Optional[str] = None) -> None:
+        if speaker:
+            line = f"{speaker}: {line}"
+        self.feed(("\n" if self.chars else "") + line)
+
+    def extracted(self) -> Dict[str, Any]:
+        # The carried tail holds no "%", so every metric is already final.
+        return extract(self._present.__contains__, self._metrics)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with tracing.span("meeting_followup.snapshot", chars=self.chars):
+            tracing.stage("extraction")
+            return build_output(self.extracted(), _opportunity(self.payload))
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple, Union
+
+from shared.observability import logging as tracing
+from shared.runtime.types import OpportunityBatch
+
+# Days in an early stage after which stage_age_risk fires.
+STAGE_AGE_DAYS = 45
 
 
 def _truthy(x: Any) -> bool:
@@ -10,7 +16,9 @@ def _truthy(x: Any) -> bool:
     return s in {"true", "yes", "y", "1"}
 
 
+@tracing.traced("pipeline_risk_inspector.run")
 def run(payload: Dict[str, Any]) -> Dict[str, Any]:
+    tracing.stage("normalize")
     opp = payload.get("opportunity", {}) or {}
 
     stage = (opp.get("stage") or "").strip().lower()
@@ -26,13 +34,14 @@ def run(payload: Dict[str, Any]) -> Dict[str, Any]:
     budget = (opp.get("budget_status") or opp.get("budget") or "").strip().lower()
 
     # Start higher so “some risk” deals clear 55 when they have a couple gaps
+    tracing.stage("scoring")
     risk_score = 50
     explanation: List[str] = []
     evidence: List[str] = []
     flags: List[str] = []
 
     # Heuristics
-    if stage in {"discovery", "scoping"} and age_days >= 45:
+    if stage in {"discovery", "scoping"} and age_days >= STAGE_AGE_DAYS:
         flags.append("stage_age_risk")
         risk_score += 10
         explanation.append("Deal is aging in an early stage.")
@@ -77,7 +86,9 @@ def run(payload: Dict[str, Any]) -> Dict[str, Any]:
 
     # Bound score
     risk_score = max(0, min(100, risk_score))
+    tracing.count("flags", len(flags))
 
+    tracing.stage("explanation")
     # GUARANTEE explanation length to satisfy eval thresholds
     # (Some eval cases expect 2+, most expect 3+)
     if len(explanation) < 3:
@@ -99,3 +110,183 @@ def run(payload: Dict[str, Any]) -> Dict[str, Any]:
         "summary": "Pipeline risk assessed using stage, aging, MEDDPICC gaps, and execution blockers.",
         "confidence": 0.84,
     }
+
+
+# ---------------------------------------------------------------------------
+# Batch / columnar mode
+#
+# Same heuristics as run(), applied column-at-a-time over a whole pipeline.
+# Output for row i is identical to run({"opportunity": opportunities[i]}).
+# ---------------------------------------------------------------------------
+
+EARLY_STAGES = {"discovery", "scoping"}
+APPROVED_BUDGETS = {"approved", "yes", "true"}
+
+SUMMARY = "Pipeline risk assessed using stage, aging, MEDDPICC gaps, and execution blockers."
+PAD_EXPLANATION = [
+    "Primary risk is forecast volatility from incomplete deal signals.",
+    "Next step is to close gaps in MEDDPICC fields and buyer process clarity.",
+]
+PAD_EVIDENCE = [
+    "evidence: validate CRM field completeness",
+    "evidence: confirm next milestone and owner",
+]
+
+
+def batch_columns(batch: OpportunityBatch) -> Dict[str, List[Any]]:
+    # The batch already resolved flat-vs-MEDDPICC fields and parsed the flags;
+    # only the per-agent normalization (case, whitespace) is left.
+    stage_memo: Dict[str, str] = {}
+    budget_memo: Dict[str, str] = {}
+    meddpicc = batch.meddpicc
+    return {
+        "stage": [stage_memo.get(s) or stage_memo.setdefault(s, s.strip().lower()) for s in batch.stage],
+        "amount": batch.amount,
+        "age_days": batch.age_days,
+        "champion": [c == 1 for c in batch.champion_confirmed],
+        "security": [s == 1 for s in batch.security_review],
+        "budget": [budget_memo.get(b) or budget_memo.setdefault(b, b.strip().lower()) for b in batch.budget_status],
+        "has_economic_buyer": [bool(x.strip()) for x in meddpicc["economic_buyer"]],
+        "has_paper_process": [bool(x.strip()) for x in meddpicc["paper_process"]],
+        "has_metrics": [bool(x.strip()) for x in meddpicc["metrics"]],
+    }
+
+
+def load_columns(opportunities: Union[List[Dict[str, Any]], OpportunityBatch]) -> Dict[str, List[Any]]:
+    if isinstance(opportunities, OpportunityBatch):
+        return batch_columns(opportunities)
+
+    stage: List[str] = []
+    amount: List[float] = []
+    age_days: List[int] = []
+    champion: List[bool] = []
+    security: List[bool] = []
+    budget: List[str] = []
+    has_economic_buyer: List[bool] = []
+    has_paper_process: List[bool] = []
+    has_metrics: List[bool] = []
+
+    for opp in opportunities:
+        opp = opp or {}
+        meddpicc = opp.get("meddpicc", {})
+        stage.append((opp.get("stage") or "").strip().lower())
+        amount.append(float(opp.get("amount") or 0))
+        age_days.append(int(opp.get("age_days") or 0))
+        champion.append(_truthy(opp.get("champion_confirmed")))
+        security.append(_truthy(opp.get("security_review")))
+        budget.append((opp.get("budget_status") or opp.get("budget") or "").strip().lower())
+        has_economic_buyer.append(bool((opp.get("economic_buyer") or meddpicc.get("economic_buyer") or "").strip()))
+        has_paper_process.append(bool((opp.get("paper_process") or meddpicc.get("paper_process") or "").strip()))
+        has_metrics.append(bool((opp.get("metrics") or meddpicc.get("metrics") or "").strip()))
+
+    return {
+        "stage": stage,
+        "amount": amount,
+        "age_days": age_days,
+        "champion": champion,
+        "security": security,
+        "budget": budget,
+        "has_economic_buyer": has_economic_buyer,
+        "has_paper_process": has_paper_process,
+        "has_metrics": has_metrics,
+    }
+
+
+RULES = [
+    # (flag, points, explanation) in the order run() applies them
+    ("stage_age_risk", 10, "Deal is aging in an early stage."),
+    ("no_champion", 10, "Large deal without a confirmed champion."),
+    ("security_gating", 8, "Security review is a gating item."),
+    ("budget_risk", 8, "Budget is not explicitly approved."),
+    ("missing_economic_buyer", 8, "Economic buyer not identified."),
+    ("missing_paper_process", 7, "Paper process is not captured."),
+    ("missing_metrics", 7, "No quantified success metrics captured."),
+]
+STATIC_EVIDENCE = {
+    2: "security_review=true",
+    4: "economic_buyer=missing",
+    5: "paper_process=missing",
+    6: "metrics=missing",
+}
+DYNAMIC_EVIDENCE = (0, 1, 3)
+
+
+def _pattern(bits: int) -> Tuple[float, List[str], List[str], List[Any]]:
+    fired = [k for k in range(len(RULES)) if bits >> k & 1]
+    flags = [RULES[k][0] for k in fired]
+    explanation = [RULES[k][2] for k in fired]
+    risk_score = 50 + sum(RULES[k][1] for k in fired)
+    if len(explanation) < 3:
+        explanation.extend(PAD_EXPLANATION[: 3 - len(explanation)])
+
+    # Evidence plan: static strings stay as-is, dynamic rule ids are filled per row.
+    plan: List[Any] = [k if k in DYNAMIC_EVIDENCE else STATIC_EVIDENCE[k] for k in fired]
+    if len(plan) < 2:
+        plan.extend(PAD_EVIDENCE[: 2 - len(plan)])
+
+    return float(max(0, min(100, risk_score))), flags, explanation[:6], plan[:6]
+
+
+def score_columns(cols: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    stage = cols["stage"]
+    amount = cols["amount"]
+    age_days = cols["age_days"]
+    champion = cols["champion"]
+    budget = cols["budget"]
+
+    # One boolean mask per rule, packed into a per-row bit pattern. There are
+    # at most 2**len(RULES) patterns, so flags/score/explanation are built once
+    # per pattern and only the value-bearing evidence strings are per-row.
+    masks = [
+        [s in EARLY_STAGES and a >= STAGE_AGE_DAYS for s, a in zip(stage, age_days)],
+        [amt >= 250_000 and not c for amt, c in zip(amount, champion)],
+        cols["security"],
+        [b not in APPROVED_BUDGETS for b in budget],
+        [not x for x in cols["has_economic_buyer"]],
+        [not x for x in cols["has_paper_process"]],
+        [not x for x in cols["has_metrics"]],
+    ]
+    patterns = [0] * len(stage)
+    for k, mask in enumerate(masks):
+        bit = 1 << k
+        patterns = [p | bit if m else p for p, m in zip(patterns, mask)]
+
+    # Value-bearing evidence strings, formatted only where the rule fired.
+    dynamic = {
+        0: [f"stage={s}, age_days={a}" if m else None for s, a, m in zip(stage, age_days, masks[0])],
+        1: [f"amount={amt}, champion_confirmed={c}" if m else None for amt, c, m in zip(amount, champion, masks[1])],
+        3: [f"budget_status={b or 'unknown'}" if m else None for b, m in zip(budget, masks[3])],
+    }
+
+    cache: Dict[int, Tuple[float, List[str], List[str], List[Any]]] = {}
+    results: List[Dict[str, Any]] = []
+    for i, bits in enumerate(patterns):
+        hit = cache.get(bits)
+        if hit is None:
+            hit = cache[bits] = _pattern(bits)
+        risk_score, flags, explanation, plan = hit
+
+        results.append(
+            {
+                "risk_score": risk_score,
+                "flags": flags[:],
+                "explanation": explanation[:],
+                "evidence": [dynamic[e][i] if e.__class__ is int else e for e in plan],
+                "summary": SUMMARY,
+                "confidence": 0.84,
+            }
+        )
+
+    return results
+
+
+@tracing.traced("pipeline_risk_inspector.run_batch")
+def run_batch(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    opportunities = payload.get("opportunities")
+    if opportunities is None:
+        opportunities = [payload.get("opportunity", {}) or {}]
+    tracing.count("opportunities", len(opportunities))
+    tracing.stage("normalize")
+    cols = load_columns(opportunities)
+    tracing.stage("scoring")
+    return score_columns(cols)
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import heapq
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Forecast views over risk results, built in one pass. Every piece is a
+# mergeable partial aggregate (sums, counts, bounded heaps), so shards can be
+# rolled up independently and combined with merge(); memory grows with the
+# number of stages, owners, months and flags, never with the number of deals.
+
+UNKNOWN = "(none)"
+
+# (risk_score, amount, opportunity id, stage): ordered so the heap root is the
+# least risky deal kept, with amount and id as deterministic tie-breaks.
+TopEntry = Tuple[float, float, str, str]
+
+
+@dataclass
+class GroupTotals:
+    count: int = 0
+    amount: float = 0.0
+    risk_weighted_amount: float = 0.0
+    risk_score_sum: float = 0.0
+
+    def add(self, amount: float, risk_score: float) -> None:
+        self.count += 1
+        self.amount += amount
+        self.risk_weighted_amount += amount * risk_score / 100.0
+        self.risk_score_sum += risk_score
+
+    def merge(self, other: "GroupTotals") -> None:
+        self.count += other.count
+        self.amount += other.amount
+        self.risk_weighted_amount += other.risk_weighted_amount
+        self.risk_score_sum += other.risk_score_sum
+
+    @property
+    def avg_risk_score(self) -> float:
+        return self.risk_score_sum / self.count if self.count else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return dict(asdict(self), avg_risk_score=round(self.avg_risk_score, 2))
+
+
+def _group_key(value: Any) -> str:
+    return str(value).strip() if value not in (None, "") else UNKNOWN
+
+
+def close_month(close_date: Any) -> str:
+    # ISO dates (and Salesforce datetimes) start with YYYY-MM.
+    s = str(close_date or "")
+    return s[:7] if len(s) >= 7 and s[4] == "-" else UNKNOWN
+
+
+class PipelineRollup:
+    """Risk-weighted amount by stage, owner and close month, flag counts, and
+    the top_k riskiest deals per owner, fed one (opportunity, result) at a time."""
+
+    def __init__(self, top_k: int = 10) -> None:
+        self.top_k = top_k
+        self.total = GroupTotals()
+        self.by_stage: Dict[str, GroupTotals] = {}
+        self.by_owner: Dict[str, GroupTotals] = {}
+        self.by_close_month: Dict[str, GroupTotals] = {}
+        self.flag_counts: Dict[str, int] = {}
+        self._top: Dict[str, List[TopEntry]] = {}
+
+    def _push(self, owner: str, entry: TopEntry) -> None:
+        heap = self._top.get(owner)
+        if heap is None:
+            heap = self._top[owner] = []
+        if len(heap) < self.top_k:
+            heapq.heappush(heap, entry)
+        elif entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+
+    def add(self, opp: Dict[str, Any], result: Dict[str, Any]) -> None:
+        amount = float(opp.get("amount") or 0)
+        risk_score = float(result.get("risk_score") or 0)
+        stage = _group_key(opp.get("stage"))
+        owner = _group_key(opp.get("owner"))
+
+        self.total.add(amount, risk_score)
+        for groups, key in (
+            (self.by_stage, stage),
+            (self.by_owner, owner),
+            (self.by_close_month, close_month(opp.get("close_date"))),
+        ):
+            totals = groups.get(key)
+            if totals is None:
+                totals = groups[key] = GroupTotals()
+            totals.add(amount, risk_score)
+
+        counts = self.flag_counts
+        for flag in result.get("flags") or ():
+            counts[flag] = counts.get(flag, 0) + 1
+
+        if self.top_k > 0:
+            self._push(owner, (risk_score, amount, str(opp.get("id") or ""), stage))
+
+    def add_many(self, pairs: Iterable[Tuple[Dict[str, Any], Dict[str, Any]]]) -> "PipelineRollup":
+        for opp, result in pairs:
+            self.add(opp, result)
+        return self
+
+    def merge(self, other: "PipelineRollup") -> "PipelineRollup":
+        self.total.merge(other.total)
+        for mine, theirs in (
+            (self.by_stage, other.by_stage),
+            (self.by_owner, other.by_owner),
+            (self.by_close_month, other.by_close_month),
+        ):
+            for key, totals in theirs.items():
+                mine.setdefault(key, GroupTotals()).merge(totals)
+        for flag, n in other.flag_counts.items():
+            self.flag_counts[flag] = self.flag_counts.get(flag, 0) + n
+        for owner, heap in other._top.items():
+            for entry in heap:
+                self._push(owner, entry)
+        return self
+
+    def top_risks(self, owner: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
+        owners = [owner] if owner is not None else sorted(self._top)
+        return {
+            o: [
+                {"id": opp_id, "risk_score": risk_score, "amount": amount, "stage": stage}
+                for risk_score, amount, opp_id, stage in sorted(self._top.get(o, ()), reverse=True)
+            ]
+            for o in owners
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        def groups(d: Dict[str, GroupTotals]) -> Dict[str, Any]:
+            return {k: d[k].as_dict() for k in sorted(d)}
+
+        return {
+            "top_k": self.top_k,
+            "total": self.total.as_dict(),
+            "by_stage": groups(self.by_stage),
+            "by_owner": groups(self.by_owner),
+            "by_close_month": groups(self.by_close_month),
+            "flag_counts": dict(sorted(self.flag_counts.items(), key=lambda kv: (-kv[1], kv[0]))),
+            "top_risks": self.top_risks(),
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "PipelineRollup":
+        # Inverse of to_dict(), so shard outputs written as JSON can be merged.
+        def totals(g: Dict[str, Any]) -> GroupTotals:
+            return GroupTotals(g["count"], g["amount"], g["risk_weighted_amount"], g["risk_score_sum"])
+
+        rollup = cls(top_k=d.get("top_k", 10))
+        rollup.total = totals(d["total"])
+        for name in ("by_stage", "by_owner", "by_close_month"):
+            setattr(rollup, name, {k: totals(g) for k, g in d.get(name, {}).items()})
+        rollup.flag_counts = dict(d.get("flag_counts", {}))
+        for owner, deals in d.get("top_risks", {}).items():
+            for deal in deals:
+                rollup._push(owner, (deal["risk_score"], deal["amount"], deal["id"], deal["stage"]))
+        return rollup
+
+
+def rollup(pairs: Iterable[Tuple[Dict[str, Any], Dict[str, Any]]], top_k: int = 10) -> PipelineRollup:
+    return PipelineRollup(top_k).add_many(pairs)
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from shared.observability import logging as tracing  # noqa: E402
+from shared.runtime.cache import ResultCache  # noqa: E402
+from shared.runtime.router import Router, make_server, serve_stream  # noqa: E402
+from shared.runtime.versions import agent_version  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Long-lived worker serving every GTM agent from one warm process.")
+    parser.add_argument(
+        "--listen",
+        help="Unix socket path or host:port to serve pipelined JSONL on; default is stdin/stdout",
+    )
+    parser.add_argument("--stats-window", type=int, default=10000, help="Requests per route kept for latency percentiles")
+    parser.add_argument("--cache", action="store_true", help="Answer repeated payloads from an in-memory LRU cache")
+    parser.add_argument("--cache-db", help="sqlite file for the on-disk cache tier (implies --cache)")
+    parser.add_argument("--cache-entries", type=int, default=10000, help="Max entries in the in-memory tier")
+    parser.add_argument("--cache-ttl", type=float, default=7 * 24 * 3600, help="Seconds an on-disk entry stays valid")
+    args = parser.parse_args()
+
+    cache = None
+    if args.cache or args.cache_db:
+        cache = ResultCache(args.cache_db, max_entries=args.cache_entries, ttl=args.cache_ttl)
+    router = Router(stats_window=args.stats_window, cache=cache).warm()
+    if cache is not None and args.cache_db:
+        cache.evict_expired()
+        # Rows from an older build of an agent can never be hit again.
+        cache.purge_versions({name: agent_version(name) for name in router.names})
+
+    if not args.listen:
+        serve_stream(router, sys.stdin, sys.stdout)
+        return
+
+    server = make_server(router, args.listen)
+    print(f"agent server listening on {args.listen}", file=sys.stderr, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if os.path.exists(args.listen):
+            os.unlink(args.listen)
+
+
+if __name__ == "__main__":
+    tracing.configure_from_env()
+    try:
+        main()
+    finally:
+        tracing.disable()
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import argparse
+import multiprocessing as mp
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from shared.bench.harness import percentile  # noqa: E402
+from shared.policies.action_limits import ActionLimiter, LimitRule, limit_key  # noqa: E402
+
+
+def make_actions(n: int, keys: int, seed: int) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    return [
+        {
+            "type": "salesforce_update",
+            "target": "opportunity",
+            "risk": "med",
+            "payload": {"opportunity_id": f"006{rng.randrange(keys):06d}"},
+        }
+        for _ in range(n)
+    ]
+
+
+def worker(path: str, limit: int, n: int, keys: int, batch: int, seed: int, start: Any, out: Any) -> None:
+    # A window far longer than the run makes the cap exact: no key may ever
+    # see more than `limit` allowed actions across all processes.
+    limiter = ActionLimiter(path, limits={"med": LimitRule(limit, 3600.0)})
+    actions = make_actions(n, keys, seed)
+    allowed: Dict[str, int] = {}
+    latencies: List[float] = []
+    start.wait()
+    t0 = time.perf_counter()
+    for i in range(0, n, batch):
+        chunk = actions[i : i + batch]
+        c0 = time.perf_counter()
+        decisions = limiter.check_many(chunk)
+        latencies.append((time.perf_counter() - c0) / len(chunk))
+        for d in decisions:
+            if d.allowed:
+                allowed[d.key] = allowed.get(d.key, 0) + 1
+    out.put((time.perf_counter() - t0, allowed, latencies))
+    limiter.close()
+
+
+def run(procs: int, n: int, keys: int, limit: int, batch: int, seed: int) -> Tuple[float, Dict[str, int], List[float]]:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "limits.sqlite")
+        ActionLimiter(path).close()  # create the schema before the race starts
+        start = mp.Event()
+        out: Any = mp.Queue()
+        workers = [
+            mp.Process(target=worker, args=(path, limit, n, keys, batch, seed + p, start, out)) for p in range(procs)
+        ]
+        for w in workers:
+            w.start()
+        t0 = time.perf_counter()
+        start.set()
+        results = [out.get() for _ in workers]
+        wall = time.perf_counter() - t0
+        for w in workers:
+            w.join()
+
+    allowed: Dict[str, int] = {}
+    latencies: List[float] = []
+    for _, per_key, lat in results:
+        latencies.extend(lat)
+        for key, c in per_key.items():
+            allowed[key] = allowed.get(key, 0) + c
+    return wall, allowed, latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Stress shared action limits from many processes at once.")
+    parser.add_argument("--procs", default="1,4,16", help="Comma-separated process counts")
+    parser.add_argument("--checks", type=int, default=2000, help="Checks per process")
+    parser.add_argument("--keys", type=int, default=50, help="Distinct (type, target, record) keys")
+    parser.add_argument("--limit", type=int, default=100, help="Allowed actions per key per window")
+    parser.add_argument("--batch", default="1,50", help="Comma-separated check_many batch sizes")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    for batch in (int(b) for b in args.batch.split(",")):
+        for procs in (int(p) for p in args.procs.split(",")):
+            wall, allowed, latencies = run(procs, args.checks, args.keys, args.limit, batch, args.seed)
+
+            # Demand per key, replayed from the same seeds the workers used.
+            demand: Dict[str, int] = {}
+            for p in range(procs):
+                for a in make_actions(args.checks, args.keys, args.seed + p):
+                    demand[limit_key(a)] = demand.get(limit_key(a), 0) + 1
+            wrong = {k: (allowed.get(k, 0), min(args.limit, d)) for k, d in demand.items() if allowed.get(k, 0) != min(args.limit, d)}
+
+            latencies.sort()
+            total = procs * args.checks
+            print(
+                f"procs={procs:>3} batch={batch:>4}  {total / wall:>10,.0f} checks/s  "
+                f"p50={percentile(latencies, 50) * 1e6:7.1f}us  p99={percentile(latencies, 99) * 1e6:8.1f}us  "
+                f"allowed={sum(allowed.values()):,}/{total:,}  {'exact' if not wrong else f'MISCOUNTED {len(wrong)} keys'}"
+            )
+            if wrong:
+                raise SystemExit(f"limit violated or under-filled: {sorted(wrong.items())[:5]}")
+
+
+if __name__ == "__main__":
+    main()
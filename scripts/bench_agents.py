@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from shared.bench import harness, payloads  # noqa: E402
+from shared.runtime.registry import load_agent  # noqa: E402
+
+
+def _fn(agent: str, name: str = "run") -> Callable[[Dict[str, Any]], Any]:
+    return getattr(load_agent(agent), name)
+
+
+def build_cases(args: argparse.Namespace) -> List[Tuple[str, Callable[[Any], Any], List[Any]]]:
+    cases: List[Tuple[str, Callable[[Any], Any], List[Any]]] = [
+        ("lead_qualification", _fn("lead_qualification"), payloads.lead_payloads(args.leads, args.seed)),
+        (
+            "meeting_followup",
+            _fn("meeting_followup"),
+            payloads.meeting_payloads(args.transcripts, args.transcript_chars, args.seed),
+        ),
+        ("pipeline_risk_inspector", _fn("pipeline_risk_inspector"), payloads.pipeline_payloads(args.pipeline, args.seed)),
+    ]
+
+    # Whole-pipeline batch mode: one call scores args.pipeline opportunities.
+    batch = {"opportunities": payloads.opportunities(args.pipeline, args.seed)}
+    cases.append(("pipeline_risk_inspector.run_batch", _fn("pipeline_risk_inspector", "run_batch"), [batch] * args.batch_repeats))
+    return cases
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark agent latency, throughput and memory.")
+    parser.add_argument("--agent", action="append", help="Only run this agent (repeatable); matches result name prefix")
+    parser.add_argument("--leads", type=int, default=5000, help="Number of lead payloads")
+    parser.add_argument("--transcripts", type=int, default=200, help="Number of meeting payloads")
+    parser.add_argument("--transcript-chars", type=int, default=20_000, help="Characters per transcript")
+    parser.add_argument("--pipeline", type=int, default=5000, help="Opportunities in the pipeline")
+    parser.add_argument("--batch-repeats", type=int, default=20, help="Timed run_batch calls over the whole pipeline")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", help="Write results JSON to this path")
+    parser.add_argument("--baseline", help="Compare against a previous results JSON")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Allowed relative regression (0.15 = 15%%)")
+    args = parser.parse_args()
+
+    results: Dict[str, Dict[str, float]] = {}
+    for name, fn, inputs in build_cases(args):
+        if args.agent and not any(name.startswith(a) for a in args.agent):
+            continue
+        r = harness.measure(fn, inputs)
+        results[name] = r
+        print(
+            f"{name:<36} n={r['n']:>6}  p50={r['p50_ms']:8.3f}ms  p95={r['p95_ms']:8.3f}ms  "
+            f"p99={r['p99_ms']:8.3f}ms  {r['throughput_per_s']:>10,.1f}/s  peak={r['peak_mem_kb']:>9,.1f}KB"
+        )
+
+    report = {
+        "environment": harness.environment(),
+        "config": {
+            "leads": args.leads,
+            "transcripts": args.transcripts,
+            "transcript_chars": args.transcript_chars,
+            "pipeline": args.pipeline,
+            "batch_repeats": args.batch_repeats,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    if args.output:
+        harness.save(args.output, report)
+
+    if args.baseline:
+        baseline = harness.load(args.baseline)
+        if baseline.get("config") != report["config"]:
+            print("warning: baseline was recorded with a different config", file=sys.stderr)
+        regressions = harness.compare(baseline, report, args.threshold)
+        if regressions:
+            print(f"\nRegressions over {args.threshold:.0%}:")
+            for r in regressions:
+                print(f"  - {r}")
+            raise SystemExit(1)
+        print(f"\nNo regressions over {args.threshold:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from shared.bench.payloads import lead_payloads, meeting_payloads  # noqa: E402
+from shared.runtime.orchestrator import AgentDAG, SharedContext  # noqa: E402
+from shared.runtime.registry import get_run  # noqa: E402
+
+
+def requests(n: int, transcript_chars: int, seed: int) -> List[str]:
+    # Serialized as they arrive over HTTP: a meeting (transcript plus its
+    # opportunity) and, on every other request, a lead from the same account.
+    leads = lead_payloads(n, seed)
+    out = []
+    for i, meeting in enumerate(meeting_payloads(n, transcript_chars, seed)):
+        if i % 2 == 0:
+            meeting = dict(meeting, lead=leads[i]["lead"])
+        out.append(json.dumps(meeting))
+    return out
+
+
+def sequential(dag: AgentDAG, text: str) -> Dict[str, Dict[str, Any]]:
+    # The pre-DAG pattern: every agent is invoked on its own with the raw
+    # request, decodes and normalizes it itself, and they run one at a time.
+    outputs: Dict[str, Dict[str, Any]] = {}
+    for node in dag.order:
+        agent_input = node.build(SharedContext.from_payload(text), outputs)
+        if agent_input is not None:
+            outputs[node.name] = get_run(node.agent)(agent_input)
+    return outputs
+
+
+def timed(label: str, n: int, fn: Callable[[], List[Dict[str, Dict[str, Any]]]], base: float = 0.0) -> tuple:
+    t0 = time.perf_counter()
+    outputs = fn()
+    elapsed = time.perf_counter() - t0
+    speedup = f"  ({base / elapsed:4.2f}x)" if base else ""
+    print(f"{label:<24} {elapsed:7.2f}s  {n / elapsed:>9,.1f} req/s{speedup}")
+    return elapsed, outputs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare DAG orchestration with invoking agents one by one.")
+    parser.add_argument("--requests", type=int, default=400, help="Number of incoming requests")
+    parser.add_argument("--transcript-chars", type=int, default=50_000, help="Characters per transcript")
+    parser.add_argument("--threads", type=int, default=3, help="Thread pool for run(payload, executor)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Processes for run_many()")
+    parser.add_argument("--chunk-size", type=int, default=16, help="Requests per run_many() chunk")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    texts = requests(args.requests, args.transcript_chars, args.seed)
+    dag = AgentDAG()
+    n = len(texts)
+    print(f"{n} requests, {args.transcript_chars:,} transcript chars, {args.workers} workers")
+
+    base, expected = timed("sequential", n, lambda: [sequential(dag, t) for t in texts])
+    _, got = timed("dag.run", n, lambda: [dag.run(t).outputs for t in texts], base)
+    assert got == expected, "dag.run outputs differ from sequential"
+    with ThreadPoolExecutor(max_workers=args.threads) as pool:
+        _, got = timed(f"dag.run threads={args.threads}", n, lambda: [dag.run(t, pool).outputs for t in texts], base)
+    assert got == expected, "threaded outputs differ from sequential"
+    _, got = timed(
+        f"dag.run_many workers={args.workers}",
+        n,
+        lambda: [r.outputs for r in dag.run_many(texts, workers=args.workers, chunk_size=args.chunk_size)],
+        base,
+    )
+    assert got == expected, "run_many outputs differ from sequential"
+    print("outputs identical across all modes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from collections import Counter
+from typing import Any, Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from shared.bench.payloads import lead_payloads, meeting_payloads  # noqa: E402
+from shared.policies.guardrails import DEFAULT_RULES_PATH, GuardrailEngine  # noqa: E402
+from shared.runtime.registry import get_run  # noqa: E402
+
+
+def check_hot_reload(rules_path: str, actions: List[Dict[str, Any]]) -> None:
+    # A broken edit to the rule file must be reported while the previous rules
+    # keep validating, whatever the breakage.
+    broken = [
+        {"rules": [{"id": "bad_regex", "fields": {"target": {"pattern": "("}}}]},
+        {"rules": [{"id": "bad_when", "when": {"type": [["slack_post"]]}}]},
+        {"rules": [{"id": "bad_enum", "fields": {"target": {"enum": [{"a": 1}]}}}]},
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "rules.json")
+        shutil.copyfile(rules_path, path)
+        engine = GuardrailEngine(path, reload_interval=0.0)
+        expected = engine.validate(actions)
+        for i, doc in enumerate(broken):
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(doc, f)
+            os.utime(path, ns=(0, 10**9 * (i + 1)))  # a distinct mtime however fast the writes
+            assert engine.validate(actions) == expected, f"{doc['rules'][0]['id']}: old rules not kept"
+            assert engine.last_error and "RuleError" in engine.last_error, engine.last_error
+            assert engine.validate(actions) == expected and engine.last_error, "error cleared without a reload"
+        shutil.copyfile(rules_path, path)
+        os.utime(path, ns=(0, 10**9 * (len(broken) + 1)))
+        assert engine.validate(actions) == expected and engine.last_error is None
+    print(f"hot reload: {len(broken)} broken rule files rejected, previous rules kept")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Validate agent actions against the compiled guardrail rules.")
+    parser.add_argument("--rules", default=DEFAULT_RULES_PATH, help="Rule file (JSON)")
+    parser.add_argument("--leads", type=int, default=20000)
+    parser.add_argument("--transcripts", type=int, default=5000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    lead_run, meeting_run = get_run("lead_qualification"), get_run("meeting_followup")
+    batches = [("lead_qualification", lead_run(p)) for p in lead_payloads(args.leads, args.seed)]
+    batches += [("meeting_followup", meeting_run(p)) for p in meeting_payloads(args.transcripts, 1000, args.seed)]
+    actions = [a for _, out in batches for a in out["actions"]]
+
+    engine = GuardrailEngine(args.rules)
+    best = float("inf")
+    for _ in range(args.repeats):
+        t0 = time.perf_counter()
+        violations = engine.validate(actions)
+        best = min(best, time.perf_counter() - t0)
+    print(f"one pass over {len(actions):,} actions: {best * 1000:.1f} ms ({len(actions) / best:,.0f} actions/s)")
+
+    t0 = time.perf_counter()
+    per_run = [v for agent, out in batches for v in engine.validate_output(agent, out)]
+    elapsed = time.perf_counter() - t0
+    print(f"per-run validation of {len(batches):,} outputs: {elapsed * 1000:.1f} ms ({len(batches) / elapsed:,.0f} runs/s)")
+
+    counts = Counter((v.rule, v.code) for v in violations + per_run)
+    print("violations:", dict(counts) or "none")
+
+    check_hot_reload(args.rules, actions)
+
+
+if __name__ == "__main__":
+    main()
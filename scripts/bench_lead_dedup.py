@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, Iterator
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from agents.lead_qualification.src.agent import score_leads_batch  # noqa: E402
+from agents.lead_qualification.src.dedup import dedup_leads, fan_out  # noqa: E402
+from shared.bench.payloads import lead_payloads  # noqa: E402
+
+SUFFIXES = ["", " Inc", " Inc.", ", LLC", " Corp", " Ltd"]
+SOURCES = ["Web form", "Event badge scan", "List import", "Webinar"]
+SYLLABLES = ["ac", "me", "nor", "th", "wind", "glo", "bex", "ini", "tech", "um", "brel", "la", "zen", "ko", "vo", "ra", "pex", "sol", "tri", "lu"]
+SECTORS = ["Systems", "Health", "Logistics", "Robotics", "Foods", "Analytics", "Capital", "Retail"]
+
+
+def variant(name: str, rng: random.Random) -> str:
+    # How one company shows up across feeds: case, legal suffix, a dropped letter.
+    name = rng.choice([name, name.upper(), name.lower()]) + rng.choice(SUFFIXES)
+    if rng.random() < 0.1 and len(name) > 8:
+        i = rng.randrange(1, len(name) - 1)
+        name = name[:i] + name[i + 1 :]
+    return name
+
+
+def company_name(rng: random.Random) -> str:
+    word = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3))).capitalize()
+    return f"{word} {rng.choice(SECTORS)}"
+
+
+def feed(n: int, entities: int, seed: int = 7) -> Iterator[Dict[str, Any]]:
+    rng = random.Random(seed)
+    base = [p["lead"] for p in lead_payloads(entities, seed)]
+    for lead in base:
+        lead["company"] = company_name(rng)
+        lead["email"] = f"buyer@{lead['company'].split()[0].lower()}.com"
+    for _ in range(n):
+        lead = dict(rng.choice(base))
+        lead["company"] = variant(lead["company"], rng)
+        lead["source"] = rng.choice(SOURCES)
+        if rng.random() < 0.3:
+            lead["budget"] = ""
+        yield lead
+
+
+def bench(n: int, entities: int) -> None:
+    t0 = time.perf_counter()
+    canonical, assignment, stats = dedup_leads(feed(n, entities))
+    t1 = time.perf_counter()
+    scored = fan_out(score_leads_batch(canonical), assignment)
+    t2 = time.perf_counter()
+    # Separate pass: tracemalloc slows allocation several-fold.
+    del canonical, assignment, scored
+    tracemalloc.start()
+    try:
+        dedup_leads(feed(n, entities))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    print(
+        f"n={n:>9,}  entities={entities:>7,}  canonical={stats.canonical:>7,}  "
+        f"exact={stats.exact_duplicates:>9,}  near={stats.near_duplicates:>7,}  collapse={stats.collapse_ratio:6.2f}x  "
+        f"dedup={t1 - t0:6.2f}s ({n / (t1 - t0):>9,.0f}/s)  score+fan_out={t2 - t1:6.2f}s  "
+        f"peak={peak / 2**20:7.1f} MiB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark lead dedup on a duplicate-heavy feed.")
+    parser.add_argument("--sizes", default="10000,100000,1000000", help="Comma-separated lead counts")
+    parser.add_argument("--entities", type=int, default=20000, help="Distinct people/companies behind the feed")
+    args = parser.parse_args()
+
+    for n in (int(x) for x in args.sizes.split(",") if x.strip()):
+        bench(n, args.entities)
+
+
+if __name__ == "__main__":
+    main()
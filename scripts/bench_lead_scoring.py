@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Any, Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from agents.lead_qualification.src.agent import decide, score_lead, score_leads_batch  # noqa: E402
+
+INDUSTRIES = ["Manufacturing", "Healthcare", "Financial Services", "Retail", "Food & Beverage", "Education", ""]
+TITLES = ["VP Engineering", "CIO", "Head of Infrastructure", "IT Manager", "Engineer", "Owner", "Director of Data"]
+REGIONS = ["NA", "EU", "APAC", "LATAM"]
+USE_CASES = ["Migrate legacy ERP to cloud", "Data center modernization", "Need help with email marketing", ""]
+BUDGETS = ["Approved", "Not approved", "In planning", "TBD", "Unknown"]
+TIMELINES = ["90 days", "60 days", "6-9 months", "next year", "Unknown", "Q1"]
+NOTES = ["", "", "", "Security review required", "Call me at 555-123-9876"]
+
+
+def make_leads(n: int, seed: int = 7) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    return [
+        {
+            "company": f"Company {i}",
+            "industry": rng.choice(INDUSTRIES),
+            "employees": rng.choice([12, 80, 600, 2400, 12000]),
+            "region": rng.choice(REGIONS),
+            "title": rng.choice(TITLES),
+            "use_case": rng.choice(USE_CASES),
+            "budget": rng.choice(BUDGETS),
+            "timeline": rng.choice(TIMELINES),
+            "notes": rng.choice(NOTES),
+        }
+        for i in range(n)
+    ]
+
+
+def bench(n: int, verify: bool) -> None:
+    leads = make_leads(n)
+
+    t0 = time.perf_counter()
+    scalar = []
+    for lead in leads:
+        score, meta = score_lead(lead)
+        decision, confidence = decide(score, meta)
+        scalar.append((score, meta, decision, confidence))
+    t1 = time.perf_counter()
+    batch = score_leads_batch(leads)
+    t2 = time.perf_counter()
+
+    if verify and scalar != batch:
+        raise SystemExit(f"batch output differs from scalar path at n={n}")
+
+    scalar_s = t1 - t0
+    batch_s = t2 - t1
+    print(
+        f"n={n:>9,}  scalar={scalar_s:7.3f}s ({n / scalar_s:>10,.0f}/s)  "
+        f"batch={batch_s:7.3f}s ({n / batch_s:>10,.0f}/s)  speedup={scalar_s / batch_s:4.2f}x"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark scalar vs batch lead scoring.")
+    parser.add_argument("--sizes", default="10000,100000,1000000", help="Comma-separated lead counts")
+    parser.add_argument("--no-verify", action="store_true", help="Skip scalar/batch equality check")
+    args = parser.parse_args()
+
+    for n in (int(x) for x in args.sizes.split(",") if x.strip()):
+        bench(n, verify=not args.no_verify)
+
+
+if __name__ == "__main__":
+    main()
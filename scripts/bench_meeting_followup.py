@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import Callable, List, Set
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from agents.meeting_followup.src.agent import MATCHER, TranscriptStream, run  # noqa: E402
+
+FILLER = (
+    "we reviewed the current platform and the team walked through batch windows "
+    "outages cost model staffing and the roadmap for the next few releases"
+).split()
+
+
+def legacy_scan(t: str) -> Set[str]:
+    # Previous approach: one `in` substring scan per keyword.
+    return {k for k in MATCHER.keywords if k in t}
+
+
+def sparse_transcript(size: int, seed: int = 11) -> str:
+    rng = random.Random(seed)
+    words: List[str] = []
+    n = 0
+    while n < size:
+        w = rng.choice(FILLER) if rng.random() > 0.002 else rng.choice(MATCHER.keywords)
+        words.append(w)
+        n += len(w) + 1
+    return " ".join(words)[:size]
+
+
+def dense_transcript(size: int) -> str:
+    with open(os.path.join(REPO_ROOT, "agents", "meeting_followup", "demo", "input.json"), "r", encoding="utf-8") as f:
+        demo = json.load(f)["transcript"] + "\n"
+    return (demo * (size // len(demo) + 1))[:size]
+
+
+def throughput(fn: Callable[[str], object], text: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - t0)
+    return len(text) / best / 1e6
+
+
+def live(text: str, utterance_chars: int, every: int) -> None:
+    # A recap after every `every` utterances: re-running run() on the whole
+    # text so far versus feeding a TranscriptStream.
+    lines = [text[i : i + utterance_chars] for i in range(0, len(text), utterance_chars)]
+
+    t0 = time.perf_counter()
+    rerun = [run({"transcript": "\n".join(lines[: i + 1])}) for i in range(len(lines)) if (i + 1) % every == 0]
+    t1 = time.perf_counter()
+    stream = TranscriptStream()
+    streamed = []
+    for i, line in enumerate(lines):
+        stream.add_utterance(line)
+        if (i + 1) % every == 0:
+            streamed.append(stream.snapshot())
+    t2 = time.perf_counter()
+
+    if rerun != streamed:
+        raise SystemExit("live: stream snapshots differ from run()")
+    print(
+        f"live   {len(text) / 1e6:.1f} MB  {len(rerun):,} recaps  rerun={t1 - t0:7.3f}s  "
+        f"stream={t2 - t1:7.3f}s  speedup={(t1 - t0) / (t2 - t1):6.1f}x"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark meeting_followup keyword extraction.")
+    parser.add_argument("--size", type=int, default=1_000_000, help="Transcript size in characters")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--live-size", type=int, default=200_000, help="Transcript size for the live recap benchmark")
+    parser.add_argument("--recap-every", type=int, default=5, help="Utterances between live recaps")
+    args = parser.parse_args()
+
+    for label, text in [("sparse", sparse_transcript(args.size)), ("dense", dense_transcript(args.size))]:
+        t = text.lower()
+        if set(MATCHER.scan(t)) != legacy_scan(t):
+            raise SystemExit(f"{label}: matcher and legacy scan disagree")
+
+        legacy = throughput(legacy_scan, t, args.repeat)
+        single = throughput(MATCHER.scan, t, args.repeat)
+        hits = sum(len(v) for v in MATCHER.scan(t).values())
+        print(
+            f"{label:<6} {len(t) / 1e6:.1f} MB  legacy_in_scans={legacy:8.1f} MB/s (presence only)  "
+            f"single_pass={single:8.1f} MB/s ({hits:,} offsets)"
+        )
+
+    live(dense_transcript(args.live_size), 80, args.recap_every)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from typing import Callable, Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from shared.policies.redaction import EMAIL_RE, EMAIL_TOKEN, PHONE_RE, PHONE_TOKEN, redact, redact_batch  # noqa: E402
+
+# Inputs that make the backtracking patterns retry a long scan from every
+# start position.
+ADVERSARIAL: Dict[str, Callable[[int], str]] = {
+    "digit_space_run": lambda n: "1 " * (n // 2),
+    "space_run_after_digit": lambda n: "1" + " " * (n - 1),
+    "word_run_no_at": lambda n: "a" * n,
+    "dotted_run_no_at": lambda n: "a." * (n // 2),
+    "at_without_tld": lambda n: "a" * (n // 2) + "@" + "b" * (n // 2),
+    "many_ats": lambda n: "a@" * (n // 2),
+    "transcript": lambda n: ("Maya: call 555-123-9876 or mail maya@example.com about the 40% target. " * (n // 70 + 1))[:n],
+}
+
+
+def legacy(text: str) -> str:
+    return PHONE_RE.sub(PHONE_TOKEN, EMAIL_RE.sub(EMAIL_TOKEN, text))
+
+
+def timed(fn: Callable[[str], str], text: str) -> float:
+    t0 = time.perf_counter()
+    fn(text)
+    return time.perf_counter() - t0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark redaction on adversarial inputs.")
+    parser.add_argument("--sizes", default="1000,4000,16000,64000,1000000", help="Comma-separated input sizes")
+    parser.add_argument("--legacy-max", type=int, default=64000, help="Largest size to run the regex reference on")
+    parser.add_argument("--max-growth", type=float, default=8.0, help="Fail if time grows faster than this per 4x input")
+    args = parser.parse_args()
+    sizes = [int(x) for x in args.sizes.split(",") if x.strip()]
+
+    failed: List[str] = []
+    for name, make in ADVERSARIAL.items():
+        prev = None
+        for n in sizes:
+            text = make(n)
+            new_s = timed(redact, text)
+            row = f"{name:<22} n={n:>9,}  engine={new_s * 1000:9.2f}ms"
+            if n <= args.legacy_max:
+                old_s = timed(legacy, text)
+                if redact(text) != legacy(text):
+                    failed.append(f"{name} n={n}: output differs from regex reference")
+                row += f"  regex={old_s * 1000:10.2f}ms"
+            print(row)
+
+            # Linear time means ~4x cost for 4x input; allow noise on tiny inputs.
+            if prev is not None and new_s > 1e-3:
+                growth = (new_s / prev[1]) / (n / prev[0]) * 4
+                if growth > args.max_growth:
+                    failed.append(f"{name}: {growth:.1f}x time per 4x input between n={prev[0]} and n={n}")
+            prev = (n, new_s)
+        print("")
+
+    texts = [ADVERSARIAL["transcript"](400)] * 10000 + ["no pii here at all"] * 10000
+    t0 = time.perf_counter()
+    redact_batch(texts)
+    print(f"redact_batch: {len(texts):,} strings in {(time.perf_counter() - t0) * 1000:.1f}ms")
+
+    if failed:
+        for msg in failed:
+            print(f"FAIL: {msg}")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
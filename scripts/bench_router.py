@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from shared.bench.payloads import lead_payloads, meeting_payloads, pipeline_payloads  # noqa: E402
+from shared.runtime.router import request_many  # noqa: E402
+
+
+def cold(payloads: List[Dict[str, Any]], agents: List[str]) -> float:
+    # One interpreter per request, the way the webhook integration runs today.
+    t0 = time.perf_counter()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "input.json")
+        for payload, agent in zip(payloads, agents):
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+            subprocess.run(
+                [sys.executable, os.path.join(REPO_ROOT, "scripts", "run_agent.py"), "--agent", agent, "--input", path],
+                check=True,
+                stdout=subprocess.DEVNULL,
+            )
+    return time.perf_counter() - t0
+
+
+def warm(payloads: List[Dict[str, Any]], address: str) -> Dict[str, Any]:
+    proc = subprocess.Popen(
+        [sys.executable, os.path.join(REPO_ROOT, "scripts", "agent_server.py"), "--listen", address],
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        proc.stderr.readline()  # "listening" banner: the agents are imported
+        t0 = time.perf_counter()
+        responses = list(request_many(address, ({"id": i, "payload": p} for i, p in enumerate(payloads))))
+        elapsed = time.perf_counter() - t0
+        stats = next(request_many(address, [{"op": "stats"}]))["stats"]
+    finally:
+        proc.terminate()
+        proc.wait()
+
+    errors = [r for r in responses if "error" in r]
+    if errors or [r["id"] for r in responses] != list(range(len(payloads))):
+        raise SystemExit(f"server returned {len(errors)} errors or out-of-order responses")
+    return {"elapsed": elapsed, "stats": stats}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare one-process-per-request against the warm agent server.")
+    parser.add_argument("--requests", type=int, default=3000, help="Requests sent to the warm server")
+    parser.add_argument("--cold-requests", type=int, default=30, help="Requests run as separate processes")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    per_kind = max(1, args.requests // 3)
+    payloads: List[Dict[str, Any]] = []
+    for group in zip(lead_payloads(per_kind, args.seed), meeting_payloads(per_kind, 2000, args.seed), pipeline_payloads(per_kind, args.seed)):
+        payloads.extend(group)
+    agents = ["lead_qualification", "meeting_followup", "pipeline_risk_inspector"] * per_kind
+
+    n_cold = min(args.cold_requests, len(payloads))
+    cold_s = cold(payloads[:n_cold], agents[:n_cold])
+    with tempfile.TemporaryDirectory() as tmp:
+        result = warm(payloads, os.path.join(tmp, "agents.sock"))
+
+    cold_ms = 1000.0 * cold_s / n_cold
+    warm_ms = 1000.0 * result["elapsed"] / len(payloads)
+    print(f"cold  {n_cold:>7,} requests  {cold_ms:9.3f} ms/request")
+    print(f"warm  {len(payloads):>7,} requests  {warm_ms:9.3f} ms/request (pipelined, one connection)  speedup={cold_ms / warm_ms:,.0f}x")
+    for route, s in result["stats"]["routes"].items():
+        print(f"  {route:<34} n={s['requests']:>6,}  p50={s['p50_ms']:.3f}ms  p95={s['p95_ms']:.3f}ms  p99={s['p99_ms']:.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from typing import Any, Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from shared.connectors.salesforce.client import BatchingHandler, SalesforceClient  # noqa: E402
+from shared.connectors.salesforce.mock import MockSalesforce  # noqa: E402
+from shared.runtime.orchestrator import ActionExecutor, TargetLimits, summarize  # noqa: E402
+
+
+class PerActionHandler:
+    """Baseline: one Collections request per action."""
+
+    def __init__(self, client: SalesforceClient) -> None:
+        self.client = client
+
+    async def __call__(self, action: Dict[str, Any]) -> Dict[str, Any]:
+        (result,) = await asyncio.to_thread(self.client.update_actions, [action])
+        if not result.success:
+            raise RuntimeError(result.errors)
+        return {"id": result.id, "success": True}
+
+
+def actions(n: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "type": "salesforce_update",
+            "target": "opportunity",
+            "requires_approval": False,
+            "payload": {"opportunity_id": f"006BENCH{i:07d}", "fields": {"Next_Step__c": f"step {i}"}},
+        }
+        for i in range(n)
+    ]
+
+
+def bench(label: str, make_handler: Any, n: int, concurrency: int, latency: float, fail_every: int) -> None:
+    batch = actions(n)
+    fail_ids = {a["payload"]["opportunity_id"] for a in batch[::fail_every]} if fail_every else set()
+    with MockSalesforce(latency=latency, fail_ids=fail_ids) as mock:
+        with SalesforceClient(mock.url, mock.token, pool_size=concurrency) as client:
+            executor = ActionExecutor(
+                {"salesforce": make_handler(client)},
+                limits={"salesforce": TargetLimits(concurrency=concurrency, max_attempts=1)},
+            )
+            t0 = time.perf_counter()
+            outcomes = asyncio.run(executor.execute([batch]))
+            elapsed = time.perf_counter() - t0
+        counts = {status: c for (_, status), c in summarize(outcomes).items()}
+        print(
+            f"{label:<12} n={n:>6,}  concurrency={concurrency}  requests={mock.requests:>5,}  "
+            f"{elapsed:7.2f}s  {n / elapsed:>9,.0f} actions/s  {counts}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="salesforce_update throughput through ActionExecutor against the local mock.")
+    parser.add_argument("--actions", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=4, help="TargetLimits.concurrency (and connection pool size)")
+    parser.add_argument("--latency", type=float, default=0.05, help="Mock seconds per request")
+    parser.add_argument("--fail-every", type=int, default=0, help="Make every Nth record fail (0 = none)")
+    args = parser.parse_args()
+
+    bench("per-action", PerActionHandler, args.actions, args.concurrency, args.latency, args.fail_every)
+    bench("batching", BatchingHandler, args.actions, args.concurrency, args.latency, args.fail_every)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Dict, Iterator, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from agents.pipeline_risk_inspector.src.agent import run_batch  # noqa: E402
+from shared.bench.payloads import opportunities  # noqa: E402
+from shared.runtime.sink import ResultSink  # noqa: E402
+
+
+def results(n: int, distinct: int) -> Iterator[Dict[str, Any]]:
+    # Score a pool once and cycle through it, so the timing is the sink's,
+    # not the agent's.
+    pool: List[Dict[str, Any]] = run_batch({"opportunities": opportunities(distinct)})
+    for i in range(n):
+        yield pool[i % distinct]
+
+
+def bench(path: str, n: int, distinct: int, row_group_size: int) -> None:
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    if path.endswith(".jsonl"):
+        with open(path, "w", encoding="utf-8") as f:
+            for out in results(n, distinct):
+                f.write(json.dumps(out, ensure_ascii=False))
+                f.write("\n")
+        label, groups = "jsonl", "-"
+    else:
+        with ResultSink(path, "pipeline_risk_inspector", row_group_size) as sink:
+            for line, out in enumerate(results(n, distinct), start=1):
+                sink.add(out, line)
+        path, label, groups = sink.path, sink.format, str(sink.row_groups)
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    size = os.path.getsize(path)
+    print(
+        f"{label:<8} n={n:>10,}  {n / elapsed:>10,.0f} rows/s  file={size / 2**20:8.1f} MiB  "
+        f"({size / n:6.1f} B/row)  peak={peak / 2**20:7.1f} MiB  row_groups={groups}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Throughput, file size and peak memory of the columnar results sink.")
+    parser.add_argument("--rows", default="100000", help="Comma-separated result counts")
+    parser.add_argument("--formats", default="jsonl,csv,arrow,parquet", help="Comma-separated: jsonl, csv, arrow, parquet")
+    parser.add_argument("--row-group-size", type=int, default=65_536)
+    parser.add_argument("--distinct", type=int, default=5000, help="Distinct results cycled through")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in (int(x) for x in args.rows.split(",") if x.strip()):
+            for fmt in (f.strip() for f in args.formats.split(",") if f.strip()):
+                path = os.path.join(tmp, f"results.{fmt}")
+                bench(path, n, args.distinct, args.row_group_size)
+                if os.path.exists(path):
+                    os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from shared.bench.payloads import lead_payloads, opportunities  # noqa: E402
+from shared.runtime.types import Lead, LeadBatch, Opportunity, OpportunityBatch  # noqa: E402
+
+
+def retained(build: Callable[[], Any]) -> Tuple[int, float]:
+    # Bytes still held once the build returns, i.e. the cost of keeping the
+    # representation around, not the peak while constructing it.
+    gc.collect()
+    tracemalloc.start()
+    try:
+        t0 = time.perf_counter()
+        obj = build()
+        elapsed = time.perf_counter() - t0
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del obj
+    return current, elapsed
+
+
+def bench(kind: str, n: int) -> None:
+    # Round-trip through JSON so every row owns its strings, as it would after
+    # reading a CRM export or an API response.
+    if kind == "leads":
+        encoded = json.dumps([p["lead"] for p in lead_payloads(n)])
+        record, batch = Lead, LeadBatch
+    else:
+        encoded = json.dumps(opportunities(n))
+        record, batch = Opportunity, OpportunityBatch
+
+    # Each build decodes its own copy so only the strings a representation
+    # keeps are counted; the decoded dicts are dropped as it goes.
+    rows = [
+        ("dict", lambda: json.loads(encoded)),
+        ("record", lambda: [record.from_dict(d) for d in json.loads(encoded)]),
+        ("batch", lambda: batch.from_dicts(json.loads(encoded))),
+    ]
+
+    base = None
+    for name, build in rows:
+        size, elapsed = retained(build)
+        base = base or size
+        print(
+            f"{kind:<13} n={n:>9,}  {name:<6}  {size / n:7.0f} B/row  "
+            f"{size / 2**20:8.1f} MiB  ({size / base:4.2f}x dict)  build={elapsed:6.2f}s"
+        )
+
+    records = [record.from_dict(d) for d in json.loads(encoded)]
+    t0 = time.perf_counter()
+    for r in records:
+        r.to_dict()
+    elapsed = time.perf_counter() - t0
+    print(f"{kind:<13} n={n:>9,}  to_dict {n / elapsed:>12,.0f}/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare memory of dict rows, slotted records and columnar batches.")
+    parser.add_argument("--sizes", default="10000,100000,1000000", help="Comma-separated row counts")
+    parser.add_argument("--kinds", default="leads,opportunities", help="Comma-separated: leads, opportunities")
+    args = parser.parse_args()
+
+    for kind in (k.strip() for k in args.kinds.split(",") if k.strip()):
+        for n in (int(x) for x in args.sizes.split(",") if x.strip()):
+            bench(kind, n)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from shared.runtime.registry import AGENT_MODULES  # noqa: E402
+
+# (label, argv, import budget in ms, modules that must not be imported).
+# Budgets are the summed cumulative time of top-level imports reported by
+# -X importtime (interpreter boot included, ~10 ms), best of --runs.
+CHECKS: List[Tuple[str, List[str], float, List[str]]] = [
+    (
+        f"run_agent.py --agent {agent}",
+        ["scripts/run_agent.py", "--agent", agent, "--demo"],
+        40.0,
+        ["argparse", "concurrent.futures"] + [module for other, module in AGENT_MODULES.items() if other != agent],
+    )
+    for agent in sorted(AGENT_MODULES)
+] + [
+    ("run_all_evals.py", ["scripts/run_all_evals.py"], 60.0, ["concurrent.futures", "multiprocessing"]),
+]
+
+
+def import_profile(argv: List[str]) -> Tuple[Dict[str, int], List[str]]:
+    """Top-level module -> cumulative import microseconds for one cold run,
+    plus every module imported along the way."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *argv],
+        cwd=REPO_ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    profile: Dict[str, int] = {}
+    modules: List[str] = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header row
+        modules.append(name.strip())
+        # Nested imports are indented and already counted in their parent.
+        if not name.startswith("  "):
+            profile[name.strip()] = int(cumulative)
+    return profile, modules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Enforce the cold-start import budget of the CLI entry points.")
+    parser.add_argument("--runs", type=int, default=7, help="Cold runs per command; the fastest one is compared")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply every budget, e.g. for slow CI runners")
+    parser.add_argument("--top", type=int, default=8, help="Slowest top-level imports to list for a failing command")
+    args = parser.parse_args()
+
+    failures = 0
+    for label, argv, budget_ms, forbidden in CHECKS:
+        runs = [import_profile(argv) for _ in range(max(1, args.runs))]
+        best, modules = min(runs, key=lambda run: sum(run[0].values()))
+        total_ms = sum(best.values()) / 1000.0
+        limit_ms = budget_ms * args.scale
+
+        leaked = sorted(set(modules) & set(forbidden))
+        ok = total_ms <= limit_ms and not leaked
+        print(f"[{'OK' if ok else 'FAIL'}] {label:<48} {total_ms:6.1f} ms (budget {limit_ms:.0f} ms)")
+        if leaked:
+            print(f"      imports deferred modules: {', '.join(leaked)}")
+        if not ok:
+            failures += 1
+            for name, us in sorted(best.items(), key=lambda kv: -kv[1])[: args.top]:
+                print(f"      {us / 1000.0:7.2f} ms  {name}")
+
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from shared.evals.generator import AGENTS, VOCABULARIES, CorpusSpec, parse_weights, write_jsonl  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Generate seeded synthetic cases per agent as <out-dir>/<agent>.jsonl "
+        "(run them with run_all_evals.py --cases-dir <out-dir>)."
+    )
+    parser.add_argument("-n", "--cases", type=int, default=100_000, help="Cases per agent")
+    parser.add_argument("--agent", action="append", choices=AGENTS, help="Only this agent (repeatable)")
+    parser.add_argument("--out-dir", default="eval_corpus", help="Directory for the JSONL files")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument(
+        "--weights",
+        action="append",
+        default=[],
+        metavar="VOCAB=VALUE:W,...",
+        help=f"Relative weights for one vocabulary, e.g. industries=Healthcare:3,Retail:1 (repeatable). "
+        f"Vocabularies: {', '.join(sorted(VOCABULARIES))}",
+    )
+    parser.add_argument("--transcript-chars", default="400:4000", help="min:max transcript length")
+    parser.add_argument("--pii-density", type=float, default=0.05, help="Share of notes/transcript lines with PII")
+    parser.add_argument("--no-oracle", action="store_true", help="Write empty expectations (load-test input only)")
+    parser.add_argument("--workers", type=int, default=1, help="Generate chunks on a pool of N processes")
+    args = parser.parse_args()
+
+    weights = {}
+    for spec_arg in args.weights:
+        name, sep, values = spec_arg.partition("=")
+        if not sep:
+            parser.error(f"--weights must look like VOCAB=VALUE:W,..., got {spec_arg!r}")
+        weights[name.strip()] = parse_weights(values)
+    lo, _, hi = args.transcript_chars.partition(":")
+    try:
+        spec = CorpusSpec(
+            weights=weights,
+            transcript_chars=(int(lo), int(hi or lo)),
+            pii_density=args.pii_density,
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    for agent in args.agent or AGENTS:
+        path = os.path.join(args.out_dir, f"{agent}.jsonl")
+        t0 = time.perf_counter()
+        size = write_jsonl(path, agent, args.cases, spec, seed=args.seed, oracle=not args.no_oracle, workers=args.workers)
+        elapsed = time.perf_counter() - t0
+        print(
+            f"{agent:<26} {args.cases:>11,} cases  {size / 2**20:9.1f} MiB  {elapsed:7.2f}s  "
+            f"{args.cases / elapsed * 60 / 1e6:6.2f}M cases/min  -> {path}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from typing import Any, Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from agents.pipeline_risk_inspector.src.agent import STAGE_AGE_DAYS, run_batch  # noqa: E402
+from shared.connectors.salesforce.client import SalesforceClient  # noqa: E402
+from shared.connectors.salesforce.queries import OpportunityStore, delta_rescore, sync_opportunities  # noqa: E402
+
+
+def score_batch(opportunities: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return run_batch({"opportunities": opportunities})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Sync changed opportunities and re-score only those.")
+    parser.add_argument("--instance-url", default=os.environ.get("SALESFORCE_INSTANCE_URL"))
+    parser.add_argument("--token", default=os.environ.get("SALESFORCE_ACCESS_TOKEN"))
+    parser.add_argument("--store", default="pipeline_store.sqlite", help="Local sqlite store path")
+    parser.add_argument("--no-sync", action="store_true", help="Skip the Salesforce sync, re-score from the store")
+    parser.add_argument("--output-jsonl", help="Write every stored risk result, one per line")
+    args = parser.parse_args()
+
+    with OpportunityStore(args.store) as store:
+        if not args.no_sync:
+            if not args.instance_url or not args.token:
+                raise SystemExit("Provide --instance-url and --token (or SALESFORCE_INSTANCE_URL / SALESFORCE_ACCESS_TOKEN)")
+            with SalesforceClient(args.instance_url, args.token) as client:
+                sync = sync_opportunities(client, store)
+            print(f"synced: {sync.fetched} fetched, {len(sync.changed)} with relevant changes", file=sys.stderr)
+
+        delta = delta_rescore(store, score_batch, age_thresholds=(STAGE_AGE_DAYS,))
+        print(f"scored: {delta.rescored} re-run, {delta.reused} reused", file=sys.stderr)
+
+        if args.output_jsonl:
+            with open(args.output_jsonl, "w", encoding="utf-8") as f:
+                for opp_id, result in store.results():
+                    f.write(json.dumps({"opportunity_id": opp_id, **result}, ensure_ascii=False) + "\n")
+
+
+if __name__ == "__main__":
+    main()
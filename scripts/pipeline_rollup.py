@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import os
+import sys
+from typing import Any, Dict, Iterator, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from agents.pipeline_risk_inspector.src.agent import run_batch  # noqa: E402
+from agents.pipeline_risk_inspector.src.rollups import PipelineRollup  # noqa: E402
+
+
+def scored_jsonl(path: str, chunk_size: int) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    # Score the file chunk by chunk so only one chunk of results is alive at a time.
+    with open(path, "r", encoding="utf-8") as f:
+        opps = (json.loads(line) for line in f if line.strip())
+        while True:
+            chunk = list(itertools.islice(opps, chunk_size))
+            if not chunk:
+                return
+            yield from zip(chunk, run_batch({"opportunities": chunk}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Roll up pipeline risk by stage, owner and close month.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--store", help="Aggregate scored opportunities from a pipeline_delta.py sqlite store")
+    source.add_argument("--opportunities-jsonl", help="Score and aggregate opportunities, one JSON object per line")
+    source.add_argument("--merge", nargs="+", metavar="ROLLUP_JSON", help="Combine rollups written by earlier shard runs")
+    parser.add_argument("--top-k", type=int, default=10, help="Riskiest deals kept per owner")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="Opportunities scored per batch")
+    parser.add_argument("--output", help="Write the rollup JSON here instead of stdout")
+    args = parser.parse_args()
+
+    rollup = PipelineRollup(args.top_k)
+    if args.store:
+        from shared.connectors.salesforce.queries import OpportunityStore
+
+        with OpportunityStore(args.store) as store:
+            rollup.add_many(store.scored())
+    elif args.opportunities_jsonl:
+        rollup.add_many(scored_jsonl(args.opportunities_jsonl, args.chunk_size))
+    else:
+        for path in args.merge:
+            with open(path, "r", encoding="utf-8") as f:
+                rollup.merge(PipelineRollup.from_dict(json.load(f)))
+
+    text = json.dumps(rollup.to_dict(), indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
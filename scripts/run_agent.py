@@ -1,22 +1,29 @@
 from __future__ import annotations
 
-import argparse
-import importlib
 import json
 import os
 import sys
-from typing import Any, Dict
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, IO, Iterator, List, Optional, Tuple
 
 
 REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, REPO_ROOT)
 
-
-AGENT_MODULES = {
-    "lead_qualification": "agents.lead_qualification.src.agent",
-    "meeting_followup": "agents.meeting_followup.src.agent",
-    "pipeline_risk_inspector": "agents.pipeline_risk_inspector.src.agent",
+from shared.observability import logging as tracing  # noqa: E402
+from shared.runtime.registry import AGENT_MODULES, get_run  # noqa: E402
+
+# Cold starts are billed, so well-formed command lines are parsed by hand and
+# argparse (which drags in re, gettext, shutil...) is only imported for --help
+# and error messages. Keep these tables in sync with _parse_args below.
+FLAGS = {
+    "--agent": "agent",
+    "--input": "input",
+    "--input-jsonl": "input_jsonl",
+    "--output-jsonl": "output_jsonl",
+    "--output-columnar": "output_columnar",
 }
+SWITCHES = {"--demo": "demo", "--pretty": "pretty"}
 
 
 def load_json(path: str) -> Dict[str, Any]:
@@ -24,13 +31,135 @@ def load_json(path: str) -> Dict[str, Any]:
         return json.load(f)
 
 
-def main() -> None:
+def load_run(agent: str) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    try:
+        return get_run(agent)
+    except AttributeError as e:
+        raise SystemExit(str(e))
+
+
+def _open_stream(path: str, mode: str, std: IO[str]) -> IO[str]:
+    if path == "-":
+        return std
+    if not os.path.isabs(path):
+        path = os.path.join(os.getcwd(), path)
+    return open(path, mode, encoding="utf-8")
+
+
+def iter_jsonl(f: IO[str]) -> Iterator[Tuple[int, str]]:
+    for line_no, line in enumerate(f, start=1):
+        line = line.strip()
+        if line:
+            yield line_no, line
+
+
+def stream_results(
+    run: Callable[[Dict[str, Any]], Dict[str, Any]],
+    src: IO[str],
+    emit: Callable[[Dict[str, Any], int], None],
+) -> Tuple[int, int]:
+    ok = failed = 0
+    for line_no, line in iter_jsonl(src):
+        try:
+            out = run(json.loads(line))
+        except Exception as e:  # one bad record must not abort the stream
+            failed += 1
+            out = {"error": f"{type(e).__name__}: {e}", "line": line_no}
+            print(f"line {line_no}: {out['error']}", file=sys.stderr)
+        else:
+            ok += 1
+        emit(out, line_no)
+    return ok, failed
+
+
+def stream_jsonl(run: Callable[[Dict[str, Any]], Dict[str, Any]], src: IO[str], dst: IO[str]) -> Tuple[int, int]:
+    def emit(out: Dict[str, Any], line_no: int) -> None:
+        dst.write(json.dumps(out, ensure_ascii=False))
+        dst.write("\n")
+
+    ok, failed = stream_results(run, src, emit)
+    dst.flush()
+    return ok, failed
+
+
+def stream_columnar(run: Callable[[Dict[str, Any]], Dict[str, Any]], src: IO[str], agent: str, path: str) -> Tuple[int, int]:
+    # Imported here: csv (and pyarrow, when installed) are only paid for
+    # when a columnar file is asked for.
+    from shared.runtime.sink import ResultSink
+
+    if not os.path.isabs(path):
+        path = os.path.join(os.getcwd(), path)
+    with ResultSink(path, agent) as sink:
+        ok, failed = stream_results(run, src, sink.add)
+    print(f"{agent}: wrote {sink.rows} rows in {sink.row_groups} row groups to {sink.path}", file=sys.stderr)
+    return ok, failed
+
+
+def _parse_fast(argv: List[str]) -> Optional[SimpleNamespace]:
+    opts: Dict[str, Any] = {dest: None for dest in FLAGS.values()}
+    opts.update({dest: False for dest in SWITCHES.values()})
+    it = iter(argv)
+    for arg in it:
+        name, eq, value = arg.partition("=")
+        if name in SWITCHES and not eq:
+            opts[SWITCHES[name]] = True
+        elif name in FLAGS:
+            if not eq:
+                value = next(it, None)
+                if value is None or (value.startswith("-") and value != "-"):
+                    return None
+            opts[FLAGS[name]] = value
+        else:
+            return None
+    if opts["agent"] not in AGENT_MODULES:
+        return None
+    return SimpleNamespace(**opts)
+
+
+def _parse_args(argv: List[str]) -> Any:
+    fast = _parse_fast(argv)
+    if fast is not None:
+        return fast
+
+    import argparse
+
     parser = argparse.ArgumentParser(description="Run a GTM agent locally.")
     parser.add_argument("--agent", required=True, choices=sorted(AGENT_MODULES.keys()))
     parser.add_argument("--demo", action="store_true", help="Run using agents/<agent>/demo/input.json")
     parser.add_argument("--input", help="Path to JSON input file")
     parser.add_argument("--pretty", action="store_true", help="Pretty-print JSON output")
-    args = parser.parse_args()
+    parser.add_argument("--input-jsonl", help="Stream payloads from a JSONL file, one per line ('-' for stdin)")
+    parser.add_argument("--output-jsonl", help="Write one JSON result per line ('-' for stdout, the default)")
+    parser.add_argument(
+        "--output-columnar",
+        help="Write results as flattened columns instead: .arrow/.feather/.ipc or .parquet (needs pyarrow), or .csv",
+    )
+    return parser.parse_args(argv)
+
+
+def main() -> None:
+    args = _parse_args(sys.argv[1:])
+
+    if args.input_jsonl:
+        run = load_run(args.agent)
+        src = _open_stream(args.input_jsonl, "r", sys.stdin)
+        try:
+            if args.output_columnar:
+                ok, failed = stream_columnar(run, src, args.agent, args.output_columnar)
+            else:
+                dst = _open_stream(args.output_jsonl or "-", "w", sys.stdout)
+                try:
+                    ok, failed = stream_jsonl(run, src, dst)
+                finally:
+                    if dst is not sys.stdout:
+                        dst.close()
+        finally:
+            if src is not sys.stdin:
+                src.close()
+        print(f"{args.agent}: {ok} ok, {failed} failed", file=sys.stderr)
+        if failed:
+            raise SystemExit(1)
+        return
 
     agent_dir = args.agent
     if args.demo:
@@ -40,15 +169,11 @@ def main() -> None:
         if not os.path.isabs(input_path):
             input_path = os.path.join(os.getcwd(), input_path)
     else:
-        raise SystemExit("Provide --demo or --input <path>")
+        raise SystemExit("Provide --demo, --input <path> or --input-jsonl <path>")
 
     payload = load_json(input_path)
 
-    mod = importlib.import_module(AGENT_MODULES[args.agent])
-    if not hasattr(mod, "run"):
-        raise SystemExit(f"Agent module {AGENT_MODULES[args.agent]} is missing run(input_dict)->output_dict")
-
-    out = mod.run(payload)
+    out = load_run(args.agent)(payload)
 
     if args.pretty:
         print(json.dumps(out, indent=2, ensure_ascii=False))
@@ -57,4 +182,8 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    tracing.configure_from_env()
+    try:
+        main()
+    finally:
+        tracing.disable()
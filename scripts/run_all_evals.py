@@ -1,49 +1,67 @@
 from __future__ import annotations
 
-import importlib
+import argparse
 import os
 import sys
-from typing import Dict, Callable
 
 # Ensure repo root is on path BEFORE importing shared/*
 REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, REPO_ROOT)
 
-from shared.evals.runner import run_eval_file  # noqa: E402
-
-AGENTS = [
-    ("lead_qualification", "agents.lead_qualification.src.agent"),
-    ("meeting_followup", "agents.meeting_followup.src.agent"),
-    ("pipeline_risk_inspector", "agents.pipeline_risk_inspector.src.agent"),
-]
-
-
-def _predict_fn(module_path: str) -> Callable[[Dict], Dict]:
-    mod = importlib.import_module(module_path)
-    if not hasattr(mod, "run"):
-        raise RuntimeError(f"Missing run() in {module_path}")
-    return getattr(mod, "run")
+from shared.evals.cache import DEFAULT_PATH, EvalCache  # noqa: E402
+from shared.evals.runner import parse_shard, run_eval_file, run_eval_file_parallel  # noqa: E402
+from shared.observability import logging as tracing  # noqa: E402
+from shared.runtime.registry import agent_names, get_run  # noqa: E402
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Run eval cases for every agent.")
+    parser.add_argument("--workers", type=int, default=1, help="Evaluate cases on a pool of N processes")
+    parser.add_argument("--shard", help="Only run shard i of n (0-based), e.g. --shard 0/4")
+    parser.add_argument(
+        "--cache",
+        help="Eval result cache file (default: .eval_cache.json; with --cases-dir, no cache unless this is given)",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Run every case without reading or writing the cache")
+    parser.add_argument("--force", action="store_true", help="Re-run every case and refresh the cache")
+    parser.add_argument(
+        "--cases-dir", help="Read <dir>/<agent>.jsonl (e.g. from generate_eval_corpus.py) instead of each agent's evals/cases.jsonl"
+    )
+    args = parser.parse_args()
+    shard = parse_shard(args.shard) if args.shard else None
+    # A generated corpus is large and usually run once; caching it by default
+    # would bloat the shared cache file with entries that are never hit again.
+    use_cache = not args.no_cache and (args.cache is not None or not args.cases_dir)
+    cache = EvalCache(args.cache or DEFAULT_PATH, force=args.force) if use_cache else None
+
     total_pass = 0
     total_fail = 0
 
     print("Running evals (real agent logic)\n")
 
-    for agent_name, module_path in AGENTS:
-        eval_path = os.path.join(REPO_ROOT, "agents", agent_name, "evals", "cases.jsonl")
+    for agent_name in agent_names():
+        if args.cases_dir:
+            eval_path = os.path.join(args.cases_dir, f"{agent_name}.jsonl")
+        else:
+            eval_path = os.path.join(REPO_ROOT, "agents", agent_name, "evals", "cases.jsonl")
         if not os.path.exists(eval_path):
             print(f"[SKIP] {agent_name}: missing {eval_path}\n")
             continue
 
-        predict = _predict_fn(module_path)
-        passed, failed, results = run_eval_file(agent_name, eval_path, predict)
+        predict = get_run(agent_name)
+        hits = cache.hits if cache else 0
+        if args.workers > 1 or shard is not None or cache is not None:
+            passed, failed, results = run_eval_file_parallel(
+                agent_name, eval_path, predict, workers=args.workers, shard=shard, cache=cache
+            )
+        else:
+            passed, failed, results = run_eval_file(agent_name, eval_path, predict)
 
         total_pass += passed
         total_fail += failed
 
-        print(f"{agent_name}: {passed} passed, {failed} failed")
+        reused = f" ({cache.hits - hits} cached)" if cache and cache.hits > hits else ""
+        print(f"{agent_name}: {passed} passed, {failed} failed{reused}")
 
         if failed:
             for r in results:
@@ -53,6 +71,8 @@ def main() -> None:
                         print(f"      * {msg}")
         print("")
 
+    if cache is not None:
+        cache.save()
     print(f"TOTAL: {total_pass} passed, {total_fail} failed")
 
     if total_fail:
@@ -60,4 +80,9 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    # GTM_TRACE=<path.jsonl> records a span per eval case with the agent's stages nested inside.
+    tracing.configure_from_env()
+    try:
+        main()
+    finally:
+        tracing.disable()
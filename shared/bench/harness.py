@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import json
+import math
+import platform
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Sequence
+
+# Metrics where a larger value is a regression; everything else is
+# higher-is-better (throughput).
+LOWER_IS_BETTER = {"p50_ms", "p95_ms", "p99_ms", "peak_mem_kb"}
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    # Nearest-rank percentile, stable for small samples.
+    k = math.ceil(pct / 100.0 * len(sorted_values)) - 1
+    return sorted_values[max(0, min(len(sorted_values) - 1, k))]
+
+
+def measure(fn: Callable[[Any], Any], inputs: Sequence[Any], warmup: int = 3) -> Dict[str, float]:
+    for x in inputs[:warmup]:
+        fn(x)
+
+    latencies: List[float] = []
+    clock = time.perf_counter
+    start = clock()
+    for x in inputs:
+        t0 = clock()
+        fn(x)
+        latencies.append(clock() - t0)
+    wall = clock() - start
+
+    # Separate pass: tracemalloc slows allocation, so it must not skew latency.
+    tracemalloc.start()
+    try:
+        for x in inputs:
+            fn(x)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "n": len(inputs),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 4),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 4),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 4),
+        "throughput_per_s": round(len(inputs) / wall, 1) if wall else 0.0,
+        "peak_mem_kb": round(peak / 1024, 1),
+    }
+
+
+def environment() -> Dict[str, str]:
+    return {"python": platform.python_version(), "implementation": platform.python_implementation(), "machine": platform.machine()}
+
+
+def save(path: str, report: Dict[str, Any]) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def load(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> List[str]:
+    regressions: List[str] = []
+    for name, cur in current.get("results", {}).items():
+        base = baseline.get("results", {}).get(name)
+        if not base:
+            continue
+        for metric, value in cur.items():
+            old = base.get(metric)
+            if metric == "n" or not old:
+                continue
+            change = (value - old) / old
+            if metric not in LOWER_IS_BETTER:
+                change = -change
+            if change > threshold:
+                regressions.append(f"{name}.{metric}: {old} -> {value} ({change:+.1%} worse)")
+    return regressions
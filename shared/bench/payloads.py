@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import copy
+import json
+import os
+import random
+from typing import Any, Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+INDUSTRIES = ["Manufacturing", "Healthcare", "Financial Services", "Retail", "Logistics", "Software", "Education", "Food & Beverage"]
+TITLES = ["VP Engineering", "CIO", "CTO", "Head of Infrastructure", "Director of Data", "IT Manager", "Engineer", "Owner"]
+REGIONS = ["NA", "EU", "APAC", "LATAM"]
+USE_CASES = [
+    "Migrate legacy ERP to cloud",
+    "Data center modernization",
+    "Move analytics workloads to cloud",
+    "Assess security controls for migration",
+    "Need help with email marketing",
+    "",
+]
+BUDGETS = ["Approved", "Not approved", "In planning", "TBD", "Unknown"]
+TIMELINES = ["60 days", "90 days", "this quarter", "6-9 months", "2 quarters", "next year", "24 months", "Unknown"]
+NOTES = ["", "", "", "Security review required", "Compliance team involved", "Call me at 555-123-9876"]
+
+STAGES = ["Discovery", "Scoping", "Proposal", "Negotiation", "Commit"]
+OWNERS = ["Avery Patel", "Jordan Lee", "Sam Rivera", "Priya Shah", "Chris Okafor", "Dana Kim"]
+MEDDPICC_FIELDS = ["metrics", "economic_buyer", "decision_criteria", "decision_process", "paper_process", "identify_pain", "champion"]
+
+EXTRA_LINES = [
+    "Jordan: Any competitors in the mix?",
+    "Maya: We are also looking at Azure and Snowflake for the analytics side.",
+    "Maya: Procurement will want redlines on the MSA before Friday.",
+    "Jordan: I will send the estimate and book a security workshop.",
+    "Maya: Reach me at maya.chen@example.com if anything changes.",
+    "Maya: We expect to cut reporting time by 30% and halve incident volume.",
+]
+
+
+def load_demo(agent: str) -> Dict[str, Any]:
+    path = os.path.join(REPO_ROOT, "agents", agent, "demo", "input.json")
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def lead_payloads(n: int, seed: int = 7) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    template = load_demo("lead_qualification")["lead"]
+    out: List[Dict[str, Any]] = []
+    for i in range(n):
+        lead = dict(template)
+        lead.update(
+            {
+                "company": f"{template['company']} {i}",
+                "industry": rng.choice(INDUSTRIES),
+                "employees": rng.choice([12, 80, 450, 850, 2400, 12000]),
+                "region": rng.choice(REGIONS),
+                "title": rng.choice(TITLES),
+                "use_case": rng.choice(USE_CASES),
+                "budget": rng.choice(BUDGETS),
+                "timeline": rng.choice(TIMELINES),
+                "notes": rng.choice(NOTES),
+            }
+        )
+        out.append({"lead": lead})
+    return out
+
+
+def meeting_payloads(n: int, transcript_chars: int, seed: int = 7) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    demo = load_demo("meeting_followup")
+    lines = demo["transcript"].splitlines() + EXTRA_LINES
+    out: List[Dict[str, Any]] = []
+    for i in range(n):
+        parts: List[str] = []
+        size = 0
+        while size < transcript_chars:
+            line = rng.choice(lines)
+            parts.append(line)
+            size += len(line) + 1
+        meeting = copy.deepcopy(demo["meeting"])
+        meeting["opportunity"]["id"] = f"006BENCH{i:07d}"
+        meeting["opportunity"]["stage"] = rng.choice(STAGES)
+        out.append({"meeting": meeting, "transcript": "\n".join(parts)[:transcript_chars]})
+    return out
+
+
+def opportunities(n: int, seed: int = 7) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    templates = load_demo("pipeline_risk_inspector")["opportunities"]
+    out: List[Dict[str, Any]] = []
+    for i in range(n):
+        opp = copy.deepcopy(rng.choice(templates))
+        opp["id"] = f"006BENCH{i:07d}"
+        opp["stage"] = rng.choice(STAGES)
+        opp["amount"] = rng.choice([25_000, 120_000, 250_000, 450_000, 900_000, 1_200_000])
+        opp["age_days"] = rng.randint(0, 120)
+        opp["champion_confirmed"] = rng.random() < 0.5
+        opp["security_review"] = rng.random() < 0.3
+        opp["budget_status"] = rng.choice(["approved", "planning", "", "unknown"])
+        opp["owner"] = rng.choice(OWNERS)
+        opp["close_date"] = f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+        for field in MEDDPICC_FIELDS:
+            if rng.random() < 0.25:
+                opp["meddpicc"][field] = ""
+        out.append(opp)
+    return out
+
+
+def pipeline_payloads(n: int, seed: int = 7) -> List[Dict[str, Any]]:
+    as_of = load_demo("pipeline_risk_inspector").get("as_of_date")
+    return [{"as_of_date": as_of, "opportunity": opp} for opp in opportunities(n, seed)]
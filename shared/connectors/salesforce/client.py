@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import asyncio
+import http.client
+import json
+import queue
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from urllib.parse import quote, urlsplit
+
+# sObject Collections accept at most 200 records per request.
+MAX_BATCH = 200
+DEFAULT_API_VERSION = "v59.0"
+
+SOBJECT_FOR_TARGET = {
+    "lead": "Lead",
+    "opportunity": "Opportunity",
+    "account": "Account",
+    "contact": "Contact",
+}
+
+
+class SalesforceError(Exception):
+    # status is 0 when no HTTP response arrived (connection or timeout error).
+    def __init__(self, status: int, body: Any) -> None:
+        super().__init__(f"HTTP {status}: {body}")
+        self.status = status
+        self.body = body
+
+
+@dataclass
+class RecordResult:
+    id: Optional[str]
+    success: bool
+    errors: List[str] = field(default_factory=list)
+
+
+def record_from_action(action: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+    payload = action.get("payload") or {}
+    sobject = SOBJECT_FOR_TARGET.get((action.get("target") or "").lower(), action.get("target") or "")
+    record_id = payload.get("record_id") or payload.get("opportunity_id") or payload.get("lead_id")
+    record = dict(payload.get("fields") or {})
+    record["id"] = record_id
+    return sobject, record
+
+
+class SalesforceClient:
+    """Updates records through the sObject Collections API over pooled keep-alive connections."""
+
+    def __init__(
+        self,
+        instance_url: str,
+        access_token: str,
+        api_version: str = DEFAULT_API_VERSION,
+        pool_size: int = 4,
+        timeout: float = 30.0,
+        batch_size: int = MAX_BATCH,
+    ) -> None:
+        parts = urlsplit(instance_url)
+        self._scheme = parts.scheme or "https"
+        self._host = parts.hostname or ""
+        self._port = parts.port
+        self._token = access_token
+        self._timeout = timeout
+        self.api_version = api_version
+        self.batch_size = max(1, min(batch_size, MAX_BATCH))
+        self._pool: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue()
+        for _ in range(pool_size):
+            self._pool.put(self._connect())
+        self.requests_sent = 0
+
+    def _connect(self) -> http.client.HTTPConnection:
+        cls = http.client.HTTPSConnection if self._scheme == "https" else http.client.HTTPConnection
+        return cls(self._host, self._port, timeout=self._timeout)
+
+    def close(self) -> None:
+        while not self._pool.empty():
+            self._pool.get_nowait().close()
+
+    def __enter__(self) -> "SalesforceClient":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def request(self, method: str, path: str, body: Any = None) -> Any:
+        data = json.dumps(body).encode("utf-8") if body is not None else None
+        headers = {
+            "Authorization": f"Bearer {self._token}",
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+
+        conn = self._pool.get()
+        try:
+            # A pooled connection may have been closed by the server while
+            # idle; http.client reconnects a closed connection, so retry once.
+            for attempt in range(2):
+                try:
+                    conn.request(method, path, body=data, headers=headers)
+                    resp = conn.getresponse()
+                    raw = resp.read()
+                    break
+                except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                    conn.close()
+                    if attempt:
+                        raise
+            self.requests_sent += 1
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            raise SalesforceError(0, f"{type(e).__name__}: {e}") from e
+        except Exception:
+            conn.close()
+            raise
+        finally:
+            self._pool.put(conn)
+
+        try:
+            parsed = json.loads(raw) if raw else None
+        except ValueError:
+            # Proxies and maintenance pages answer with HTML or plain text.
+            text = raw[:500].decode("utf-8", "replace")
+            raise SalesforceError(resp.status, f"non-JSON response: {text}") from None
+        if resp.status >= 400:
+            raise SalesforceError(resp.status, parsed)
+        return parsed
+
+    def query(self, soql: str) -> Iterator[Dict[str, Any]]:
+        # Follows nextRecordsUrl so callers see one stream of records.
+        page = self.request("GET", f"/services/data/{self.api_version}/query?q={quote(soql)}")
+        while True:
+            for rec in page.get("records") or []:
+                yield rec
+            next_url = page.get("nextRecordsUrl")
+            if page.get("done", True) or not next_url:
+                return
+            page = self.request("GET", next_url)
+
+    def update_records(self, sobject: str, records: List[Dict[str, Any]]) -> List[RecordResult]:
+        results: List[RecordResult] = []
+        path = f"/services/data/{self.api_version}/composite/sobjects"
+
+        for i in range(0, len(records), self.batch_size):
+            chunk = records[i : i + self.batch_size]
+            body = {
+                "allOrNone": False,
+                "records": [dict(r, attributes={"type": sobject}) for r in chunk],
+            }
+            try:
+                rows = self.request("PATCH", path, body)
+            except SalesforceError as e:
+                # The whole request was rejected: every record in it failed the same way.
+                results.extend(RecordResult(r.get("id"), False, [str(e)]) for r in chunk)
+                continue
+            if not isinstance(rows, list):
+                rows = []
+            for r, row in zip(chunk, rows):
+                errors = [f"{err.get('statusCode')}: {err.get('message')}" for err in row.get("errors") or []]
+                results.append(RecordResult(row.get("id") or r.get("id"), bool(row.get("success")), errors))
+            # Rows come back in request order; any record past the last row went unanswered.
+            results.extend(
+                RecordResult(r.get("id"), False, [f"NO_RESULT: {len(rows)} results for {len(chunk)} records"])
+                for r in chunk[len(rows) :]
+            )
+
+        return results
+
+    def update_actions(self, actions: Iterable[Dict[str, Any]]) -> List[RecordResult]:
+        # Group by sObject so each request carries up to batch_size records of
+        # one type, then put results back in action order.
+        grouped: Dict[str, List[Tuple[int, Dict[str, Any]]]] = {}
+        results: List[Optional[RecordResult]] = []
+        for i, action in enumerate(actions):
+            results.append(None)
+            sobject, record = record_from_action(action)
+            if not record["id"]:
+                results[i] = RecordResult(None, False, ["MISSING_ID: salesforce_update action has no record id"])
+                continue
+            grouped.setdefault(sobject, []).append((i, record))
+
+        for sobject, items in grouped.items():
+            for (i, _), result in zip(items, self.update_records(sobject, [r for _, r in items])):
+                results[i] = result
+
+        return [r or RecordResult(None, False, ["NO_RESULT: no result for this action"]) for r in results]
+
+
+class BatchingHandler:
+    """Async action handler that coalesces salesforce_update actions into
+    bulk requests.
+
+    ActionExecutor uses call_many(): each of its workers takes up to
+    batch_size queued actions (waiting up to `window` for a batch to fill),
+    so requests carry full batches whatever the worker concurrency. Called
+    one action at a time, a batch is flushed when it reaches batch_size or
+    `window` seconds after its first action arrived.
+    """
+
+    def __init__(self, client: SalesforceClient, window: float = 0.05) -> None:
+        self.client = client
+        self.window = window
+        self.batch_size = client.batch_size
+        self._pending: List[Tuple[Dict[str, Any], "asyncio.Future[RecordResult]"]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    async def __call__(self, action: Dict[str, Any]) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        fut: "asyncio.Future[RecordResult]" = loop.create_future()
+        self._pending.append((action, fut))
+        if len(self._pending) >= self.client.batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+
+        result = await fut
+        if not result.success:
+            raise SalesforceError(400, result.errors)
+        return {"id": result.id, "success": True}
+
+    async def call_many(self, actions: List[Dict[str, Any]]) -> List[Any]:
+        """One result dict, or the SalesforceError to retry, per action."""
+        results = await asyncio.to_thread(self.client.update_actions, actions)
+        return [
+            {"id": r.id, "success": True} if r.success else SalesforceError(400, r.errors)
+            for r in results
+        ]
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._send(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: List[Tuple[Dict[str, Any], "asyncio.Future[RecordResult]"]]) -> None:
+        try:
+            results = await asyncio.to_thread(self.client.update_actions, [a for a, _ in batch])
+        except Exception as e:
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(e)
+            return
+        for (_, fut), result in zip(batch, results):
+            if not fut.done():
+                fut.set_result(result)
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from shared.connectors.salesforce.queries import parse_timestamp, sf_timestamp
+
+COLLECTIONS_PATH = re.compile(r"^/services/data/v\d+\.\d+/composite/sobjects/?$")
+QUERY_PATH = re.compile(r"^/services/data/(v\d+\.\d+)/query(?:/(\d+))?/?$")
+
+# The subset of SOQL that shared/connectors/salesforce/queries.py generates.
+SOQL_FROM = re.compile(r"\bFROM\s+(\w+)", re.I)
+SOQL_CURSOR = re.compile(r"LastModifiedDate\s*>\s*(\S+?)\s+OR\s*\(\s*LastModifiedDate\s*=\s*\S+\s+AND\s+Id\s*>\s*'([^']*)'", re.I)
+SOQL_SINCE = re.compile(r"LastModifiedDate\s*>\s*([0-9T:\-\.Z+]+)", re.I)
+SOQL_LIMIT = re.compile(r"\bLIMIT\s+(\d+)", re.I)
+
+
+class MockSalesforce:
+    """Local HTTP stand-in for the Salesforce REST API.
+
+    Covers sObject Collections updates and paged SOQL queries ordered by
+    LastModifiedDate. Simulates per-request latency, the 200-records-per-request
+    limit, an optional total request quota, and per-record failures (unknown
+    ids or ids listed in `fail_ids`). Records live in `records`; every write
+    bumps LastModifiedDate like the real org does.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        max_records_per_request: int = 200,
+        request_quota: Optional[int] = None,
+        known_ids: Optional[Set[str]] = None,
+        fail_ids: Optional[Set[str]] = None,
+        token: str = "mock-token",
+        query_page_size: int = 2000,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.latency = latency
+        self.max_records_per_request = max_records_per_request
+        self.request_quota = request_quota
+        self.known_ids = known_ids
+        self.fail_ids = fail_ids or set()
+        self.token = token
+        self.query_page_size = query_page_size
+        self.records: Dict[str, Dict[str, Any]] = {}
+        self.types: Dict[str, str] = {}
+        self._cursors: Dict[str, Tuple[List[Dict[str, Any]], int]] = {}
+        self.requests = 0
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockSalesforce":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "MockSalesforce":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    def seed(self, sobject: str, records: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            for rec in records:
+                fields = {k: v for k, v in rec.items() if k not in {"Id", "attributes"}}
+                fields.setdefault("LastModifiedDate", sf_timestamp())
+                self.records[rec["Id"]] = fields
+                self.types[rec["Id"]] = sobject
+
+    def _query(self, soql: str) -> List[Dict[str, Any]]:
+        m = SOQL_FROM.search(soql)
+        sobject = m.group(1) if m else ""
+        after: Optional[Tuple[datetime, str]] = None
+        cursor = SOQL_CURSOR.search(soql)
+        if cursor:
+            after = (parse_timestamp(cursor.group(1)), cursor.group(2))
+        else:
+            since = SOQL_SINCE.search(soql)
+            if since:
+                after = (parse_timestamp(since.group(1)), "\uffff")
+        limit = SOQL_LIMIT.search(soql)
+
+        with self._lock:
+            rows = [
+                dict(fields, Id=rec_id, attributes={"type": sobject})
+                for rec_id, fields in self.records.items()
+                if self.types.get(rec_id) == sobject
+            ]
+        rows.sort(key=lambda r: (parse_timestamp(r["LastModifiedDate"]), r["Id"]))
+        if after is not None:
+            rows = [r for r in rows if (parse_timestamp(r["LastModifiedDate"]), r["Id"]) > after]
+        if limit:
+            rows = rows[: int(limit.group(1))]
+        return rows
+
+    def _page(self, version: str, rows: List[Dict[str, Any]], offset: int) -> Dict[str, Any]:
+        end = offset + self.query_page_size
+        page: Dict[str, Any] = {"totalSize": len(rows), "done": end >= len(rows), "records": rows[offset:end]}
+        if end < len(rows):
+            with self._lock:
+                locator = str(len(self._cursors) + 1)
+                self._cursors[locator] = (rows, end)
+            page["nextRecordsUrl"] = f"/services/data/{version}/query/{locator}"
+        return page
+
+    def _update(self, body: Dict[str, Any]) -> List[Dict[str, Any]]:
+        rows: List[Dict[str, Any]] = []
+        for rec in body.get("records") or []:
+            rec_id = rec.get("id")
+            if not rec_id or rec_id in self.fail_ids or (self.known_ids is not None and rec_id not in self.known_ids):
+                rows.append(
+                    {
+                        "id": rec_id,
+                        "success": False,
+                        "errors": [{"statusCode": "ENTITY_IS_DELETED" if rec_id else "MISSING_ARGUMENT", "message": "record not updatable", "fields": []}],
+                    }
+                )
+                continue
+            fields = {k: v for k, v in rec.items() if k not in {"id", "attributes"}}
+            fields["LastModifiedDate"] = sf_timestamp()
+            with self._lock:
+                self.records.setdefault(rec_id, {}).update(fields)
+                self.types.setdefault(rec_id, (rec.get("attributes") or {}).get("type", ""))
+            rows.append({"id": rec_id, "success": True, "errors": []})
+        return rows
+
+    def _handler_class(self) -> type:
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive
+
+            def setup(self) -> None:
+                super().setup()
+                with mock._lock:
+                    mock.connections += 1
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def _send(self, status: int, body: Any) -> None:
+                data = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _admit(self) -> bool:
+                with mock._lock:
+                    mock.requests += 1
+                    over_quota = mock.request_quota is not None and mock.requests > mock.request_quota
+
+                if self.headers.get("Authorization") != f"Bearer {mock.token}":
+                    self._send(401, [{"errorCode": "INVALID_SESSION_ID", "message": "Session expired or invalid"}])
+                    return False
+                if over_quota:
+                    self._send(403, [{"errorCode": "REQUEST_LIMIT_EXCEEDED", "message": "TotalRequests Limit exceeded."}])
+                    return False
+                if mock.latency:
+                    time.sleep(mock.latency)
+                return True
+
+            def do_GET(self) -> None:
+                if not self._admit():
+                    return
+                parts = urlsplit(self.path)
+                m = QUERY_PATH.match(parts.path)
+                if not m:
+                    return self._send(404, [{"errorCode": "NOT_FOUND", "message": self.path}])
+
+                version, locator = m.group(1), m.group(2)
+                if locator:
+                    with mock._lock:
+                        cursor = mock._cursors.pop(locator, None)
+                    if cursor is None:
+                        return self._send(400, [{"errorCode": "INVALID_QUERY_LOCATOR", "message": locator}])
+                    return self._send(200, mock._page(version, *cursor))
+
+                soql = (parse_qs(parts.query).get("q") or [""])[0]
+                self._send(200, mock._page(version, mock._query(soql), 0))
+
+            def do_PATCH(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+
+                if not self._admit():
+                    return
+                if not COLLECTIONS_PATH.match(self.path):
+                    return self._send(404, [{"errorCode": "NOT_FOUND", "message": self.path}])
+
+                body = json.loads(raw or b"{}")
+                if len(body.get("records") or []) > mock.max_records_per_request:
+                    return self._send(
+                        400,
+                        [{"errorCode": "EXCEEDED_ID_LIMIT", "message": f"record limit is {mock.max_records_per_request}"}],
+                    )
+
+                self._send(200, mock._update(body))
+
+        return Handler
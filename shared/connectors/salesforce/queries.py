@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from shared.connectors.salesforce.client import SalesforceClient
+
+# Salesforce field -> key in the opportunity dict the risk agent reads.
+OPPORTUNITY_FIELDS = {
+    "Id": "id",
+    "Name": "name",
+    "StageName": "stage",
+    "Amount": "amount",
+    "CloseDate": "close_date",
+    "LastActivityDate": "last_activity_date",
+    "Age_Days__c": "age_days",
+    "Champion_Confirmed__c": "champion_confirmed",
+    "Security_Review__c": "security_review",
+    "Budget_Status__c": "budget_status",
+    "OwnerId": "owner",
+}
+MEDDPICC_FIELDS = {
+    "Metrics__c": "metrics",
+    "Economic_Buyer__c": "economic_buyer",
+    "Decision_Criteria__c": "decision_criteria",
+    "Decision_Process__c": "decision_process",
+    "Paper_Process__c": "paper_process",
+    "Identify_Pain__c": "identify_pain",
+    "Champion__c": "champion",
+    "Competition__c": "competition",
+}
+
+# Inputs that can change a risk result. Edits to anything else (name,
+# description, owner notes) bump LastModifiedDate but do not trigger a re-run.
+# age_days is not here: it grows every day without an edit, so the store
+# keeps the day the deal was created (age_origin) and derives the age from
+# it at rescore time.
+RELEVANT_KEYS = [
+    "stage",
+    "amount",
+    "close_date",
+    "last_activity_date",
+    "champion_confirmed",
+    "security_review",
+    "budget_status",
+    "meddpicc",
+]
+
+EPOCH = "1970-01-01T00:00:00.000+0000"
+
+
+def opportunity_soql(after_ts: str, after_id: str, limit: Optional[int] = None) -> str:
+    fields = ", ".join(list(OPPORTUNITY_FIELDS) + list(MEDDPICC_FIELDS) + ["LastModifiedDate"])
+    ts = soql_datetime(after_ts)
+    # (LastModifiedDate, Id) is a strict total order, so records sharing a
+    # timestamp across a page boundary are neither skipped nor repeated.
+    soql = (
+        f"SELECT {fields} FROM Opportunity "
+        f"WHERE LastModifiedDate > {ts} OR (LastModifiedDate = {ts} AND Id > '{after_id}') "
+        "ORDER BY LastModifiedDate, Id"
+    )
+    if limit:
+        soql += f" LIMIT {int(limit)}"
+    return soql
+
+
+def sf_timestamp(dt: Optional[datetime] = None) -> str:
+    dt = dt or datetime.now(timezone.utc)
+    return dt.strftime("%Y-%m-%dT%H:%M:%S.") + f"{dt.microsecond // 1000:03d}+0000"
+
+
+def parse_timestamp(value: str) -> datetime:
+    value = value.replace("Z", "+0000")
+    for fmt in ("%Y-%m-%dT%H:%M:%S.%f%z", "%Y-%m-%dT%H:%M:%S%z"):
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    raise ValueError(f"unrecognized timestamp {value!r}")
+
+
+def soql_datetime(value: str) -> str:
+    dt = parse_timestamp(value)
+    return dt.strftime("%Y-%m-%dT%H:%M:%S.") + f"{dt.microsecond // 1000:03d}Z"
+
+
+def to_opportunity(record: Dict[str, Any]) -> Dict[str, Any]:
+    opp = {key: record.get(sf) for sf, key in OPPORTUNITY_FIELDS.items()}
+    opp["meddpicc"] = {key: record.get(sf) or "" for sf, key in MEDDPICC_FIELDS.items()}
+    return opp
+
+
+def age_origin(opp: Dict[str, Any], synced: date) -> Optional[int]:
+    # Day ordinal at which age_days was 0, from the age Salesforce reported
+    # on the day of the sync. None when the record carries no age.
+    age = opp.get("age_days")
+    return None if age is None else synced.toordinal() - int(age)
+
+
+def fingerprint(opp: Dict[str, Any], origin: Optional[int] = None) -> str:
+    relevant = {k: opp.get(k) for k in RELEVANT_KEYS}
+    relevant["age_origin"] = origin
+    return hashlib.sha256(json.dumps(relevant, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+@dataclass
+class SyncStats:
+    fetched: int = 0
+    changed: List[str] = field(default_factory=list)
+    cursor: Tuple[str, str] = (EPOCH, "")
+
+
+@dataclass
+class DeltaStats:
+    rescored: int = 0
+    reused: int = 0
+
+
+class OpportunityStore:
+    """Local sqlite copy of synced opportunities, the sync cursor and the last
+    risk result per opportunity (tagged with the input fingerprint and the
+    age_days it was computed at)."""
+
+    def __init__(self, path: str) -> None:
+        self.db = sqlite3.connect(path)
+        self.db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS sync_state (
+                sobject TEXT PRIMARY KEY, cursor_ts TEXT NOT NULL, cursor_id TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS opportunities (
+                id TEXT PRIMARY KEY, data TEXT NOT NULL, fingerprint TEXT NOT NULL, last_modified TEXT NOT NULL,
+                age_origin INTEGER
+            );
+            CREATE TABLE IF NOT EXISTS risk_results (
+                id TEXT PRIMARY KEY, fingerprint TEXT NOT NULL, result TEXT NOT NULL, age_days INTEGER
+            );
+            """
+        )
+        self._migrate()
+
+    def _columns(self, table: str) -> List[str]:
+        return [row[1] for row in self.db.execute(f"PRAGMA table_info({table})")]
+
+    def _migrate(self) -> None:
+        # Stores created before ages were derived. The sync day of an old row
+        # is unknown; its last modification is the closest bound. Fingerprints
+        # are recomputed, so every opportunity is re-scored once.
+        with self.db:
+            if "age_days" not in self._columns("risk_results"):
+                self.db.execute("ALTER TABLE risk_results ADD COLUMN age_days INTEGER")
+            if "age_origin" in self._columns("opportunities"):
+                return
+            self.db.execute("ALTER TABLE opportunities ADD COLUMN age_origin INTEGER")
+            rows = self.db.execute("SELECT id, data, last_modified FROM opportunities").fetchall()
+            for rec_id, data, last_modified in rows:
+                opp = json.loads(data)
+                origin = age_origin(opp, parse_timestamp(last_modified).date())
+                self.db.execute(
+                    "UPDATE opportunities SET fingerprint = ?, age_origin = ? WHERE id = ?",
+                    (fingerprint(opp, origin), origin, rec_id),
+                )
+
+    def close(self) -> None:
+        self.db.close()
+
+    def __enter__(self) -> "OpportunityStore":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def cursor(self, sobject: str = "Opportunity") -> Tuple[str, str]:
+        row = self.db.execute("SELECT cursor_ts, cursor_id FROM sync_state WHERE sobject = ?", (sobject,)).fetchone()
+        return (row[0], row[1]) if row else (EPOCH, "")
+
+    def upsert(
+        self, records: Iterable[Dict[str, Any]], sobject: str = "Opportunity", today: Optional[date] = None
+    ) -> SyncStats:
+        stats = SyncStats(cursor=self.cursor(sobject))
+        synced = today or datetime.now(timezone.utc).date()
+        with self.db:
+            for rec in records:
+                opp = to_opportunity(rec)
+                origin = age_origin(opp, synced)
+                fp = fingerprint(opp, origin)
+                row = self.db.execute("SELECT fingerprint FROM opportunities WHERE id = ?", (opp["id"],)).fetchone()
+                self.db.execute(
+                    "INSERT OR REPLACE INTO opportunities (id, data, fingerprint, last_modified, age_origin) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (opp["id"], json.dumps(opp, sort_keys=True), fp, rec["LastModifiedDate"], origin),
+                )
+                stats.fetched += 1
+                if row is None or row[0] != fp:
+                    stats.changed.append(opp["id"])
+                stats.cursor = (rec["LastModifiedDate"], rec["Id"])
+            self.db.execute(
+                "INSERT OR REPLACE INTO sync_state (sobject, cursor_ts, cursor_id) VALUES (?, ?, ?)",
+                (sobject, stats.cursor[0], stats.cursor[1]),
+            )
+        return stats
+
+    def stale(self, today: date, age_thresholds: Sequence[int] = ()) -> Iterator[Tuple[str, Dict[str, Any], str]]:
+        # Opportunities with no stored result, whose inputs changed since it
+        # was computed, or whose age has since reached one of age_thresholds.
+        # Each comes back with age_days as of `today`.
+        day = today.toordinal()
+        crossed = "".join(" OR (r.age_days < ? AND ? - o.age_origin >= ?)" for _ in age_thresholds)
+        params = [p for t in age_thresholds for p in (t, day, t)]
+        rows = self.db.execute(
+            f"""
+            SELECT o.id, o.data, o.fingerprint, o.age_origin FROM opportunities o
+            LEFT JOIN risk_results r ON r.id = o.id
+            WHERE r.fingerprint IS NULL OR r.fingerprint != o.fingerprint{crossed}
+            ORDER BY o.id
+            """,
+            params,
+        )
+        for rec_id, data, fp, origin in rows:
+            opp = json.loads(data)
+            if origin is not None:
+                opp["age_days"] = day - origin
+            yield rec_id, opp, fp
+
+    def save_results(self, rows: Iterable[Tuple[str, str, Optional[int], Dict[str, Any]]]) -> None:
+        with self.db:
+            self.db.executemany(
+                "INSERT OR REPLACE INTO risk_results (id, fingerprint, age_days, result) VALUES (?, ?, ?, ?)",
+                ((rec_id, fp, age, json.dumps(result)) for rec_id, fp, age, result in rows),
+            )
+
+    def results(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        for rec_id, result in self.db.execute("SELECT id, result FROM risk_results ORDER BY id"):
+            yield rec_id, json.loads(result)
+
+    def scored(self) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        # Streams (opportunity, risk result) pairs for rollups without loading the table.
+        rows = self.db.execute(
+            "SELECT o.data, r.result FROM opportunities o JOIN risk_results r ON r.id = o.id ORDER BY o.id"
+        )
+        for data, result in rows:
+            yield json.loads(data), json.loads(result)
+
+    def count(self) -> int:
+        return self.db.execute("SELECT COUNT(*) FROM opportunities").fetchone()[0]
+
+
+def sync_opportunities(client: SalesforceClient, store: OpportunityStore, limit: Optional[int] = None) -> SyncStats:
+    after_ts, after_id = store.cursor()
+    return store.upsert(client.query(opportunity_soql(after_ts, after_id, limit)))
+
+
+def delta_rescore(
+    store: OpportunityStore,
+    score_batch: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]],
+    chunk_size: int = 5000,
+    age_thresholds: Sequence[int] = (),
+    today: Optional[date] = None,
+) -> DeltaStats:
+    """Re-run `score_batch` only on opportunities whose relevant fields changed,
+    or whose age has crossed one of `age_thresholds` days since the last run.
+
+    `score_batch` maps a list of opportunity dicts to one result each, e.g.
+    lambda opps: run_batch({"opportunities": opps}) from pipeline_risk_inspector,
+    with age_thresholds=(STAGE_AGE_DAYS,). Re-scored opportunities get age_days
+    as of `today`, however long ago they were synced.
+    """
+    stats = DeltaStats()
+    pending = list(store.stale(today or datetime.now(timezone.utc).date(), age_thresholds))
+    for i in range(0, len(pending), chunk_size):
+        chunk = pending[i : i + chunk_size]
+        results = score_batch([opp for _, opp, _ in chunk])
+        store.save_results(
+            (rec_id, fp, opp.get("age_days"), result) for (rec_id, opp, fp), result in zip(chunk, results)
+        )
+        stats.rescored += len(chunk)
+    stats.reused = store.count() - stats.rescored
+    return stats
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+# Slack Block Kit limits.
+MAX_BLOCKS = 50
+MAX_SECTION_TEXT = 3000
+MAX_HEADER_TEXT = 150
+
+
+def _clip(text: str, limit: int) -> str:
+    return text if len(text) <= limit else text[: limit - 1] + "…"
+
+
+def header(text: str) -> Dict[str, Any]:
+    return {"type": "header", "text": {"type": "plain_text", "text": _clip(text, MAX_HEADER_TEXT)}}
+
+
+def section(text: str) -> Dict[str, Any]:
+    return {"type": "section", "text": {"type": "mrkdwn", "text": _clip(text, MAX_SECTION_TEXT)}}
+
+
+def divider() -> Dict[str, Any]:
+    return {"type": "divider"}
+
+
+def digest_capacity(max_blocks: int = MAX_BLOCKS) -> int:
+    # One header block, one section per message.
+    return max(1, min(max_blocks, MAX_BLOCKS) - 1)
+
+
+def digest(messages: List[str], title: str = "") -> List[Dict[str, Any]]:
+    if len(messages) > digest_capacity():
+        raise ValueError(f"digest holds at most {digest_capacity()} messages, got {len(messages)}")
+    blocks = [header(title or f"{len(messages)} agent updates")]
+    blocks.extend(section(m) for m in messages)
+    return blocks
+
+
+def digests(messages: List[str], max_blocks: int = MAX_BLOCKS) -> List[List[Dict[str, Any]]]:
+    cap = digest_capacity(max_blocks)
+    chunks = [messages[i : i + cap] for i in range(0, len(messages), cap)]
+    return [
+        digest(chunk, f"{len(chunk)} agent updates ({n}/{len(chunks)})" if len(chunks) > 1 else "")
+        for n, chunk in enumerate(chunks, start=1)
+    ]
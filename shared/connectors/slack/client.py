@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import asyncio
+import http.client
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from shared.connectors.slack import blocks
+
+DEFAULT_BASE_URL = "https://slack.com/api"
+
+
+class SlackError(Exception):
+    def __init__(self, error: str, status: int = 200) -> None:
+        super().__init__(f"slack error {error!r} (HTTP {status})")
+        self.error = error
+        self.status = status
+
+
+class RateLimited(SlackError):
+    def __init__(self, retry_after: float) -> None:
+        super().__init__("ratelimited", 429)
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float = 1.0, clock: Callable[[], float] = time.monotonic) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._clock = clock
+        self._updated = clock()
+        self._blocked_until = 0.0
+
+    def _refill(self) -> float:
+        now = self._clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        return now
+
+    def wait_time(self) -> float:
+        now = self._refill()
+        wait = max(0.0, self._blocked_until - now)
+        if self.tokens < 1:
+            wait = max(wait, (1 - self.tokens) / self.rate)
+        return wait
+
+    def take(self) -> bool:
+        if self.wait_time() > 0:
+            return False
+        self.tokens -= 1
+        return True
+
+    def penalize(self, seconds: float) -> None:
+        # The server's Retry-After overrides our own estimate of the budget.
+        now = self._refill()
+        self.tokens = 0.0
+        self._blocked_until = max(self._blocked_until, now + seconds)
+
+
+class SlackClient:
+    """Minimal chat.postMessage client over one keep-alive connection."""
+
+    def __init__(self, token: str, base_url: str = DEFAULT_BASE_URL, timeout: float = 30.0) -> None:
+        parts = urlsplit(base_url)
+        cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self._conn = cls(parts.hostname or "", parts.port, timeout=timeout)
+        self._prefix = parts.path.rstrip("/")
+        self._token = token
+        self._lock = threading.Lock()
+        self.requests_sent = 0
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "SlackClient":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _call(self, method: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        data = json.dumps(body).encode("utf-8")
+        headers = {"Authorization": f"Bearer {self._token}", "Content-Type": "application/json; charset=utf-8"}
+        with self._lock:
+            for attempt in range(2):
+                try:
+                    self._conn.request("POST", f"{self._prefix}/{method}", body=data, headers=headers)
+                    resp = self._conn.getresponse()
+                    raw = resp.read()
+                    break
+                except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                    self._conn.close()
+                    if attempt:
+                        raise
+            self.requests_sent += 1
+
+        if resp.status == 429:
+            raise RateLimited(float(resp.getheader("Retry-After") or 1))
+        parsed = json.loads(raw) if raw else {}
+        if resp.status >= 400 or not parsed.get("ok"):
+            raise SlackError(parsed.get("error") or "http_error", resp.status)
+        return parsed
+
+    def post_message(
+        self,
+        channel: str,
+        text: str,
+        blocks: Optional[List[Dict[str, Any]]] = None,
+        max_retries: int = 3,
+    ) -> Dict[str, Any]:
+        body: Dict[str, Any] = {"channel": channel, "text": text}
+        if blocks:
+            body["blocks"] = blocks
+        for attempt in range(max_retries + 1):
+            try:
+                return self._call("chat.postMessage", body)
+            except RateLimited as e:
+                if attempt >= max_retries:
+                    raise
+                time.sleep(e.retry_after)
+        raise AssertionError("unreachable")
+
+
+@dataclass
+class _Channel:
+    bucket: TokenBucket
+    pending: List[Tuple[str, "asyncio.Future[Dict[str, Any]]"]] = field(default_factory=list)
+    first_at: float = 0.0
+    wake: asyncio.Event = field(default_factory=asyncio.Event)
+    task: Optional["asyncio.Task[None]"] = None
+
+
+class CoalescingPoster:
+    """Queues Slack posts per channel and sends them as digests.
+
+    A channel's queue is flushed when it holds a full digest (the Block Kit
+    block limit) or `window` seconds after its first queued post, whichever is
+    first, and never faster than the channel's token bucket allows. While a
+    flush waits for a token more posts keep joining the next digest, so a
+    burst of N posts costs about N / digest_capacity requests. A single queued
+    post goes out as plain text, unchanged.
+
+    Also usable directly as a slack_post handler for the ActionExecutor; give
+    the slack target enough concurrency (a few hundred) that whole digests can
+    queue up, since each handler call waits for its digest to be sent.
+    """
+
+    def __init__(
+        self,
+        client: SlackClient,
+        window: float = 2.0,
+        rate: float = 1.0,
+        burst: float = 1.0,
+        max_blocks: int = blocks.MAX_BLOCKS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.client = client
+        self.window = window
+        self.rate = rate
+        self.burst = burst
+        self.capacity = blocks.digest_capacity(max_blocks)
+        self._clock = clock
+        self._channels: Dict[str, _Channel] = {}
+        self._flush_now = False
+        self.digests_sent = 0
+        self.messages_sent = 0
+
+    async def __call__(self, action: Dict[str, Any]) -> Dict[str, Any]:
+        payload = action.get("payload") or {}
+        return await self.post(action.get("target") or "", payload.get("message") or "")
+
+    async def post(self, channel: str, message: str) -> Dict[str, Any]:
+        state = self._channels.get(channel)
+        if state is None:
+            state = self._channels[channel] = _Channel(TokenBucket(self.rate, self.burst, self._clock))
+
+        fut: "asyncio.Future[Dict[str, Any]]" = asyncio.get_running_loop().create_future()
+        if not state.pending:
+            state.first_at = self._clock()
+        state.pending.append((message, fut))
+        if len(state.pending) >= self.capacity:
+            state.wake.set()
+        if state.task is None:
+            state.task = asyncio.get_running_loop().create_task(self._drain(channel, state))
+        return await fut
+
+    async def flush(self) -> None:
+        self._flush_now = True
+        try:
+            for state in self._channels.values():
+                state.wake.set()
+            await asyncio.gather(*[s.task for s in self._channels.values() if s.task is not None])
+        finally:
+            self._flush_now = False
+
+    async def _wait_window(self, state: _Channel) -> None:
+        while len(state.pending) < self.capacity and not self._flush_now:
+            remaining = state.first_at + self.window - self._clock()
+            if remaining <= 0:
+                return
+            state.wake.clear()
+            try:
+                await asyncio.wait_for(state.wake.wait(), remaining)
+            except asyncio.TimeoutError:
+                return
+
+    async def _drain(self, channel: str, state: _Channel) -> None:
+        try:
+            await self._wait_window(state)
+            while state.pending:
+                wait = state.bucket.wait_time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                    continue
+                state.bucket.take()
+
+                batch = state.pending[: self.capacity]
+                del state.pending[: self.capacity]
+                try:
+                    resp = await asyncio.to_thread(self._send, channel, [m for m, _ in batch])
+                except RateLimited as e:
+                    state.bucket.penalize(e.retry_after)
+                    state.pending[:0] = batch
+                    continue
+                except Exception as e:
+                    for _, fut in batch:
+                        if not fut.done():
+                            fut.set_exception(e)
+                    continue
+
+                self.digests_sent += 1
+                self.messages_sent += len(batch)
+                result = {"ok": True, "channel": channel, "ts": resp.get("ts"), "digest_size": len(batch)}
+                for _, fut in batch:
+                    if not fut.done():
+                        fut.set_result(result)
+        finally:
+            state.task = None
+
+    def _send(self, channel: str, messages: List[str]) -> Dict[str, Any]:
+        if len(messages) == 1:
+            return self.client.post_message(channel, messages[0], max_retries=0)
+        digest = blocks.digest(messages)
+        return self.client.post_message(channel, f"{len(messages)} agent updates", blocks=digest, max_retries=0)
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import json
+import math
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+from shared.connectors.slack.blocks import MAX_BLOCKS
+
+
+class MockSlack:
+    """Local HTTP stand-in for Slack's chat.postMessage.
+
+    Each channel accepts one post per `min_interval` seconds (Slack's
+    documented "about one message per second" special tier); faster posts get
+    HTTP 429 with a Retry-After header in whole seconds, like the real API.
+    Posts with more than 50 blocks are rejected with invalid_blocks. Accepted
+    posts are kept per channel in `posts`.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = 1.0,
+        latency: float = 0.0,
+        token: str = "xoxb-mock",
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.min_interval = min_interval
+        self.latency = latency
+        self.token = token
+        self.posts: Dict[str, List[Dict[str, Any]]] = {}
+        self.requests = 0
+        self.rate_limited = 0
+        self.connections = 0
+        self._last_post: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def start(self) -> "MockSlack":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "MockSlack":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    def messages(self, channel: str) -> List[str]:
+        # Every original message text that reached the channel, digests unpacked.
+        out: List[str] = []
+        for post in self.posts.get(channel, []):
+            sections = [b["text"]["text"] for b in post.get("blocks") or [] if b.get("type") == "section"]
+            out.extend(sections or [post.get("text", "")])
+        return out
+
+    def _admit(self, channel: str) -> float:
+        # Returns 0 when the post is accepted, otherwise the seconds to wait.
+        now = time.monotonic()
+        with self._lock:
+            last = self._last_post.get(channel)
+            if last is not None and now - last < self.min_interval:
+                self.rate_limited += 1
+                return self.min_interval - (now - last)
+            self._last_post[channel] = now
+            return 0.0
+
+    def _handler_class(self) -> type:
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive
+
+            def setup(self) -> None:
+                super().setup()
+                with mock._lock:
+                    mock.connections += 1
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def _send(self, status: int, body: Any, headers: Optional[Dict[str, str]] = None) -> None:
+                data = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for k, v in (headers or {}).items():
+                    self.send_header(k, v)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                with mock._lock:
+                    mock.requests += 1
+
+                if self.path.rstrip("/") != "/api/chat.postMessage":
+                    return self._send(404, {"ok": False, "error": "unknown_method"})
+                if self.headers.get("Authorization") != f"Bearer {mock.token}":
+                    return self._send(200, {"ok": False, "error": "invalid_auth"})
+
+                body = json.loads(raw or b"{}")
+                channel = body.get("channel")
+                if not channel:
+                    return self._send(200, {"ok": False, "error": "channel_not_found"})
+                if len(body.get("blocks") or []) > MAX_BLOCKS:
+                    return self._send(200, {"ok": False, "error": "invalid_blocks"})
+                if not body.get("text") and not body.get("blocks"):
+                    return self._send(200, {"ok": False, "error": "no_text"})
+
+                wait = mock._admit(channel)
+                if wait:
+                    return self._send(429, {"ok": False, "error": "ratelimited"}, {"Retry-After": str(math.ceil(wait))})
+                if mock.latency:
+                    time.sleep(mock.latency)
+
+                with mock._lock:
+                    posts = mock.posts.setdefault(channel, [])
+                    ts = f"{time.time():.6f}"
+                    posts.append({"ts": ts, "text": body.get("text", ""), "blocks": body.get("blocks")})
+                self._send(200, {"ok": True, "channel": channel, "ts": ts})
+
+        return Handler
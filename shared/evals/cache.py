@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import asdict
+from typing import Any, Dict, Optional
+
+from shared.evals.schemas import EvalResult
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_PATH = os.path.join(REPO_ROOT, ".eval_cache.json")
+
+
+def eval_version(agent: str) -> str:
+    # Imported here: the import scan needs re, which the eval CLI's startup
+    # budget otherwise never pays for.
+    from shared.runtime.versions import files_version, package_files, version_files
+
+    # The agent's sources and prompts, the shared modules they import, the
+    # eval harness itself, and the policy and tracing packages it runs under:
+    # a change to any of them can flip a verdict.
+    harness = [package_files(os.path.join(REPO_ROOT, "shared", pkg)) for pkg in ("evals", "policies", "observability")]
+    return files_version(version_files(agent) + [path for files in harness for path in files])
+
+
+def case_key(line: str) -> str:
+    return hashlib.sha256(line.strip().encode("utf-8")).hexdigest()[:24]
+
+
+class EvalCache:
+    """EvalResults keyed by the hash of their cases.jsonl line, one table per
+    agent, each tagged with the eval_version() it was produced under.
+
+    A table whose version no longer matches is dropped on first use, so only
+    cases of an agent whose code changed, or lines that changed, re-run.
+    With `force`, every case misses but fresh results are still recorded.
+    """
+
+    def __init__(self, path: str = DEFAULT_PATH, force: bool = False) -> None:
+        self.path = path
+        self.force = force
+        self.hits = 0
+        self.misses = 0
+        self._versions: Dict[str, str] = {}
+        self._tables: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self._tables = json.load(f)
+        except (OSError, ValueError):
+            self._tables = {}  # missing or corrupt: start empty
+
+    def _results(self, agent: str) -> Dict[str, Any]:
+        version = self._versions.get(agent)
+        if version is None:
+            version = self._versions[agent] = eval_version(agent)
+        table = self._tables.get(agent)
+        if not isinstance(table, dict) or table.get("version") != version:
+            table = self._tables[agent] = {"version": version, "results": {}}
+            self._dirty = True
+        return table["results"]
+
+    def get(self, agent: str, key: str) -> Optional[EvalResult]:
+        hit = None if self.force else self._results(agent).get(key)
+        if hit is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return EvalResult(**hit)
+
+    def put(self, agent: str, key: str, result: EvalResult) -> None:
+        self._results(agent)[key] = asdict(result)
+        self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        # Write-then-rename so an interrupted run never leaves a torn file.
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._tables, f, separators=(",", ":"))
+        os.replace(tmp, self.path)
+        self._dirty = False
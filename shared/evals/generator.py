@@ -0,0 +1,517 @@
+from __future__ import annotations
+
+import itertools
+import json
+import random
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Synthetic eval / load-test corpora. Every payload is built from labelled
+# vocabularies: each value carries what the agent's heuristics should make of
+# it (ICP industry, timeline bucket, budget status, ...). The oracle turns those
+# labels into expectations in the cases.jsonl format, independently of the
+# agent code, so a generated file works both as a load-test input and as an
+# eval suite that exercises every branch, rare ones included.
+#
+# Rows are generated a chunk at a time, one column at a time, from a
+# Random seeded by (seed, agent, chunk number). The output for a given seed
+# and spec is therefore the same whether it is written by one process or
+# many, and any chunk can be regenerated on its own.
+
+AGENTS = ("lead_qualification", "meeting_followup", "pipeline_risk_inspector")
+CHUNK = 4096
+AS_OF_DATE = "2025-12-18"
+
+# --- lead_qualification vocabularies ---------------------------------------
+
+# industry -> in the ICP
+INDUSTRIES = {
+    "Manufacturing": True,
+    "Healthcare": True,
+    "Financial Services": True,
+    "Retail": True,
+    "Logistics": True,
+    "Software": True,
+    "Food & Beverage": False,
+    "Education": False,
+    "Hospitality": False,
+    "Nonprofit": False,
+}
+# company size band -> (min employees, max employees, fit points)
+EMPLOYEE_BANDS = {
+    "small": (3, 49, 2),
+    "mid": (50, 499, 10),
+    "large": (500, 1999, 15),
+    "enterprise": (2000, 60000, 20),
+}
+# title -> senior buyer
+TITLES = {
+    "CIO": True,
+    "CTO": True,
+    "VP Engineering": True,
+    "Head of Infrastructure": True,
+    "Director of Data": True,
+    "Chief Data Officer": True,
+    "IT Manager": False,
+    "Cloud Architect": False,
+    "Engineer": False,
+    "Owner": False,
+}
+# region -> fit bonus
+REGIONS = {"NA": 5, "EU": 5, "APAC": 0, "LATAM": 0, "MEA": 0}
+# use case -> (migration intent, security gating)
+USE_CASES = {
+    "Migrate legacy ERP to cloud": (True, False),
+    "Data center modernization": (True, False),
+    "Move analytics workloads to cloud": (True, False),
+    "Assess security controls for migration": (True, True),
+    "Cloud migration with EU data residency": (True, True),
+    "Evaluate compliance tooling": (False, True),
+    "Need help with email marketing": (False, False),
+    "": (False, False),
+}
+# budget text -> budget status
+BUDGETS = {
+    "Approved": "approved",
+    "Budget approved": "approved",
+    "Not approved": "not_approved",
+    "Unapproved": "not_approved",
+    "In planning": "planning",
+    "TBD": "planning",
+    "Unknown": "unknown",
+    "": "unknown",
+}
+# timeline text -> timeline bucket
+TIMELINES = {
+    "60 days": "near",
+    "90 days": "near",
+    "this quarter": "near",
+    "next month": "near",
+    "6-9 months": "mid",
+    "6 months": "mid",
+    "2 quarters": "mid",
+    "18 months": "long",
+    "24 months": "long",
+    "next year": "long",
+    "Unknown": "unknown",
+    "No timeline": "unknown",
+}
+# notes -> security gating
+NOTES = {
+    "": False,
+    "Prefers a call after the board meeting": False,
+    "Security review required": True,
+    "Compliance team involved": True,
+}
+SOURCES = ["Web form", "Referral", "Event", "Outbound", "Partner"]
+
+BUDGET_INTENT = {"approved": 15, "planning": 5, "not_approved": 2, "unknown": 3}
+TIMELINE_INTENT = {"near": 10, "mid": 5, "long": 0, "unknown": 2}
+
+# --- pipeline_risk_inspector vocabularies ----------------------------------
+
+# stage -> early stage (aging there is a risk)
+STAGES = {"Discovery": True, "Scoping": True, "Proposal": False, "Negotiation": False, "Commit": False}
+# budget_status -> counts as approved
+BUDGET_STATUSES = {"approved": True, "Approved": True, "yes": True, "planning": False, "not approved": False, "unknown": False, "": False}
+AMOUNTS = [25_000, 80_000, 120_000, 249_999, 250_000, 450_000, 900_000, 1_200_000]
+MEDDPICC = {
+    "metrics": "Reduce cost 20%",
+    "economic_buyer": "CFO",
+    "decision_criteria": "TCO and security posture",
+    "decision_process": "Architecture board then CFO",
+    "paper_process": "MSA redlines with procurement",
+    "identify_pain": "Legacy data center lease ends",
+    "champion": "Director IT",
+}
+
+# --- meeting_followup vocabularies -----------------------------------------
+
+COMPETITORS = ["Azure", "GCP", "Snowflake"]
+REQUIREMENTS = ["EU data residency", "encryption at rest", "SSO"]
+# None of these contain a keyword the meeting agent extracts.
+FILLER = [
+    "Maya: Thanks for making the time today.",
+    "Jordan: Happy to. Can you walk me through the current setup?",
+    "Maya: Most of our reporting still runs on premises in one data center.",
+    "Maya: The nightly batch window keeps getting longer every month.",
+    "Jordan: How many teams depend on those dashboards?",
+    "Maya: Finance, operations and the regional sales leads.",
+    "Jordan: Understood. What happens when a load fails overnight?",
+    "Maya: Someone reruns it by hand and the numbers land late.",
+    "Jordan: That matches what we hear from similar teams.",
+    "Maya: We would like a plan that does not disrupt quarter close.",
+    "Jordan: We can phase it by business unit.",
+    "Maya: That sounds reasonable to me.",
+]
+FIRST_NAMES = ["maya", "jordan", "sam", "priya", "chris", "dana", "alex", "noor"]
+LAST_NAMES = ["chen", "lee", "rivera", "shah", "okafor", "kim", "patel", "novak"]
+
+VOCABULARIES: Dict[str, Dict[str, Any]] = {
+    "industries": INDUSTRIES,
+    "employee_bands": EMPLOYEE_BANDS,
+    "titles": TITLES,
+    "regions": REGIONS,
+    "use_cases": USE_CASES,
+    "budgets": BUDGETS,
+    "timelines": TIMELINES,
+    "notes": NOTES,
+    "stages": STAGES,
+    "budget_statuses": BUDGET_STATUSES,
+}
+
+
+def _uniform(name: str) -> Dict[str, float]:
+    return {k: 1.0 for k in VOCABULARIES[name]}
+
+
+@dataclass(frozen=True)
+class CorpusSpec:
+    """Distributions the generator samples from.
+
+    `weights` maps a vocabulary name (see VOCABULARIES) to relative weights
+    of its values; a vocabulary not listed is sampled uniformly. Rates are
+    per-row probabilities; pii_density is the share of lead notes and of
+    transcript lines that carry an email address and phone number.
+    """
+
+    weights: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    transcript_chars: Tuple[int, int] = (400, 4000)
+    pii_density: float = 0.05
+    max_age_days: int = 180
+    champion_rate: float = 0.5
+    security_review_rate: float = 0.3
+    meddpicc_gap_rate: float = 0.25
+    competitor_rate: float = 0.4
+    requirement_rate: float = 0.4
+    metric_rate: float = 0.5
+
+    def __post_init__(self) -> None:
+        for name, weights in self.weights.items():
+            vocab = VOCABULARIES.get(name)
+            if vocab is None:
+                raise ValueError(f"unknown vocabulary {name!r}; expected one of {sorted(VOCABULARIES)}")
+            unknown = [k for k in weights if k not in vocab]
+            if unknown:
+                raise ValueError(f"{name}: unknown values {unknown}; expected some of {list(vocab)}")
+            if not any(w > 0 for w in weights.values()) or any(w < 0 for w in weights.values()):
+                raise ValueError(f"{name}: weights must be non-negative with at least one positive")
+        lo, hi = self.transcript_chars
+        if not 0 < lo <= hi:
+            raise ValueError(f"transcript_chars must satisfy 0 < min <= max, got {self.transcript_chars}")
+        if not 0.0 <= self.pii_density <= 1.0:
+            raise ValueError(f"pii_density must be in [0, 1], got {self.pii_density}")
+
+    def with_weights(self, name: str, weights: Dict[str, float]) -> "CorpusSpec":
+        return replace(self, weights=dict(self.weights, **{name: weights}))
+
+    def sampler(self, name: str) -> Tuple[List[str], List[float]]:
+        # (values, cumulative weights) for random.choices(cum_weights=...).
+        weights = self.weights.get(name) or _uniform(name)
+        values = [k for k, w in weights.items() if w > 0]
+        return values, list(itertools.accumulate(weights[k] for k in values))
+
+
+def parse_weights(text: str) -> Dict[str, float]:
+    """'Healthcare:3,Retail:1' -> {'Healthcare': 3.0, 'Retail': 1.0}. A value
+    without a weight counts 1; an empty value is written as ':w'."""
+    out: Dict[str, float] = {}
+    for part in text.split(","):
+        value, sep, weight = part.rpartition(":")
+        if not sep:
+            value, weight = weight, "1"
+        out[value.strip()] = float(weight)
+    return out
+
+
+def _column(rng: random.Random, spec: CorpusSpec, name: str, k: int) -> List[str]:
+    values, cum = spec.sampler(name)
+    return rng.choices(values, cum_weights=cum, k=k)
+
+
+def _stochastic_round(rng: random.Random, x: float) -> int:
+    # int(x) or int(x) + 1 with the right odds, so the expected count is x.
+    return int(x + rng.random())
+
+
+def _pii(rng: random.Random) -> str:
+    # One 40-bit draw supplies every field; randrange per field costs more
+    # than the rest of a transcript line.
+    x = rng.getrandbits(40)
+    name = f"{FIRST_NAMES[x & 7]}.{LAST_NAMES[(x >> 3) & 7]}{(x >> 6) % 100}"
+    return f"Reach me at {name}@example.com or 555-{100 + (x >> 13) % 900}-{1000 + (x >> 23) % 9000}"
+
+
+# --- lead_qualification ----------------------------------------------------
+
+
+def lead_expected(
+    icp: bool, band: str, senior: bool, region: str, use_case: str, budget: str, timeline: str, security: bool
+) -> Dict[str, Any]:
+    migration = USE_CASES[use_case][0]
+    fit = (15 if icp else 0) + EMPLOYEE_BANDS[band][2] + (10 if senior else 4) + REGIONS[region]
+    intent = (15 if migration else 0) + BUDGET_INTENT[budget] + TIMELINE_INTENT[timeline]
+    if not use_case:
+        intent = min(intent, 6)
+    score = max(0, min(100, fit + intent))
+
+    if budget == "approved" and timeline == "near" and migration and senior:
+        decision = "qualify" if score >= 75 else "nurture"
+    else:
+        decision = "disqualify" if score < 35 else "nurture"
+
+    reasons = ["ICP fit: fit present" if icp else "ICP fit: outside ICP"]
+    reasons.append("clear use case: use case present" if use_case else "clear use case: missing use case")
+    if senior:
+        reasons.append("senior buyer")
+    if not migration:
+        reasons.append("no migration intent")
+    if security:
+        reasons.append("security as gating item")
+    if timeline == "long":
+        reasons.append("timeline too long")
+
+    return {
+        "decision": decision,
+        "score_range": [score, score],
+        "required_reasons": reasons,
+        "actions": {"slack_post": True, "salesforce_update_allowed": decision == "qualify"},
+    }
+
+
+def _lead_chunk(rng: random.Random, spec: CorpusSpec, start: int, k: int, oracle: bool) -> List[Dict[str, Any]]:
+    industries = _column(rng, spec, "industries", k)
+    bands = _column(rng, spec, "employee_bands", k)
+    titles = _column(rng, spec, "titles", k)
+    regions = _column(rng, spec, "regions", k)
+    use_cases = _column(rng, spec, "use_cases", k)
+    budgets = _column(rng, spec, "budgets", k)
+    timelines = _column(rng, spec, "timelines", k)
+    notes = _column(rng, spec, "notes", k)
+    sources = rng.choices(SOURCES, k=k)
+    randint, rand = rng.randint, rng.random
+    pii = spec.pii_density
+
+    cases = []
+    for j in range(k):
+        band = bands[j]
+        lo, hi, _ = EMPLOYEE_BANDS[band]
+        note = notes[j]
+        if pii and rand() < pii:
+            note = f"{note}. {_pii(rng)}" if note else _pii(rng)
+        lead = {
+            "company": f"Synthetic Co {start + j}",
+            "industry": industries[j],
+            "employees": randint(lo, hi),
+            "region": regions[j],
+            "title": titles[j],
+            "source": sources[j],
+            "use_case": use_cases[j],
+            "budget": budgets[j],
+            "timeline": timelines[j],
+            "notes": note,
+        }
+        expected = (
+            lead_expected(
+                INDUSTRIES[industries[j]],
+                band,
+                TITLES[titles[j]],
+                regions[j],
+                use_cases[j],
+                BUDGETS[budgets[j]],
+                TIMELINES[timelines[j]],
+                USE_CASES[use_cases[j]][1] or NOTES[notes[j]],
+            )
+            if oracle
+            else {}
+        )
+        cases.append({"id": f"LQ-GEN-{start + j:09d}", "input": {"lead": lead}, "expected": expected})
+    return cases
+
+
+# --- pipeline_risk_inspector -----------------------------------------------
+
+# (flag, points) in the order the agent applies them
+RISK_RULES = [
+    ("stage_age_risk", 10),
+    ("no_champion", 10),
+    ("security_gating", 8),
+    ("budget_risk", 8),
+    ("missing_economic_buyer", 8),
+    ("missing_paper_process", 7),
+    ("missing_metrics", 7),
+]
+
+
+def pipeline_expected(flags: List[str]) -> Dict[str, Any]:
+    points = dict(RISK_RULES)
+    score = max(0, min(100, 50 + sum(points[f] for f in flags)))
+    return {
+        # The oracle knows every flag, in the agent's order; checking the
+        # exact list catches a swap between two rules worth the same points.
+        "flags_exact": flags,
+        "risk_score_range": [score, score],
+        # The agent pads explanations to 3 lines, but a deal with no flag at all
+        # gets only its 2 padding lines.
+        "explainability": {"reasons_min": 3 if flags else 2, "evidence_min": 2},
+    }
+
+
+def _pipeline_chunk(rng: random.Random, spec: CorpusSpec, start: int, k: int, oracle: bool) -> List[Dict[str, Any]]:
+    stages = _column(rng, spec, "stages", k)
+    budgets = _column(rng, spec, "budget_statuses", k)
+    amounts = rng.choices(AMOUNTS, k=k)
+    randint, rand = rng.randint, rng.random
+    max_age = spec.max_age_days
+
+    cases = []
+    for j in range(k):
+        age = randint(0, max_age)
+        champion = rand() < spec.champion_rate
+        security = rand() < spec.security_review_rate
+        meddpicc = {f: ("" if rand() < spec.meddpicc_gap_rate else v) for f, v in MEDDPICC.items()}
+        opp = {
+            "id": f"006GEN{start + j:010d}",
+            "stage": stages[j],
+            "amount": amounts[j],
+            "age_days": age,
+            "close_date": f"2026-{randint(1, 12):02d}-{randint(1, 28):02d}",
+            "champion_confirmed": champion,
+            "security_review": security,
+            "budget_status": budgets[j],
+            "meddpicc": meddpicc,
+        }
+        expected: Dict[str, Any] = {}
+        if oracle:
+            hit = {
+                "stage_age_risk": STAGES[stages[j]] and age >= 45,
+                "no_champion": amounts[j] >= 250_000 and not champion,
+                "security_gating": security,
+                "budget_risk": not BUDGET_STATUSES[budgets[j]],
+                "missing_economic_buyer": not meddpicc["economic_buyer"],
+                "missing_paper_process": not meddpicc["paper_process"],
+                "missing_metrics": not meddpicc["metrics"],
+            }
+            expected = pipeline_expected([flag for flag, _ in RISK_RULES if hit[flag]])
+        cases.append({"id": f"PR-GEN-{start + j:09d}", "input": {"as_of_date": AS_OF_DATE, "opportunity": opp}, "expected": expected})
+    return cases
+
+
+# --- meeting_followup ------------------------------------------------------
+
+FILLER_CHARS = sum(len(line) + 1 for line in FILLER) / len(FILLER)
+
+
+def _meeting_chunk(rng: random.Random, spec: CorpusSpec, start: int, k: int, oracle: bool) -> List[Dict[str, Any]]:
+    stages = _column(rng, spec, "stages", k)
+    lo, hi = spec.transcript_chars
+    randint, rand, randrange = rng.randint, rng.random, rng.randrange
+    choices, pii = rng.choices, spec.pii_density
+
+    cases = []
+    for j in range(k):
+        special: List[str] = []
+        competitors = [c for c in COMPETITORS if rand() < spec.competitor_rate]
+        requirements = [r for r in REQUIREMENTS if rand() < spec.requirement_rate]
+        metrics = [f"{randint(5, 90)}%"] if rand() < spec.metric_rate else []
+        for c in competitors:
+            special.append(f"Maya: We are also evaluating {c} for this.")
+        for r in requirements:
+            special.append(f"Maya: We need {r} before go-live.")
+        for m in metrics:
+            special.append(f"Maya: Success means {m} lower run costs by year end.")
+
+        target = randint(lo, hi)
+        lines = choices(FILLER, k=max(1, int(target / FILLER_CHARS)))
+        for _ in range(_stochastic_round(rng, len(lines) * pii)):
+            lines[randrange(len(lines))] = f"Maya: {_pii(rng)}."
+        for line in special:
+            lines.insert(randrange(len(lines) + 1), line)
+
+        expected: Dict[str, Any] = {}
+        if oracle:
+            extractions: Dict[str, List[str]] = {}
+            if metrics:
+                extractions["metrics_contains"] = metrics
+            if competitors:
+                extractions["competition_contains"] = competitors
+            if requirements:
+                extractions["requirements_contains"] = requirements
+            expected = {
+                "extractions": extractions,
+                "guardrails": {"salesforce_update_requires_approval": True},
+                "slack": {"recap_present": True},
+            }
+        opp = {"id": f"006GEN{start + j:010d}", "stage": stages[j]}
+        cases.append({"id": f"MF-GEN-{start + j:09d}", "input": {"opportunity": opp, "transcript": "\n".join(lines)}, "expected": expected})
+    return cases
+
+
+CHUNK_BUILDERS = {
+    "lead_qualification": _lead_chunk,
+    "meeting_followup": _meeting_chunk,
+    "pipeline_risk_inspector": _pipeline_chunk,
+}
+
+
+def chunk_cases(agent: str, spec: CorpusSpec, seed: int, index: int, count: int, oracle: bool = True) -> List[Dict[str, Any]]:
+    """Cases index*CHUNK .. index*CHUNK+count-1 of the corpus for (agent, spec, seed)."""
+    build = CHUNK_BUILDERS.get(agent)
+    if build is None:
+        raise KeyError(f"unknown agent {agent!r}; expected one of {list(AGENTS)}")
+    # A string seed is hashed with SHA-512, so it is stable across runs and platforms.
+    rng = random.Random(f"{seed}/{agent}/{index}")
+    return build(rng, spec, index * CHUNK, count, oracle)
+
+
+def chunk_text(agent: str, spec: CorpusSpec, seed: int, index: int, count: int, oracle: bool = True) -> str:
+    # The vocabularies are ASCII, and the ASCII-only encoder is the faster one.
+    dumps = json.JSONEncoder(separators=(",", ":")).encode
+    return "".join(dumps(case) + "\n" for case in chunk_cases(agent, spec, seed, index, count, oracle))
+
+
+def _chunks(n: int) -> Iterator[Tuple[int, int]]:
+    for index in range((n + CHUNK - 1) // CHUNK):
+        yield index, min(CHUNK, n - index * CHUNK)
+
+
+def generate_cases(agent: str, n: int, spec: Optional[CorpusSpec] = None, seed: int = 7, oracle: bool = True) -> Iterator[Dict[str, Any]]:
+    spec = spec or CorpusSpec()
+    for index, count in _chunks(n):
+        yield from chunk_cases(agent, spec, seed, index, count, oracle)
+
+
+def write_jsonl(
+    path: str,
+    agent: str,
+    n: int,
+    spec: Optional[CorpusSpec] = None,
+    seed: int = 7,
+    oracle: bool = True,
+    workers: int = 1,
+) -> int:
+    """Stream n cases to `path`; returns the number of bytes written. With
+    workers > 1 chunks are generated on a process pool and written in order,
+    so the file is identical for any number of workers."""
+    spec = spec or CorpusSpec()
+    written = 0
+    with open(path, "w", encoding="utf-8") as f:
+        if workers <= 1:
+            for index, count in _chunks(n):
+                written += f.write(chunk_text(agent, spec, seed, index, count, oracle))
+            return written
+
+        # Imported here, as in the eval runner: the pool is only for large corpora.
+        from concurrent.futures import ProcessPoolExecutor
+
+        # At most 2 * workers chunks in flight, so memory stays bounded however
+        # far the pool gets ahead of the disk.
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending: List[Any] = []
+            for index, count in _chunks(n):
+                pending.append(pool.submit(chunk_text, agent, spec, seed, index, count, oracle))
+                if len(pending) >= workers * 2:
+                    written += f.write(pending.pop(0).result())
+            for future in pending:
+                written += f.write(future.result())
+    return written
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, List, Tuple, Callable
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
 
+from shared.evals.cache import EvalCache, case_key
 from shared.evals.schemas import EvalCase, EvalResult
+from shared.observability import logging as tracing
 from shared.evals.metrics import (
     _get,
     assert_contains,
@@ -15,24 +18,53 @@ from shared.evals.metrics import (
     assert_range,
 )
 
+if TYPE_CHECKING:
+    from concurrent.futures import Future
 
-def load_jsonl(path: str) -> List[EvalCase]:
-    cases: List[EvalCase] = []
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    try:
+        i, n = (int(x) for x in spec.split("/"))
+    except ValueError:
+        raise ValueError(f"shard must look like i/n, got {spec!r}")
+    if n < 1 or not 0 <= i < n:
+        raise ValueError(f"shard index must satisfy 0 <= i < n, got {spec!r}")
+    return i, n
+
+
+def iter_lines(path: str, shard: Optional[Tuple[int, int]] = None) -> Iterator[str]:
+    # Shards are assigned round-robin by case position (ignoring blank lines),
+    # so the split is deterministic and balanced for any file.
+    index = 0
     with open(path, "r", encoding="utf-8") as f:
-        for line_no, line in enumerate(f, start=1):
+        for line in f:
             line = line.strip()
             if not line:
                 continue
-            obj = json.loads(line)
-            cases.append(
-                EvalCase(
-                    id=obj["id"],
-                    input=obj["input"],
-                    expected=obj["expected"],
-                    notes=obj.get("notes"),
-                )
-            )
-    return cases
+            pos = index
+            index += 1
+            if shard is not None and pos % shard[1] != shard[0]:
+                continue
+            yield line
+
+
+def parse_case(line: str) -> EvalCase:
+    obj = json.loads(line)
+    return EvalCase(
+        id=obj["id"],
+        input=obj["input"],
+        expected=obj["expected"],
+        notes=obj.get("notes"),
+    )
+
+
+def iter_jsonl(path: str, shard: Optional[Tuple[int, int]] = None) -> Iterator[EvalCase]:
+    for line in iter_lines(path, shard):
+        yield parse_case(line)
+
+
+def load_jsonl(path: str) -> List[EvalCase]:
+    return list(iter_jsonl(path))
 
 
 def _evaluate_lead_qualification(expected: Dict[str, Any], actual: Dict[str, Any]) -> List[str]:
@@ -104,6 +136,11 @@ def _evaluate_pipeline_risk(expected: Dict[str, Any], actual: Dict[str, Any]) ->
         if msg:
             failures.append(msg)
 
+    if "flags_exact" in expected:
+        msg = assert_equals(actual.get("flags"), expected["flags_exact"], "flags")
+        if msg:
+            failures.append(msg)
+
     if "explainability" in expected:
         exp = expected["explainability"]
         explanation = actual.get("explanation", [])
@@ -111,6 +148,10 @@ def _evaluate_pipeline_risk(expected: Dict[str, Any], actual: Dict[str, Any]) ->
             msg = assert_min_count(explanation, exp["reasons_min"], "explanation")
             if msg:
                 failures.append(msg)
+        if "evidence_min" in exp:
+            msg = assert_min_count(actual.get("evidence", []), exp["evidence_min"], "evidence")
+            if msg:
+                failures.append(msg)
 
     return failures
 
@@ -133,6 +174,20 @@ def evaluate_case(agent: str, case: EvalCase, actual: Dict[str, Any]) -> EvalRes
     )
 
 
+def run_case(
+    agent: str,
+    case: EvalCase,
+    predict_fn: Callable[[Dict[str, Any]], Dict[str, Any]],
+) -> EvalResult:
+    with tracing.span("eval.case", agent=agent, case_id=case.id):
+        tracing.stage("predict")
+        actual = predict_fn(case.input)
+        tracing.stage("assert")
+        result = evaluate_case(agent, case, actual)
+        tracing.count("failures", len(result.failures))
+    return result
+
+
 def run_eval_file(
     agent: str,
     eval_file_path: str,
@@ -143,8 +198,7 @@ def run_eval_file(
     results: List[EvalResult] = []
 
     for case in cases:
-        actual = predict_fn(case.input)
-        result = evaluate_case(agent, case, actual)
+        result = run_case(agent, case, predict_fn)
         results.append(result)
         if result.passed:
             passed += 1
@@ -153,3 +207,118 @@ def run_eval_file(
 
     return passed, failed, results
 
+
+def _eval_chunk(
+    agent: str,
+    predict_fn: Callable[[Dict[str, Any]], Dict[str, Any]],
+    cases: List[EvalCase],
+) -> List[EvalResult]:
+    return [run_case(agent, case, predict_fn) for case in cases]
+
+
+# (case to run, cached result, cache key): exactly one of case/result is set.
+Entry = Tuple[Optional[EvalCase], Optional[EvalResult], Optional[str]]
+
+
+def _cached_entries(agent: str, path: str, shard: Optional[Tuple[int, int]], cache: EvalCache) -> Iterator[Entry]:
+    # Cached cases are never parsed; only lines missing from the cache run.
+    for line in iter_lines(path, shard):
+        key = case_key(line)
+        hit = cache.get(agent, key)
+        yield (None if hit else parse_case(line)), hit, key
+
+
+def iter_eval_results(
+    agent: str,
+    eval_file_path: str,
+    predict_fn: Callable[[Dict[str, Any]], Dict[str, Any]],
+    workers: int = 1,
+    shard: Optional[Tuple[int, int]] = None,
+    chunk_size: int = 256,
+    cache: Optional[EvalCache] = None,
+) -> Iterator[EvalResult]:
+    if cache is None:
+        entries: Iterator[Entry] = ((case, None, None) for case in iter_jsonl(eval_file_path, shard))
+    else:
+        entries = _cached_entries(agent, eval_file_path, shard, cache)
+
+    if workers <= 1:
+        for case, hit, key in entries:
+            if hit is None:
+                hit = run_case(agent, case, predict_fn)
+                if key is not None:
+                    cache.put(agent, key, hit)
+            yield hit
+        return
+
+    for result, key in _iter_parallel(agent, entries, predict_fn, workers, chunk_size):
+        if key is not None:
+            cache.put(agent, key, result)
+        yield result
+
+
+def _iter_parallel(
+    agent: str,
+    entries: Iterator[Entry],
+    predict_fn: Callable[[Dict[str, Any]], Dict[str, Any]],
+    workers: int,
+    chunk_size: int,
+) -> Iterator[Tuple[EvalResult, Optional[str]]]:
+    """Yields (result, key) in file order; key is set only for results that
+    were just computed and should be cached."""
+    # predict_fn must be picklable (a module-level function such as an agent's run).
+    # At most 2 chunks per worker are in flight, which keeps memory bounded and
+    # lets results be yielded in file order as their chunk completes. Only
+    # cases that must run count toward a chunk; cached results ride along so
+    # they come out in their original position.
+    # Imported here: multiprocessing roughly doubles the serial eval's startup.
+    from concurrent.futures import ProcessPoolExecutor
+
+    def drain(chunk: List[Entry], future: Optional[Future]) -> Iterator[Tuple[EvalResult, Optional[str]]]:
+        fresh = iter(future.result() if future is not None else ())
+        for _, hit, key in chunk:
+            yield (hit, None) if hit is not None else (next(fresh), key)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: Deque[Tuple[List[Entry], Optional[Future]]] = deque()
+        chunk: List[Entry] = []
+        to_run: List[EvalCase] = []
+        for entry in entries:
+            if entry[1] is not None and not pending and not chunk:
+                yield entry[1], None
+                continue
+            chunk.append(entry)
+            if entry[0] is not None:
+                to_run.append(entry[0])
+            # Long runs of cached results also close a chunk, so they are not
+            # all held back behind one slow case.
+            if len(to_run) >= chunk_size or len(chunk) >= 4 * chunk_size:
+                pending.append((chunk, pool.submit(_eval_chunk, agent, predict_fn, to_run) if to_run else None))
+                chunk, to_run = [], []
+                if len(pending) >= workers * 2:
+                    yield from drain(*pending.popleft())
+        if chunk:
+            pending.append((chunk, pool.submit(_eval_chunk, agent, predict_fn, to_run) if to_run else None))
+        while pending:
+            yield from drain(*pending.popleft())
+
+
+def run_eval_file_parallel(
+    agent: str,
+    eval_file_path: str,
+    predict_fn: Callable[[Dict[str, Any]], Dict[str, Any]],
+    workers: int = 1,
+    shard: Optional[Tuple[int, int]] = None,
+    cache: Optional[EvalCache] = None,
+) -> Tuple[int, int, List[EvalResult]]:
+    passed = failed = 0
+    results: List[EvalResult] = []
+
+    for result in iter_eval_results(agent, eval_file_path, predict_fn, workers=workers, shard=shard, cache=cache):
+        results.append(result)
+        if result.passed:
+            passed += 1
+        else:
+            failed += 1
+
+    return passed, failed, results
@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import functools
+import itertools
+import json
+import os
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, TypeVar
+
+# Tracing for agent runs.
+#
+#   @traced("lead_qualification.run")     root or child span around a function
+#   stage("scoring")                       sequential child span of the current span
+#   count("reasons", 3)                    counter on the innermost open span
+#   with span("eval.case", case_id=...):   explicit nested span
+#
+# Nothing is recorded until configure() installs a Tracer. Until then @traced
+# functions are the plain functions and stage()/count() are a global lookup
+# and a return, so instrumented code pays close to nothing
+# (scripts/bench_tracing.py measures it). Sampling is decided once
+# per trace at its root span; an unsampled trace costs the same as disabled.
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_tracer: Optional["Tracer"] = None
+_traced: List[Tuple[Dict[str, Any], str, Callable[..., Any], Callable[..., Any]]] = []
+_current: ContextVar[Optional["_Span"]] = ContextVar("gtm_span", default=None)
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "trace_id", "span_id", "parent_id", "attrs", "counters", "start", "_stage", "_token")
+
+    def __init__(self, tracer: "Tracer", name: str, parent: Optional["_Span"], attrs: Dict[str, Any]) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.span_id = next(tracer._ids)
+        self.trace_id = parent.trace_id if parent is not None else self.span_id
+        self.parent_id = parent.span_id if parent is not None else None
+        self.attrs = attrs
+        self.counters: Dict[str, float] = {}
+        self.start = 0
+        self._stage: Optional[_Span] = None
+        self._token: Any = None
+
+    def __enter__(self) -> "_Span":
+        self._token = _current.set(self)
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        end = time.perf_counter_ns()
+        if self._stage is not None:
+            self._stage._finish(end, None)
+            self._stage = None
+        _current.reset(self._token)
+        self._finish(end, exc)
+
+    def _finish(self, end: int, exc: Any) -> None:
+        record: Dict[str, Any] = {
+            "trace": self.trace_id,
+            "span": self.span_id,
+            "parent": self.parent_id,
+            "name": self.name,
+            "dur_ms": (end - self.start) / 1e6,
+        }
+        if self.attrs:
+            record["attrs"] = self.attrs
+        if self.counters:
+            record["counters"] = self.counters
+        if exc is not None:
+            record["error"] = f"{type(exc).__name__}: {exc}"
+        self.tracer._emit(record)
+
+    def stage(self, name: str) -> None:
+        now = time.perf_counter_ns()
+        if self._stage is not None:
+            self._stage._finish(now, None)
+        child = _Span(self.tracer, f"{self.name}.{name}", self, {})
+        child.start = now
+        self._stage = child
+
+    def count(self, key: str, n: float = 1) -> None:
+        target = self._stage or self
+        target.counters[key] = target.counters.get(key, 0) + n
+
+
+class _Unsampled:
+    """Marks a trace that lost the sampling draw so its descendants stay silent."""
+
+    __slots__ = ("_token",)
+
+    def __enter__(self) -> None:
+        self._token = _current.set(_SKIP)  # type: ignore[arg-type]
+
+    def __exit__(self, *exc: Any) -> None:
+        _current.reset(self._token)
+
+
+class _Noop:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+
+_NOOP = _Noop()
+_SKIP = object()
+
+
+class Tracer:
+    """Collects finished spans in a bounded ring buffer.
+
+    With a `path`, a daemon thread appends buffered spans to that file as
+    JSONL every `flush_interval` seconds (or sooner when the buffer is half
+    full) and on close(). If the writer falls behind, the oldest spans are
+    overwritten and counted in `dropped` rather than blocking the agents.
+    Without a path the buffer simply holds the most recent spans.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        sample_rate: float = 1.0,
+        buffer_size: int = 65536,
+        flush_interval: float = 0.5,
+        seed: Optional[int] = None,
+    ) -> None:
+        # Only paid for once tracing is switched on, not by every CLI cold start.
+        import random
+        import threading
+
+        self.path = path
+        self.sample_rate = sample_rate
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.emitted = 0
+        self.written = 0
+        self._buffer: Deque[Dict[str, Any]] = deque(maxlen=buffer_size)
+        self._ids = itertools.count(1)
+        self._rng = random.Random(seed)
+        self._pid = os.getpid()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._write_lock = threading.Lock()
+        self._writer: Optional[Any] = None
+        if path:
+            self._writer = threading.Thread(target=self._run_writer, name="gtm-trace-writer", daemon=True)
+            self._writer.start()
+
+    @property
+    def dropped(self) -> int:
+        return max(0, self.emitted - self.written - len(self._buffer)) if self.path else 0
+
+    def sampled(self) -> bool:
+        return self.sample_rate >= 1.0 or self._rng.random() < self.sample_rate
+
+    def _emit(self, record: Dict[str, Any]) -> None:
+        if os.getpid() != self._pid:
+            return  # a forked worker inherited the tracer but not its writer thread
+        record["pid"] = self._pid
+        self._buffer.append(record)
+        self.emitted += 1
+        if self._writer is not None and len(self._buffer) * 2 >= self.buffer_size:
+            self._wake.set()
+
+    def records(self) -> List[Dict[str, Any]]:
+        return list(self._buffer)
+
+    def flush(self) -> int:
+        if not self.path:
+            return 0
+        with self._write_lock:
+            lines: List[str] = []
+            while True:
+                try:
+                    lines.append(json.dumps(self._buffer.popleft(), default=str))
+                except IndexError:
+                    break
+            if lines:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write("\n".join(lines))
+                    f.write("\n")
+                self.written += len(lines)
+            return len(lines)
+
+    def _run_writer(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def close(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
+        self.flush()
+
+
+def configure(
+    path: Optional[str] = None,
+    sample_rate: float = 1.0,
+    buffer_size: int = 65536,
+    flush_interval: float = 0.5,
+    seed: Optional[int] = None,
+) -> Tracer:
+    global _tracer
+    disable()
+    _tracer = Tracer(path, sample_rate, buffer_size, flush_interval, seed)
+    _rebind(enabled=True)
+    return _tracer
+
+
+def configure_from_env() -> Optional[Tracer]:
+    # GTM_TRACE=<jsonl path> turns tracing on for CLI runs; GTM_TRACE_SAMPLE sets the rate.
+    path = os.environ.get("GTM_TRACE")
+    if not path:
+        return None
+    return configure(path, sample_rate=float(os.environ.get("GTM_TRACE_SAMPLE") or 1.0))
+
+
+def disable() -> None:
+    global _tracer
+    tracer, _tracer = _tracer, None
+    if tracer is not None:
+        _rebind(enabled=False)
+        tracer.close()
+
+
+def get_tracer() -> Optional[Tracer]:
+    return _tracer
+
+
+def span(name: str, **attrs: Any) -> Any:
+    tracer = _tracer
+    if tracer is None:
+        return _NOOP
+    parent = _current.get()
+    if parent is _SKIP:
+        return _NOOP
+    if parent is None:
+        if not tracer.sampled():
+            return _Unsampled()
+    elif parent._stage is not None:
+        parent = parent._stage  # nest under the open stage, e.g. eval.case.predict
+    return _Span(tracer, name, parent, attrs)
+
+
+def traced(name: str) -> Callable[[F], F]:
+    """Span around a module-level function.
+
+    The decorated name stays bound to the plain function while tracing is
+    off; configure() rebinds it to the tracing wrapper and disable() puts the
+    plain one back, so a disabled run pays no wrapper call at all. Look the
+    function up (e.g. via the registry) after configure() to get it traced.
+    """
+
+    def decorate(fn: F) -> F:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(name):
+                return fn(*args, **kwargs)
+
+        _traced.append((fn.__globals__, fn.__name__, fn, wrapper))
+        return (wrapper if _tracer is not None else fn)  # type: ignore[return-value]
+
+    return decorate
+
+
+def _rebind(enabled: bool) -> None:
+    for namespace, attr, plain, wrapper in _traced:
+        old, new = (plain, wrapper) if enabled else (wrapper, plain)
+        if namespace.get(attr) is old:
+            namespace[attr] = new
+
+
+def stage(name: str) -> None:
+    if _tracer is None:
+        return
+    current = _current.get()
+    if current is not None and current is not _SKIP:
+        current.stage(name)
+
+
+def count(key: str, n: float = 1) -> None:
+    if _tracer is None:
+        return
+    current = _current.get()
+    if current is not None and current is not _SKIP:
+        current.count(key, n)
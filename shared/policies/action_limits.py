@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import math
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+@dataclass(frozen=True)
+class LimitRule:
+    limit: int
+    window: float  # seconds
+
+
+# Per action risk level. An action without a known risk gets the strictest rule.
+DEFAULT_LIMITS: Dict[str, LimitRule] = {
+    "low": LimitRule(limit=300, window=60.0),
+    "med": LimitRule(limit=30, window=60.0),
+    "high": LimitRule(limit=5, window=60.0),
+}
+
+RECORD_KEYS = ("record_id", "opportunity_id", "lead_id", "account_id")
+
+
+@dataclass
+class LimitDecision:
+    allowed: bool
+    key: str
+    count: float  # estimated actions in the window, including this one if allowed
+    limit: int
+    retry_after: float = 0.0
+
+
+def limit_key(action: Dict[str, Any]) -> str:
+    # (action type, target, record or account). Actions without a record id,
+    # such as Slack posts, share one counter per target.
+    payload = action.get("payload")
+    if not isinstance(payload, dict):
+        payload = {}
+    record = next((str(payload[k]) for k in RECORD_KEYS if payload.get(k)), "*")
+    return f"{action.get('type') or ''}|{action.get('target') or ''}|{record}"
+
+
+class ActionLimiter:
+    """Sliding-window action counters shared by every process that opens the same sqlite file.
+
+    Each key keeps two fixed-window counts (current and previous); the
+    sliding count is the current count plus the previous one weighted by how
+    much of it still overlaps the window. That is O(1) time and space per key
+    and never lets more than `limit` actions through in any single fixed
+    window. Checks run inside BEGIN IMMEDIATE transactions, so concurrent
+    processes serialize on the store and cannot both take the last slot.
+    Use check_many() for a batch: one transaction covers all its actions.
+    A limiter may be called from any thread (the executor checks from a
+    worker thread so a busy store never blocks its event loop); calls on one
+    limiter are serialized.
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        limits: Optional[Dict[str, LimitRule]] = None,
+        clock: Callable[[], float] = time.time,
+        busy_timeout: float = 30.0,
+    ) -> None:
+        self.limits = dict(DEFAULT_LIMITS if limits is None else limits)
+        self._strictest = min(self.limits.values(), key=lambda r: r.limit / r.window)
+        self._clock = clock
+        self.db = sqlite3.connect(path, timeout=busy_timeout, isolation_level=None, check_same_thread=False)
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            self.db.execute("PRAGMA journal_mode=WAL")
+            self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS action_windows (
+                key TEXT PRIMARY KEY, window_start REAL NOT NULL, curr INTEGER NOT NULL, prev INTEGER NOT NULL
+            )
+            """
+        )
+
+    def close(self) -> None:
+        self.db.close()
+
+    def __enter__(self) -> "ActionLimiter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def rule_for(self, action: Dict[str, Any]) -> LimitRule:
+        # A risk that is not a level name (missing, or a list or object from a
+        # malformed payload) is unknown, so it gets the strictest rule.
+        risk = action.get("risk")
+        return self.limits.get(risk, self._strictest) if isinstance(risk, str) else self._strictest
+
+    def _decide(self, key: str, rule: LimitRule, now: float, row: Optional[Tuple[float, int, int]]) -> Tuple[LimitDecision, Tuple[float, int, int]]:
+        start = math.floor(now / rule.window) * rule.window
+        if row is None:
+            curr, prev = 0, 0
+        else:
+            row_start, curr, prev = row
+            if row_start != start:
+                # Roll forward: the old current window becomes previous, or is
+                # forgotten if more than one full window has passed.
+                prev = curr if start - row_start == rule.window else 0
+                curr = 0
+
+        overlap = 1.0 - (now - start) / rule.window
+        estimate = prev * overlap + curr
+        if estimate + 1 <= rule.limit:
+            curr += 1
+            return LimitDecision(True, key, estimate + 1, rule.limit), (start, curr, prev)
+
+        # Earliest time the estimate drops enough: the previous window's
+        # weight decays linearly, and at the next boundary only curr remains.
+        if prev and curr + 1 <= rule.limit:
+            retry_after = (estimate + 1 - rule.limit) / prev * rule.window
+        else:
+            retry_after = start + rule.window - now
+        return LimitDecision(False, key, estimate, rule.limit, max(0.0, retry_after)), (start, curr, prev)
+
+    def check_many(self, actions: Sequence[Dict[str, Any]]) -> List[LimitDecision]:
+        """Count each allowed action against its key; denied actions are not counted."""
+        if not actions:
+            return []
+        now = self._clock()
+        with self._lock:
+            return self._check_many(actions, now)
+
+    def _check_many(self, actions: Sequence[Dict[str, Any]], now: float) -> List[LimitDecision]:
+        decisions: List[LimitDecision] = []
+        state: Dict[str, Tuple[float, int, int]] = {}
+
+        self.db.execute("BEGIN IMMEDIATE")
+        try:
+            for action in actions:
+                key = limit_key(action)
+                if key not in state:
+                    row = self.db.execute(
+                        "SELECT window_start, curr, prev FROM action_windows WHERE key = ?", (key,)
+                    ).fetchone()
+                    if row is not None:
+                        state[key] = row
+                decision, state[key] = self._decide(key, self.rule_for(action), now, state.get(key))
+                decisions.append(decision)
+            self.db.executemany(
+                "INSERT OR REPLACE INTO action_windows (key, window_start, curr, prev) VALUES (?, ?, ?, ?)",
+                [(key, *row) for key, row in state.items()],
+            )
+            self.db.execute("COMMIT")
+        except BaseException:
+            self.db.execute("ROLLBACK")
+            raise
+        return decisions
+
+    def check(self, action: Dict[str, Any]) -> LimitDecision:
+        return self.check_many([action])[0]
+
+    def prune(self, older_than: Optional[float] = None) -> int:
+        # Keys idle for two windows carry no state; drop them to bound the table.
+        longest = max(r.window for r in self.limits.values())
+        cutoff = self._clock() - (older_than if older_than is not None else 2 * longest)
+        with self._lock:
+            return self.db.execute("DELETE FROM action_windows WHERE window_start < ?", (cutoff,)).rowcount
@@ -0,0 +1,339 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from shared.policies.redaction import pii_spans
+
+DEFAULT_RULES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "guardrails.json")
+
+# Rule format (see guardrails.json):
+#   id           unique name, reported with every violation
+#   when         action keys that select the rule; a value or a list of values.
+#                "agent" matches the producing agent passed to validate().
+#   fields       dotted path from the action root -> constraints:
+#                required, type (str/int/float/number/bool/dict/list), enum,
+#                pattern, min_len, max_len, min, max, no_pii
+#   agents       only these agents may emit matching actions
+#   approval     "required": matching actions must have requires_approval=true
+#   min_confidence
+#                the run's confidence must reach this value
+# A ruleset's "unmatched" is "deny" (actions no rule selects are violations)
+# or "allow".
+
+TYPES: Dict[str, Tuple[type, ...]] = {
+    "str": (str,),
+    "int": (int,),
+    "float": (float,),
+    "number": (int, float),
+    "bool": (bool,),
+    "dict": (dict,),
+    "list": (list,),
+}
+CONSTRAINTS = {"required", "type", "enum", "pattern", "min_len", "max_len", "min", "max", "no_pii"}
+RULE_KEYS = {"id", "description", "when", "fields", "agents", "approval", "min_confidence"}
+
+_MISSING = object()
+
+# Values that can be looked up in an enum or `when` set. Anything else (a
+# dict or list an agent put where a scalar belongs) matches nothing rather
+# than raising TypeError mid-validation.
+SCALARS = (str, int, float, bool, type(None))
+
+
+class RuleError(ValueError):
+    pass
+
+
+def _scalars(where: str, values: Any) -> Set[Any]:
+    # Rule values end up in sets; a nested list or object is a broken rule
+    # file, not a TypeError at compile time.
+    values = values if isinstance(values, list) else [values]
+    bad = [v for v in values if not isinstance(v, SCALARS)]
+    if bad:
+        raise RuleError(f"{where}: expected strings, numbers or null, got {bad[0]!r}")
+    return set(values)
+
+
+# Violations that gate() resolves by routing the action to a human instead of
+# blocking it outright.
+APPROVABLE = {"APPROVAL_REQUIRED", "LOW_CONFIDENCE"}
+
+
+@dataclass
+class Violation:
+    index: int
+    rule: str
+    code: str
+    field: Optional[str]
+    message: str
+
+
+# A compiled check takes (action, agent, confidence) and returns a list of
+# (code, field, message) tuples, empty when the action passes.
+Check = Callable[[Dict[str, Any], Optional[str], Optional[float]], List[Tuple[str, Optional[str], str]]]
+
+
+def _lookup(action: Dict[str, Any], path: Tuple[str, ...]) -> Any:
+    value: Any = action
+    for part in path:
+        if not isinstance(value, dict):
+            return _MISSING
+        value = value.get(part, _MISSING)
+        if value is _MISSING:
+            return _MISSING
+    return value
+
+
+def _compile_field(path_str: str, spec: Dict[str, Any]) -> Check:
+    unknown = set(spec) - CONSTRAINTS
+    if unknown:
+        raise RuleError(f"{path_str}: unknown constraint(s) {sorted(unknown)}")
+    path = tuple(path_str.split("."))
+    required = bool(spec.get("required"))
+    types = TYPES.get(spec["type"]) if "type" in spec and isinstance(spec["type"], str) else None
+    if "type" in spec and types is None:
+        raise RuleError(f"{path_str}: unknown type {spec['type']!r}")
+    enum = _scalars(f"{path_str}.enum", spec["enum"]) if "enum" in spec else None
+    try:
+        pattern = re.compile(spec["pattern"]) if "pattern" in spec else None
+    except (re.error, TypeError) as e:
+        raise RuleError(f"{path_str}: invalid pattern {spec['pattern']!r}: {e}") from e
+    min_len, max_len = spec.get("min_len"), spec.get("max_len")
+    lo, hi = spec.get("min"), spec.get("max")
+    no_pii = bool(spec.get("no_pii"))
+
+    def check(action: Dict[str, Any], agent: Optional[str], confidence: Optional[float]) -> List[Tuple[str, Optional[str], str]]:
+        value = _lookup(action, path)
+        if value is _MISSING or value is None:
+            return [("MISSING_FIELD", path_str, f"{path_str} is required")] if required else []
+        out: List[Tuple[str, Optional[str], str]] = []
+        # bool is an int subclass; never let True pass as a number.
+        if types is not None and (not isinstance(value, types) or (isinstance(value, bool) and bool not in types)):
+            out.append(("WRONG_TYPE", path_str, f"{path_str} must be {spec['type']}, got {type(value).__name__}"))
+            return out
+        if enum is not None and (not isinstance(value, SCALARS) or value not in enum):
+            out.append(("NOT_ALLOWED", path_str, f"{path_str}={value!r} not in {sorted(enum, key=str)}"))
+        if pattern is not None and not (isinstance(value, str) and pattern.search(value)):
+            out.append(("PATTERN", path_str, f"{path_str}={value!r} does not match {pattern.pattern!r}"))
+        if min_len is not None or max_len is not None:
+            n = len(value) if hasattr(value, "__len__") else 0
+            if min_len is not None and n < min_len:
+                out.append(("TOO_SHORT", path_str, f"{path_str} has length {n} < {min_len}"))
+            if max_len is not None and n > max_len:
+                out.append(("TOO_LONG", path_str, f"{path_str} has length {n} > {max_len}"))
+        if (lo is not None or hi is not None) and isinstance(value, (int, float)):
+            if lo is not None and value < lo:
+                out.append(("OUT_OF_RANGE", path_str, f"{path_str}={value} < {lo}"))
+            if hi is not None and value > hi:
+                out.append(("OUT_OF_RANGE", path_str, f"{path_str}={value} > {hi}"))
+        if no_pii and isinstance(value, str) and pii_spans(value):
+            out.append(("PII", path_str, f"{path_str} contains unredacted PII"))
+        return out
+
+    return check
+
+
+def _compile_when(when: Dict[str, Any]) -> Tuple[Optional[str], Callable[[Dict[str, Any], Optional[str]], bool]]:
+    # The action type is pulled out so rules can be bucketed by it; the
+    # remaining conditions become one predicate.
+    conditions: List[Tuple[str, Any]] = []
+    action_type: Optional[str] = None
+    for key, expected in when.items():
+        allowed = _scalars(f"when.{key}", expected)
+        if key == "type" and len(allowed) == 1:
+            action_type = next(iter(allowed))
+            continue
+        conditions.append((key, allowed))
+
+    if not conditions:
+        return action_type, lambda action, agent: True
+
+    def matches(action: Dict[str, Any], agent: Optional[str]) -> bool:
+        for key, allowed in conditions:
+            value = agent if key == "agent" else action.get(key)
+            if not isinstance(value, SCALARS) or value not in allowed:
+                return False
+        return True
+
+    return action_type, matches
+
+
+def _compile_rule(rule: Dict[str, Any]) -> Tuple[Optional[str], str, Callable[[Dict[str, Any], Optional[str]], bool], List[Check]]:
+    rule_id = rule.get("id")
+    if not rule_id:
+        raise RuleError(f"rule without an id: {rule}")
+    unknown = set(rule) - RULE_KEYS
+    if unknown:
+        raise RuleError(f"{rule_id}: unknown key(s) {sorted(unknown)}")
+
+    action_type, matches = _compile_when(rule.get("when") or {})
+    checks: List[Check] = [_compile_field(path, spec) for path, spec in (rule.get("fields") or {}).items()]
+
+    if "agents" in rule:
+        agents = _scalars(f"{rule_id}: agents", rule["agents"])
+
+        def agent_allowed(action: Dict[str, Any], agent: Optional[str], confidence: Optional[float]) -> List[Tuple[str, Optional[str], str]]:
+            if agent is not None and agent not in agents:
+                return [("AGENT_NOT_ALLOWED", None, f"agent {agent!r} may not emit {action.get('type')!r}")]
+            return []
+
+        checks.append(agent_allowed)
+
+    approval = rule.get("approval")
+    if approval not in (None, "required"):
+        raise RuleError(f"{rule_id}: approval must be 'required', got {approval!r}")
+    if approval == "required":
+
+        def approval_required(action: Dict[str, Any], agent: Optional[str], confidence: Optional[float]) -> List[Tuple[str, Optional[str], str]]:
+            if action.get("requires_approval") is not True:
+                return [("APPROVAL_REQUIRED", "requires_approval", "action must be approval-gated")]
+            return []
+
+        checks.append(approval_required)
+
+    if "min_confidence" in rule:
+        try:
+            threshold = float(rule["min_confidence"])
+        except (TypeError, ValueError) as e:
+            raise RuleError(f"{rule_id}: min_confidence must be a number, got {rule['min_confidence']!r}") from e
+
+        def confident(action: Dict[str, Any], agent: Optional[str], confidence: Optional[float]) -> List[Tuple[str, Optional[str], str]]:
+            if confidence is not None and confidence < threshold:
+                return [("LOW_CONFIDENCE", None, f"confidence {confidence} < {threshold}")]
+            return []
+
+        checks.append(confident)
+
+    return action_type, rule_id, matches, checks
+
+
+class RuleSet:
+    """A parsed rule document compiled into per-action-type check lists."""
+
+    def __init__(self, doc: Dict[str, Any]) -> None:
+        self.version = doc.get("version")
+        self.unmatched = doc.get("unmatched", "deny")
+        if self.unmatched not in ("deny", "allow"):
+            raise RuleError(f"unmatched must be 'deny' or 'allow', got {self.unmatched!r}")
+        self.rule_ids: List[str] = []
+        self._by_type: Dict[Optional[str], List[Tuple[str, Callable[[Dict[str, Any], Optional[str]], bool], List[Check]]]] = {}
+        for rule in doc.get("rules") or []:
+            action_type, rule_id, matches, checks = _compile_rule(rule)
+            if rule_id in self.rule_ids:
+                raise RuleError(f"duplicate rule id {rule_id!r}")
+            self.rule_ids.append(rule_id)
+            self._by_type.setdefault(action_type, []).append((rule_id, matches, checks))
+        # Rules without a fixed type apply to every action; merge them into each
+        # bucket once here so validation does a single dict lookup per action.
+        generic = self._by_type.get(None, [])
+        for action_type in list(self._by_type):
+            if action_type is not None:
+                self._by_type[action_type] = self._by_type[action_type] + generic
+
+    @classmethod
+    def from_file(cls, path: str) -> "RuleSet":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def validate(
+        self,
+        actions: Sequence[Dict[str, Any]],
+        agent: Optional[str] = None,
+        confidence: Optional[float] = None,
+    ) -> List[Violation]:
+        violations: List[Violation] = []
+        by_type = self._by_type
+        generic = by_type.get(None, [])
+        for i, action in enumerate(actions):
+            matched = False
+            action_type = action.get("type")
+            bucket = by_type.get(action_type, generic) if isinstance(action_type, SCALARS) else generic
+            for rule_id, matches, checks in bucket:
+                if not matches(action, agent):
+                    continue
+                matched = True
+                for check in checks:
+                    for code, field, message in check(action, agent, confidence):
+                        violations.append(Violation(i, rule_id, code, field, message))
+            if not matched and self.unmatched == "deny":
+                violations.append(Violation(i, "", "UNMATCHED", "type", f"no rule allows action type {action_type!r}"))
+        return violations
+
+
+class GuardrailEngine:
+    """Validates actions against a rule file, recompiling it when it changes.
+
+    The file's mtime is checked at most every `reload_interval` seconds, so
+    workers pick up edits without a restart. A file that fails to parse or
+    compile is reported in `last_error` and the previous rules stay active.
+    """
+
+    def __init__(self, path: str = DEFAULT_RULES_PATH, reload_interval: float = 1.0) -> None:
+        self.path = path
+        self.reload_interval = reload_interval
+        self.last_error: Optional[str] = None
+        self.reloads = 0
+        self._mtime = os.stat(path).st_mtime_ns
+        self.rules = RuleSet.from_file(path)
+        self._next_check = time.monotonic() + reload_interval
+
+    def maybe_reload(self, force: bool = False) -> bool:
+        now = time.monotonic()
+        if not force and now < self._next_check:
+            return False
+        self._next_check = now + self.reload_interval
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError as e:
+            self.last_error = f"{type(e).__name__}: {e}"
+            return False
+        if mtime == self._mtime and not force:
+            return False
+        self._mtime = mtime
+        try:
+            self.rules = RuleSet.from_file(self.path)
+        except Exception as e:  # whatever is wrong with the file, the old rules stay active
+            # _mtime already moved on, so this file is not re-read until it
+            # changes again; last_error stays set until a reload succeeds.
+            self.last_error = f"{type(e).__name__}: {e}"
+            return False
+        self.last_error = None
+        self.reloads += 1
+        return True
+
+    def validate(
+        self,
+        actions: Sequence[Dict[str, Any]],
+        agent: Optional[str] = None,
+        confidence: Optional[float] = None,
+    ) -> List[Violation]:
+        self.maybe_reload()
+        return self.rules.validate(actions, agent, confidence)
+
+    def validate_output(self, agent: str, output: Dict[str, Any]) -> List[Violation]:
+        return self.validate(output.get("actions") or [], agent, output.get("confidence"))
+
+    def gate(
+        self,
+        actions: Sequence[Dict[str, Any]],
+        agent: Optional[str] = None,
+        confidence: Optional[float] = None,
+    ) -> Tuple[List[Dict[str, Any]], List[Violation]]:
+        """Apply the rules instead of only reporting them: actions whose only
+        problems are approval or confidence come back with requires_approval
+        set; actions with any other violation are dropped and their
+        violations returned."""
+        violations = self.validate(actions, agent, confidence)
+        blocked = {v.index for v in violations if v.code not in APPROVABLE}
+        gated = {v.index for v in violations if v.code in APPROVABLE}
+        kept: List[Dict[str, Any]] = []
+        for i, action in enumerate(actions):
+            if i in blocked:
+                continue
+            kept.append(dict(action, requires_approval=True) if i in gated else action)
+        return kept, [v for v in violations if v.index in blocked]
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import re
+from typing import Iterable, List, Tuple
+
+# Reference patterns. redact() produces exactly what
+#   PHONE_RE.sub(PHONE_TOKEN, EMAIL_RE.sub(EMAIL_TOKEN, text))
+# would, but never runs these through the backtracking engine: on long runs of
+# word characters or digits/spaces both patterns go quadratic.
+EMAIL_RE = re.compile(r"[\w\.-]+@[\w\.-]+\.\w+")
+PHONE_RE = re.compile(r"(\+?\d[\d\-\(\) ]{8,}\d)")
+
+EMAIL_TOKEN = "[REDACTED_EMAIL]"
+PHONE_TOKEN = "[REDACTED_PHONE]"
+
+# Building blocks. Each one ends in a maximal run of one character class, so a
+# match attempt never backtracks and every character is visited O(1) times.
+_EMAIL_RUN = re.compile(r"[\w.-]+")
+_WORD_RUN = re.compile(r"\w+")
+_PHONE_RUN = re.compile(r"\d[\d\-\(\) ]*")
+_DIGIT = re.compile(r"\d")
+_PHONE_PUNCT = "-() "
+
+
+def _email_spans(text: str) -> List[Tuple[int, int]]:
+    spans: List[Tuple[int, int]] = []
+    at = text.find("@")
+    if at < 0:
+        return spans
+
+    n = len(text)
+    rev = text[::-1]
+    prev_end = 0
+    while at >= 0:
+        # Local part: the run of [\w.-] ending right before "@", clipped so it
+        # does not reach back into the previous match.
+        m = _EMAIL_RUN.match(rev, n - at)
+        start = max(at - (m.end() - m.start()) if m else at, prev_end)
+
+        # Domain: the longest prefix of the run after "@" that is followed by
+        # "." and a word character, i.e. the last such dot in the run.
+        dm = _EMAIL_RUN.match(text, at + 1)
+        if start < at and dm:
+            domain = dm.group()
+            dot = domain.rfind(".")
+            while dot >= 1 and not (dot + 1 < len(domain) and _WORD_RUN.match(domain, dot + 1)):
+                dot = domain.rfind(".", 0, dot)
+            if dot >= 1:
+                end = _WORD_RUN.match(text, at + 2 + dot).end()
+                spans.append((start, end))
+                prev_end = end
+        at = text.find("@", at + 1)
+    return spans
+
+
+def _phone_spans(text: str, lo: int, hi: int) -> List[Tuple[int, int]]:
+    # A match starts at a digit, extends over the run of [\d\-\(\) ] after it
+    # and must end on a digit 10+ characters later; the run is consumed whole,
+    # so at most one match per run, from its first digit to its last one.
+    spans: List[Tuple[int, int]] = []
+    for m in _PHONE_RUN.finditer(text, lo, hi):
+        first = m.start()
+        last = first + len(m.group().rstrip(_PHONE_PUNCT))
+        if last - first < 10:
+            continue
+        if first > lo and text[first - 1] == "+":
+            first -= 1
+        spans.append((first, last))
+    return spans
+
+
+def pii_spans(text: str) -> List[Tuple[int, int, str]]:
+    if "@" not in text and not _DIGIT.search(text):
+        return []
+
+    spans: List[Tuple[int, int, str]] = []
+    lo = 0
+    for start, end in _email_spans(text):
+        spans.extend((s, e, PHONE_TOKEN) for s, e in _phone_spans(text, lo, start))
+        spans.append((start, end, EMAIL_TOKEN))
+        lo = end
+    spans.extend((s, e, PHONE_TOKEN) for s, e in _phone_spans(text, lo, len(text)))
+    return spans
+
+
+def redact(text: str) -> str:
+    spans = pii_spans(text)
+    if not spans:
+        return text
+
+    parts: List[str] = []
+    pos = 0
+    for start, end, token in spans:
+        parts.append(text[pos:start])
+        parts.append(token)
+        pos = end
+    parts.append(text[pos:])
+    return "".join(parts)
+
+
+def redact_batch(texts: Iterable[str]) -> List[str]:
+    return [redact(t) for t in texts]
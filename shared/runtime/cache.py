@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from shared.runtime.versions import agent_version
+
+RunFn = Callable[[Dict[str, Any]], Any]
+
+
+def canonical_json(payload: Any) -> str:
+    # Key order and whitespace never change an agent's answer, so they must not change the key.
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def payload_key(agent_version: str, route: str, payload: Any) -> str:
+    h = hashlib.sha256()
+    for part in (agent_version, route, canonical_json(payload)):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+@dataclass
+class CacheStats:
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    memory_evictions: int = 0
+    expired: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return dict(asdict(self), hits=self.hits, hit_rate=round(self.hit_rate, 4))
+
+
+class ResultCache:
+    """Two-tier cache of serialized agent outputs keyed by payload_key().
+
+    The memory tier is an LRU bounded by entry count and total bytes. The
+    optional sqlite tier keeps entries for `ttl` seconds; a disk hit is
+    promoted into memory. Values are stored as the exact JSON text produced
+    on the miss, so every hit deserializes to a byte-identical output.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_entries: int = 10000,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: Optional[float] = 7 * 24 * 3600,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._clock = clock
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self.db: Optional[sqlite3.Connection] = None
+        if path:
+            self.db = sqlite3.connect(path, check_same_thread=False)
+            self.db.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS results (
+                    key TEXT PRIMARY KEY, agent TEXT NOT NULL, version TEXT NOT NULL,
+                    value TEXT NOT NULL, created REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS results_created ON results (created);
+                """
+            )
+
+    def close(self) -> None:
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+
+    def __enter__(self) -> "ResultCache":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _remember(self, key: str, value: str) -> None:
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_bytes -= len(old)
+        self._memory[key] = value
+        self._memory_bytes += len(value)
+        while self._memory and (len(self._memory) > self.max_entries or self._memory_bytes > self.max_bytes):
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            self.stats.memory_evictions += 1
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self.stats.memory_hits += 1
+                return value
+
+            if self.db is not None:
+                row = self.db.execute("SELECT value, created FROM results WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    if self.ttl is None or self._clock() - row[1] <= self.ttl:
+                        self._remember(key, row[0])
+                        self.stats.disk_hits += 1
+                        return row[0]
+                    with self.db:
+                        self.db.execute("DELETE FROM results WHERE key = ?", (key,))
+                    self.stats.expired += 1
+
+            self.stats.misses += 1
+            return None
+
+    def put(self, key: str, value: str, agent: str = "", version: str = "") -> None:
+        with self._lock:
+            self._remember(key, value)
+            if self.db is not None:
+                with self.db:
+                    self.db.execute(
+                        "INSERT OR REPLACE INTO results (key, agent, version, value, created) VALUES (?, ?, ?, ?, ?)",
+                        (key, agent, version, value, self._clock()),
+                    )
+
+    def evict_expired(self) -> int:
+        if self.db is None or self.ttl is None:
+            return 0
+        with self._lock, self.db:
+            n = self.db.execute("DELETE FROM results WHERE created < ?", (self._clock() - self.ttl,)).rowcount
+        self.stats.expired += n
+        return n
+
+    def purge_versions(self, current: Dict[str, str]) -> int:
+        # Rows written by an older build of an agent can never be hit again.
+        if self.db is None:
+            return 0
+        with self._lock, self.db:
+            return sum(
+                self.db.execute("DELETE FROM results WHERE agent = ? AND version != ?", (agent, version)).rowcount
+                for agent, version in current.items()
+            )
+
+    def wrap(self, agent: str, fn: RunFn, route: Optional[str] = None) -> "CachedRun":
+        return CachedRun(self, agent, fn, route or agent)
+
+
+class CachedRun:
+    """run(payload) with a cache in front. The agent's version hash is taken
+    once, when the wrapper is built, from the source files on disk."""
+
+    def __init__(self, cache: ResultCache, agent: str, fn: RunFn, route: str) -> None:
+        self.cache = cache
+        self.agent = agent
+        self.route = route
+        self.version = agent_version(agent)
+        self._fn = fn
+
+    def run_json(self, payload: Dict[str, Any]) -> Tuple[str, bool]:
+        key = payload_key(self.version, self.route, payload)
+        value = self.cache.get(key)
+        if value is not None:
+            return value, True
+        value = json.dumps(self._fn(payload), ensure_ascii=False)
+        self.cache.put(key, value, self.agent, self.version)
+        return value, False
+
+    def __call__(self, payload: Dict[str, Any]) -> Any:
+        # Misses go through the same JSON round trip as hits, so both return
+        # equal objects no matter which tier (if any) served them.
+        return json.loads(self.run_json(payload)[0])
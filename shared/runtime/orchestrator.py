@@ -0,0 +1,531 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from shared.policies.action_limits import ActionLimiter
+from shared.runtime.registry import get_run
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+# An action handler performs one side effect and returns a result dict. Real
+# connectors and local mocks both plug in here, keyed by target system.
+# A handler that also has `batch_size` and an async `call_many(actions)`
+# (returning one result dict or exception per action) is fed whole batches;
+# `window`, if set, is how long a worker waits for a batch to fill.
+Handler = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+SYSTEM_FOR_ACTION = {
+    "slack_post": "slack",
+    "salesforce_update": "salesforce",
+}
+
+EXECUTED = "executed"
+PENDING_APPROVAL = "pending_approval"
+FAILED = "failed"
+SKIPPED = "skipped"
+RATE_LIMITED = "rate_limited"
+
+
+@dataclass
+class TargetLimits:
+    concurrency: int = 4
+    max_attempts: int = 3
+    base_delay: float = 0.05
+    max_delay: float = 2.0
+
+
+@dataclass
+class ActionOutcome:
+    run_index: int
+    action_index: int
+    action: Dict[str, Any]
+    system: Optional[str]
+    status: str
+    attempts: int = 0
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class MockHandler:
+    """In-memory stand-in for a connector: records calls, can add latency and fail."""
+
+    latency: float = 0.0
+    fail_first: int = 0
+    calls: List[Dict[str, Any]] = field(default_factory=list)
+
+    async def __call__(self, action: Dict[str, Any]) -> Dict[str, Any]:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        self.calls.append(action)
+        if len(self.calls) <= self.fail_first:
+            raise RuntimeError("mock failure")
+        return {"ok": True}
+
+
+def system_for(action: Dict[str, Any]) -> Optional[str]:
+    return SYSTEM_FOR_ACTION.get(action.get("type") or "")
+
+
+def backoff_delay(attempt: int, limits: TargetLimits, rng: random.Random) -> float:
+    # Full jitter: uniform in [0, min(max_delay, base * 2**attempt)].
+    return rng.uniform(0, min(limits.max_delay, limits.base_delay * (2 ** attempt)))
+
+
+class ActionExecutor:
+    def __init__(
+        self,
+        handlers: Dict[str, Handler],
+        limits: Optional[Dict[str, TargetLimits]] = None,
+        approve: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        queue_size: int = 1000,
+        seed: Optional[int] = None,
+        limiter: Optional[ActionLimiter] = None,
+    ) -> None:
+        self.handlers = handlers
+        self.limits = limits or {}
+        self.approve = approve or (lambda action: False)
+        self.queue_size = queue_size
+        self.limiter = limiter
+        self._rng = random.Random(seed)
+
+    def _limits(self, system: str) -> TargetLimits:
+        return self.limits.get(system) or TargetLimits()
+
+    async def _attempt(self, system: str, outcome: ActionOutcome) -> None:
+        limits = self._limits(system)
+        handler = self.handlers[system]
+        while True:
+            outcome.attempts += 1
+            try:
+                outcome.result = await handler(outcome.action)
+                outcome.status = EXECUTED
+                outcome.error = None
+                return
+            except Exception as e:  # connector errors are retried, then reported
+                outcome.error = f"{type(e).__name__}: {e}"
+                if outcome.attempts >= limits.max_attempts:
+                    outcome.status = FAILED
+                    return
+            await asyncio.sleep(backoff_delay(outcome.attempts - 1, limits, self._rng))
+
+    async def _attempt_batch(self, system: str, batch: List[ActionOutcome]) -> None:
+        # Like _attempt, per action: only the actions that failed are retried,
+        # together, after one backoff delay.
+        limits = self._limits(system)
+        handler = self.handlers[system]
+        pending = batch
+        while pending:
+            for outcome in pending:
+                outcome.attempts += 1
+            try:
+                results = list(await handler.call_many([o.action for o in pending]))  # type: ignore[attr-defined]
+            except Exception as e:
+                results = [e] * len(pending)
+            if len(results) < len(pending):
+                # An action the handler did not answer for failed, and is retried like one.
+                missing = RuntimeError(f"no result from call_many ({len(results)} for {len(pending)} actions)")
+                results += [missing] * (len(pending) - len(results))
+            retry: List[ActionOutcome] = []
+            for outcome, result in zip(pending, results):
+                if isinstance(result, Exception):
+                    outcome.error = f"{type(result).__name__}: {result}"
+                    if outcome.attempts >= limits.max_attempts:
+                        outcome.status = FAILED
+                    else:
+                        retry.append(outcome)
+                else:
+                    outcome.result = result
+                    outcome.status = EXECUTED
+                    outcome.error = None
+            pending = retry
+            if pending:
+                await asyncio.sleep(backoff_delay(pending[0].attempts - 1, limits, self._rng))
+
+    async def _worker(self, system: str, queue: "asyncio.Queue[Optional[ActionOutcome]]") -> None:
+        while True:
+            outcome = await queue.get()
+            try:
+                if outcome is None:
+                    return
+                await self._attempt(system, outcome)
+            finally:
+                queue.task_done()
+
+    async def _batch_worker(self, system: str, queue: "asyncio.Queue[Optional[ActionOutcome]]") -> None:
+        handler = self.handlers[system]
+        size = max(1, int(getattr(handler, "batch_size")))
+        window = float(getattr(handler, "window", 0.0) or 0.0)
+
+        def drain(batch: List[ActionOutcome]) -> bool:
+            # Takes what is already queued; True once the stop sentinel was taken.
+            while len(batch) < size:
+                try:
+                    item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return False
+                if item is None:
+                    return True
+                batch.append(item)
+            return False
+
+        while True:
+            first = await queue.get()
+            if first is None:
+                queue.task_done()
+                return
+            batch = [first]
+            stop = drain(batch)
+            if not stop and len(batch) < size and window:
+                await asyncio.sleep(window)
+                stop = drain(batch)
+            try:
+                await self._attempt_batch(system, batch)
+            finally:
+                for _ in range(len(batch) + stop):
+                    queue.task_done()
+            if stop:
+                return
+
+    async def execute(self, runs: Iterable[List[Dict[str, Any]]]) -> List[ActionOutcome]:
+        outcomes: List[ActionOutcome] = []
+        queues: Dict[str, "asyncio.Queue[Optional[ActionOutcome]]"] = {}
+        workers: List[asyncio.Task] = []
+
+        for system in self.handlers:
+            # Bounded queues give backpressure: the producer waits when a
+            # target system falls behind instead of buffering every action.
+            queue: "asyncio.Queue[Optional[ActionOutcome]]" = asyncio.Queue(maxsize=self.queue_size)
+            queues[system] = queue
+            handler = self.handlers[system]
+            worker = self._batch_worker if hasattr(handler, "call_many") and hasattr(handler, "batch_size") else self._worker
+            for _ in range(max(1, self._limits(system).concurrency)):
+                workers.append(asyncio.create_task(worker(system, queue)))
+
+        try:
+            for run_index, actions in enumerate(runs):
+                ready: List[ActionOutcome] = []
+                for action_index, action in enumerate(actions or []):
+                    system = system_for(action)
+                    outcome = ActionOutcome(run_index, action_index, action, system, status=SKIPPED)
+                    outcomes.append(outcome)
+
+                    if system is None or system not in queues:
+                        outcome.error = f"no handler for action type {action.get('type')!r}"
+                        continue
+                    if action.get("requires_approval") and not self.approve(action):
+                        outcome.status = PENDING_APPROVAL
+                        continue
+                    ready.append(outcome)
+
+                if ready and self.limiter is not None:
+                    # One transaction per run, off the loop: the store may be
+                    # locked by another process for up to its busy timeout.
+                    decisions = await asyncio.to_thread(self.limiter.check_many, [o.action for o in ready])
+                    allowed: List[ActionOutcome] = []
+                    for outcome, decision in zip(ready, decisions):
+                        if decision.allowed:
+                            allowed.append(outcome)
+                        else:
+                            outcome.status = RATE_LIMITED
+                            outcome.error = f"{decision.key}: limit {decision.limit} reached, retry in {decision.retry_after:.1f}s"
+                    ready = allowed
+                for outcome in ready:
+                    await queues[outcome.system].put(outcome)  # type: ignore[index]
+
+            for system, queue in queues.items():
+                for _ in range(max(1, self._limits(system).concurrency)):
+                    await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            for w in workers:
+                w.cancel()
+
+        return outcomes
+
+
+def summarize(outcomes: List[ActionOutcome]) -> Dict[Tuple[Optional[str], str], int]:
+    counts: Dict[Tuple[Optional[str], str], int] = {}
+    for o in outcomes:
+        key = (o.system, o.status)
+        counts[key] = counts.get(key, 0) + 1
+    return counts
+
+
+def execute_actions(
+    runs: Iterable[List[Dict[str, Any]]],
+    handlers: Dict[str, Handler],
+    **kwargs: Any,
+) -> List[ActionOutcome]:
+    return asyncio.run(ActionExecutor(handlers, **kwargs).execute(runs))
+
+
+# ---------------------------------------------------------------------------
+# Multi-agent DAG
+#
+# One incoming payload often concerns several agents: a meeting carries an
+# opportunity the risk inspector should look at, and a qualified lead can be
+# inspected once it is converted. AgentDAG parses the payload once and pulls
+# out the parts the agents read (transcript, opportunity, lead) into a
+# SharedContext; each agent still normalizes its own input. It builds each
+# agent's input from the context (and from the outputs of the nodes it
+# depends on), runs nodes as soon as their
+# dependencies finish, and merges every node's actions into one list for the
+# ActionExecutor.
+# ---------------------------------------------------------------------------
+
+RunFn = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+@dataclass
+class SharedContext:
+    payload: Dict[str, Any]
+    transcript: str
+    opportunity: Dict[str, Any]
+    lead: Dict[str, Any]
+
+    @classmethod
+    def from_payload(cls, payload: Union[str, bytes, Dict[str, Any]]) -> "SharedContext":
+        if not isinstance(payload, dict):
+            payload = json.loads(payload)
+        meeting = payload.get("meeting") or {}
+        return cls(
+            payload=payload,
+            transcript=(payload.get("transcript") or "").strip(),
+            opportunity=payload.get("opportunity") or meeting.get("opportunity") or {},
+            lead=payload.get("lead") or {},
+        )
+
+
+# A node's build function returns the agent's input, or None to skip the node
+# for this payload. It receives the outputs of every node that already ran.
+BuildFn = Callable[[SharedContext, Dict[str, Dict[str, Any]]], Optional[Dict[str, Any]]]
+
+
+@dataclass
+class AgentNode:
+    name: str
+    agent: str
+    build: BuildFn
+    after: Tuple[str, ...] = ()
+
+
+@dataclass
+class DAGRun:
+    outputs: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    skipped: List[str] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)
+    actions: List[Dict[str, Any]] = field(default_factory=list)
+    action_sources: List[str] = field(default_factory=list)
+
+
+def lead_to_opportunity(lead: Dict[str, Any], output: Dict[str, Any]) -> Dict[str, Any]:
+    # The opportunity a qualified lead converts into, as the risk inspector reads it.
+    text = f"{lead.get('use_case') or ''} {lead.get('notes') or ''}".lower()
+    return {
+        "name": lead.get("company") or "",
+        "stage": "Discovery",
+        "amount": lead.get("amount") or 0,
+        "age_days": 0,
+        "budget_status": lead.get("budget") or "",
+        "security_review": "security" in text,
+        "meddpicc": {"identify_pain": lead.get("use_case") or "", "metrics": "", "economic_buyer": "", "paper_process": ""},
+        "lead_score": output.get("score"),
+    }
+
+
+def build_lead(ctx: SharedContext, upstream: Dict[str, Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    return {"lead": ctx.lead} if ctx.lead else None
+
+
+def build_meeting(ctx: SharedContext, upstream: Dict[str, Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    return {"transcript": ctx.transcript, "opportunity": ctx.opportunity} if ctx.transcript else None
+
+
+def build_risk(ctx: SharedContext, upstream: Dict[str, Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    if ctx.opportunity:
+        return {"opportunity": ctx.opportunity}
+    lead_output = upstream.get("lead_qualification")
+    if lead_output and lead_output.get("decision") == "qualify":
+        return {"opportunity": lead_to_opportunity(ctx.lead, lead_output)}
+    return None
+
+
+DEFAULT_NODES = [
+    AgentNode("lead_qualification", "lead_qualification", build_lead),
+    AgentNode("meeting_followup", "meeting_followup", build_meeting),
+    AgentNode("pipeline_risk_inspector", "pipeline_risk_inspector", build_risk, after=("lead_qualification",)),
+]
+
+
+class AgentDAG:
+    """Runs a set of AgentNodes over one payload in dependency order.
+
+    Without an executor nodes run inline in topological order. With one
+    (e.g. a ThreadPoolExecutor when agents wait on I/O), a node is submitted
+    as soon as all of its dependencies have finished. For CPU-bound agents,
+    run_many() parallelizes across payloads on a process pool instead.
+    A node whose build function or agent raises is recorded in `errors`;
+    nodes depending on it are skipped.
+    """
+
+    def __init__(self, nodes: Optional[List[AgentNode]] = None, resolve: Callable[[str], RunFn] = get_run) -> None:
+        self.nodes = list(nodes or DEFAULT_NODES)
+        self.resolve = resolve
+        by_name = {n.name: n for n in self.nodes}
+        if len(by_name) != len(self.nodes):
+            raise ValueError("duplicate node names")
+        for node in self.nodes:
+            for dep in node.after:
+                if dep not in by_name:
+                    raise ValueError(f"node {node.name!r} depends on unknown node {dep!r}")
+        self.order = self._toposort(by_name)
+        self._runs: Dict[str, RunFn] = {}
+
+    def _toposort(self, by_name: Dict[str, AgentNode]) -> List[AgentNode]:
+        order: List[AgentNode] = []
+        state: Dict[str, int] = {}  # 1 = visiting, 2 = done
+
+        def visit(node: AgentNode) -> None:
+            mark = state.get(node.name)
+            if mark == 2:
+                return
+            if mark == 1:
+                raise ValueError(f"dependency cycle through {node.name!r}")
+            state[node.name] = 1
+            for dep in node.after:
+                visit(by_name[dep])
+            state[node.name] = 2
+            order.append(node)
+
+        for node in self.nodes:
+            visit(node)
+        return order
+
+    def _run_fn(self, agent: str) -> RunFn:
+        fn = self._runs.get(agent)
+        if fn is None:
+            fn = self._runs[agent] = self.resolve(agent)
+        return fn
+
+    def _ready(self, node: AgentNode, result: DAGRun) -> bool:
+        # A node whose dependency raised is skipped; a skipped dependency is
+        # fine, the build function decides from whatever outputs exist.
+        return not any(dep in result.errors for dep in node.after)
+
+    def run(self, payload: Union[str, bytes, Dict[str, Any]], executor: Optional["Executor"] = None) -> DAGRun:
+        result = DAGRun()
+        try:
+            ctx = SharedContext.from_payload(payload)
+        except Exception as e:  # unparseable: no node can run, keyed as "payload"
+            result.errors["payload"] = f"{type(e).__name__}: {e}"
+            result.skipped.extend(node.name for node in self.order)
+            return result
+        if executor is None:
+            for node in self.order:
+                self._step(node, ctx, result)
+        else:
+            self._run_concurrent(ctx, result, executor)
+        self._merge_actions(result)
+        return result
+
+    def _input(self, node: AgentNode, ctx: SharedContext, result: DAGRun) -> Optional[Dict[str, Any]]:
+        # The node's agent input, or None once the node is recorded as skipped or failed.
+        if not self._ready(node, result):
+            result.skipped.append(node.name)
+            return None
+        try:
+            agent_input = node.build(ctx, result.outputs)
+        except Exception as e:  # a malformed payload fails this node, not the run
+            result.errors[node.name] = f"{type(e).__name__}: {e}"
+            return None
+        if agent_input is None:
+            result.skipped.append(node.name)
+        return agent_input
+
+    def _step(self, node: AgentNode, ctx: SharedContext, result: DAGRun) -> None:
+        agent_input = self._input(node, ctx, result)
+        if agent_input is None:
+            return
+        try:
+            result.outputs[node.name] = self._run_fn(node.agent)(agent_input)
+        except Exception as e:  # one agent failing must not lose the others' results
+            result.errors[node.name] = f"{type(e).__name__}: {e}"
+
+    def _run_concurrent(self, ctx: SharedContext, result: DAGRun, executor: "Executor") -> None:
+        from concurrent.futures import FIRST_COMPLETED, wait
+
+        waiting = list(self.order)
+        running: Dict[Any, str] = {}
+        finished: set = set()
+        while waiting or running:
+            for node in [n for n in waiting if all(d in finished for d in n.after)]:
+                waiting.remove(node)
+                agent_input = self._input(node, ctx, result)
+                if agent_input is None:
+                    finished.add(node.name)
+                    continue
+                running[executor.submit(self._run_fn(node.agent), agent_input)] = node.name
+            if not running:
+                continue
+            done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    result.outputs[name] = future.result()
+                except Exception as e:
+                    result.errors[name] = f"{type(e).__name__}: {e}"
+                finished.add(name)
+
+    def _merge_actions(self, result: DAGRun) -> None:
+        # Topological order, so the merged list is the same however nodes were scheduled.
+        for node in self.order:
+            output = result.outputs.get(node.name)
+            for action in (output or {}).get("actions") or []:
+                result.actions.append(action)
+                result.action_sources.append(node.agent)
+
+    def run_many(
+        self,
+        payloads: Iterable[Union[str, bytes, Dict[str, Any]]],
+        workers: int = 1,
+        chunk_size: int = 64,
+    ) -> Iterator[DAGRun]:
+        """DAG runs for many payloads, in input order. With workers > 1 each
+        chunk of payloads runs in a pool process; nodes, their build
+        functions and `resolve` must then be picklable (module-level)."""
+        if workers <= 1:
+            for payload in payloads:
+                yield self.run(payload)
+            return
+
+        # Imported here, as in the eval runner: the pool is only for bulk runs.
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending: List[Any] = []
+            chunk: List[Any] = []
+            for payload in payloads:
+                chunk.append(payload)
+                if len(chunk) >= chunk_size:
+                    pending.append(pool.submit(_dag_chunk, self.nodes, chunk, self.resolve))
+                    chunk = []
+                    if len(pending) >= workers * 2:
+                        yield from pending.pop(0).result()
+            if chunk:
+                pending.append(pool.submit(_dag_chunk, self.nodes, chunk, self.resolve))
+            for future in pending:
+                yield from future.result()
+
+    def execute(self, result: DAGRun, handlers: Dict[str, Handler], **kwargs: Any) -> List[ActionOutcome]:
+        return execute_actions([result.actions], handlers, **kwargs)
+
+
+def _dag_chunk(nodes: List[AgentNode], payloads: List[Any], resolve: Callable[[str], RunFn]) -> List[DAGRun]:
+    dag = AgentDAG(nodes, resolve)
+    return [dag.run(p) for p in payloads]
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import importlib
+from typing import Any, Callable, Dict, List
+
+# Agent name -> module path. Nothing here is imported until an agent is asked
+# for, so a CLI run pays only for the agent it actually uses.
+AGENT_MODULES = {
+    "lead_qualification": "agents.lead_qualification.src.agent",
+    "meeting_followup": "agents.meeting_followup.src.agent",
+    "pipeline_risk_inspector": "agents.pipeline_risk_inspector.src.agent",
+}
+
+_loaded: Dict[str, Any] = {}
+
+
+def agent_names() -> List[str]:
+    return sorted(AGENT_MODULES)
+
+
+def load_agent(name: str) -> Any:
+    mod = _loaded.get(name)
+    if mod is None:
+        if name not in AGENT_MODULES:
+            raise KeyError(f"unknown agent {name!r}; expected one of {agent_names()}")
+        mod = importlib.import_module(AGENT_MODULES[name])
+        if not hasattr(mod, "run"):
+            raise AttributeError(f"Agent module {AGENT_MODULES[name]} is missing run(input_dict)->output_dict")
+        _loaded[name] = mod
+    return mod
+
+
+def get_run(name: str) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    return load_agent(name).run
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+import socket
+import socketserver
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, IO, Iterable, Iterator, List, Optional, Tuple
+
+from shared.runtime.cache import CachedRun, ResultCache
+from shared.runtime.registry import AGENT_MODULES, load_agent
+
+# Payload key -> (agent, entry point). Checked in order; the first key present wins.
+SHAPES: List[Tuple[str, str, str]] = [
+    ("lead", "lead_qualification", "run"),
+    ("transcript", "meeting_followup", "run"),
+    ("opportunities", "pipeline_risk_inspector", "run_batch"),
+    ("opportunity", "pipeline_risk_inspector", "run"),
+]
+
+
+class RouteError(Exception):
+    pass
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    # Nearest rank, as in shared/bench/harness.py; the server does not import
+    # the bench package.
+    if not sorted_values:
+        return 0.0
+    k = math.ceil(pct / 100.0 * len(sorted_values)) - 1
+    return sorted_values[max(0, min(len(sorted_values) - 1, k))]
+
+
+class LatencyStats:
+    """Per-route request counts and latency percentiles over the last `window` requests."""
+
+    def __init__(self, window: int = 10000) -> None:
+        self.window = window
+        self.started = time.time()
+        self._samples: Dict[str, Deque[float]] = {}
+        self._counts: Dict[str, List[int]] = {}  # route -> [ok, errors]
+        self._lock = threading.Lock()
+
+    def record(self, route: str, seconds: float, ok: bool) -> None:
+        with self._lock:
+            samples = self._samples.get(route)
+            if samples is None:
+                samples = self._samples[route] = deque(maxlen=self.window)
+                self._counts[route] = [0, 0]
+            samples.append(seconds)
+            self._counts[route][0 if ok else 1] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            routes = {k: (sorted(v), list(self._counts[k])) for k, v in self._samples.items()}
+        out: Dict[str, Any] = {"uptime_s": round(time.time() - self.started, 3), "routes": {}}
+        for route, (samples, (ok, errors)) in sorted(routes.items()):
+            out["routes"][route] = {
+                "requests": ok + errors,
+                "errors": errors,
+                "mean_ms": round(1000.0 * sum(samples) / len(samples), 4) if samples else 0.0,
+                "p50_ms": round(1000.0 * _percentile(samples, 50), 4),
+                "p95_ms": round(1000.0 * _percentile(samples, 95), 4),
+                "p99_ms": round(1000.0 * _percentile(samples, 99), 4),
+            }
+        return out
+
+
+class Router:
+    """Keeps every agent module imported and dispatches requests to them.
+
+    A request is either a bare agent payload, routed by its shape (see SHAPES),
+    or an envelope {"id": ..., "agent": ..., "payload": {...}}. Envelopes may
+    also carry {"op": "stats"} or {"op": "ping"} instead of a payload.
+    Responses echo the request id. With a ResultCache, repeated payloads are
+    answered from the cache.
+    """
+
+    def __init__(
+        self,
+        agents: Optional[List[str]] = None,
+        stats_window: int = 10000,
+        cache: Optional[ResultCache] = None,
+    ) -> None:
+        self.names = list(agents or AGENT_MODULES)
+        self.agents: Dict[str, Any] = {}
+        self.stats = LatencyStats(stats_window)
+        self.cache = cache
+        self._cached: Dict[str, CachedRun] = {}
+
+    def warm(self) -> "Router":
+        # Importing compiles every module-level regex and keyword table once.
+        for name in self.names:
+            self.agents[name] = load_agent(name)
+        return self
+
+    def _with_cache(self, route: str, fn: Callable[[Dict[str, Any]], Any]) -> Callable[[Dict[str, Any]], Any]:
+        if self.cache is None:
+            return fn
+        cached = self._cached.get(route)
+        if cached is None:
+            cached = self._cached[route] = self.cache.wrap(route.split(".")[0], fn, route)
+        return cached
+
+    def resolve(self, payload: Dict[str, Any], agent: Optional[str] = None) -> Tuple[str, Callable[[Dict[str, Any]], Any]]:
+        if agent:
+            mod = self.agents.get(agent)
+            if mod is None:
+                raise RouteError(f"unknown agent {agent!r}")
+            # Named pipeline requests with a list of opportunities still take the batch path.
+            if agent == "pipeline_risk_inspector" and "opportunities" in payload and hasattr(mod, "run_batch"):
+                return f"{agent}.run_batch", mod.run_batch
+            return agent, mod.run
+        for key, name, entry in SHAPES:
+            if key in payload and name in self.agents:
+                fn = getattr(self.agents[name], entry)
+                return (name if entry == "run" else f"{name}.{entry}"), fn
+        raise RouteError(f"cannot route payload with keys {sorted(payload)}")
+
+    def dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        envelope = "payload" in request or "op" in request
+        req_id = request.get("id") if envelope else None
+        op = request.get("op") if envelope else None
+        if op == "ping":
+            return {"id": req_id, "ok": True}
+        if op == "stats":
+            stats = self.stats.snapshot()
+            if self.cache is not None:
+                stats["cache"] = self.cache.stats.as_dict()
+            return {"id": req_id, "stats": stats}
+        if op is not None:
+            return {"id": req_id, "error": f"unknown op {op!r}"}
+
+        payload = request.get("payload") if envelope else request
+        t0 = time.perf_counter()
+        route = "unrouted"
+        try:
+            if not isinstance(payload, dict):
+                raise RouteError("payload must be a JSON object")
+            route, fn = self.resolve(payload, request.get("agent") if envelope else None)
+            result = self._with_cache(route, fn)(payload)
+        except Exception as e:  # reported per request, the worker keeps serving
+            self.stats.record(route, time.perf_counter() - t0, ok=False)
+            return {"id": req_id, "route": route, "error": f"{type(e).__name__}: {e}"}
+        self.stats.record(route, time.perf_counter() - t0, ok=True)
+        return {"id": req_id, "route": route, "result": result}
+
+    def dispatch_line(self, line: str) -> str:
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return json.dumps({"id": None, "error": f"invalid JSON: {e}"})
+        if not isinstance(request, dict):
+            return json.dumps({"id": None, "error": "request must be a JSON object"})
+        return json.dumps(self.dispatch(request), ensure_ascii=False)
+
+
+def serve_stream(router: Router, src: IO[str], dst: IO[str]) -> int:
+    """Newline-delimited JSON over a pair of text streams (e.g. stdin/stdout).
+
+    Requests may be pipelined: responses come back in request order, each
+    flushed as soon as it is written so a waiting caller is never stalled.
+    """
+    served = 0
+    for line in src:
+        line = line.strip()
+        if not line:
+            continue
+        dst.write(router.dispatch_line(line))
+        dst.write("\n")
+        dst.flush()
+        served += 1
+    return served
+
+
+class _ConnectionHandler(socketserver.StreamRequestHandler):
+    router: Router
+
+    def handle(self) -> None:
+        # One thread per connection; a connection is a pipelined JSONL stream.
+        for raw in self.rfile:
+            line = raw.decode("utf-8").strip()
+            if not line:
+                continue
+            self.wfile.write(self.router.dispatch_line(line).encode("utf-8") + b"\n")
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class _TCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def make_server(router: Router, address: str) -> socketserver.BaseServer:
+    """`address` is a unix socket path, or host:port for local TCP."""
+    handler = type("Handler", (_ConnectionHandler,), {"router": router})
+    if ":" in address and not address.startswith(("/", ".")):
+        host, port = address.rsplit(":", 1)
+        return _TCPServer((host or "127.0.0.1", int(port)), handler)
+    if os.path.exists(address):
+        os.unlink(address)
+    return _UnixServer(address, handler)
+
+
+def _connect(address: str) -> socket.socket:
+    if ":" in address and not address.startswith(("/", ".")):
+        host, port = address.rsplit(":", 1)
+        return socket.create_connection((host or "127.0.0.1", int(port)))
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.connect(address)
+    return sock
+
+
+def request_many(address: str, requests: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Pipelined client: sends every request on one connection while a
+    background thread writes, and yields responses in request order."""
+    sock = _connect(address)
+    reader = sock.makefile("rb")
+
+    def send() -> None:
+        try:
+            with sock.makefile("wb") as w:
+                for req in requests:
+                    w.write(json.dumps(req).encode("utf-8") + b"\n")
+        finally:
+            sock.shutdown(socket.SHUT_WR)
+
+    writer = threading.Thread(target=send, daemon=True)
+    writer.start()
+    try:
+        for raw in reader:
+            yield json.loads(raw)
+    finally:
+        writer.join()
+        reader.close()
+        sock.close()
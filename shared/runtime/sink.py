@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import csv
+import os
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Columnar output for BI ingestion. Each agent's result is flattened into
+# fixed columns (scalars, counts, flag bitsets, string lists), buffered as one
+# list per column, and written a row group at a time, so memory is bounded by
+# row_group_size whatever the number of results.
+#
+# Arrow IPC (.arrow / .feather / .ipc) and Parquet (.parquet) need pyarrow,
+# which is optional; without it, or for .csv paths, rows go to CSV. In CSV,
+# list columns are joined with LIST_SEP and null is the empty string.
+
+STR, INT, FLOAT, BOOL, LIST = "str", "int", "float", "bool", "list"
+LIST_SEP = " | "
+DEFAULT_ROW_GROUP = 65_536
+
+# (column name, kind, value from the agent's output dict)
+Column = Tuple[str, str, Callable[[Dict[str, Any]], Any]]
+
+
+def _pipeline_flags() -> List[str]:
+    from agents.pipeline_risk_inspector.src.agent import RULES
+
+    return [flag for flag, _, _ in RULES]
+
+
+# Bit i of flag_bits is set when PIPELINE_FLAGS[i] was raised. The order is
+# the agent's rule order; append new flags so stored bitsets keep meaning.
+PIPELINE_FLAGS = _pipeline_flags()
+FLAG_BITS = {flag: 1 << i for i, flag in enumerate(PIPELINE_FLAGS)}
+
+
+def flag_bits(flags: Iterable[str]) -> int:
+    bits = 0
+    for flag in flags:
+        bit = FLAG_BITS.get(flag)
+        if bit is None:
+            raise ValueError(f"flag {flag!r} has no bit; add it to the agent's RULES")
+        bits |= bit
+    return bits
+
+
+def _get(key: str) -> Callable[[Dict[str, Any]], Any]:
+    return lambda out: out.get(key)
+
+
+def _list(*path: str) -> Callable[[Dict[str, Any]], Any]:
+    def get(out: Dict[str, Any]) -> Any:
+        cur: Any = out
+        for key in path:
+            cur = (cur or {}).get(key)
+        return None if cur is None else [str(x) for x in cur]
+
+    return get
+
+
+def _count(*path: str) -> Callable[[Dict[str, Any]], Any]:
+    get_list = _list(*path)
+
+    def count(out: Dict[str, Any]) -> Any:
+        values = get_list(out)
+        return None if values is None else len(values)
+
+    return count
+
+
+def _actions(action_type: Optional[str] = None, approval: bool = False) -> Callable[[Dict[str, Any]], Any]:
+    def count(out: Dict[str, Any]) -> Any:
+        actions = out.get("actions")
+        if actions is None:
+            return None
+        return sum(
+            1
+            for a in actions
+            if (action_type is None or a.get("type") == action_type) and (not approval or a.get("requires_approval"))
+        )
+
+    return count
+
+
+ACTION_COLUMNS: List[Column] = [
+    ("actions", INT, _actions()),
+    ("actions_slack_post", INT, _actions("slack_post")),
+    ("actions_salesforce_update", INT, _actions("salesforce_update")),
+    ("actions_requiring_approval", INT, _actions(approval=True)),
+]
+
+SCHEMAS: Dict[str, List[Column]] = {
+    "lead_qualification": [
+        ("decision", STR, _get("decision")),
+        ("score", INT, _get("score")),
+        ("confidence", FLOAT, _get("confidence")),
+        ("requires_approval", BOOL, _get("requires_approval")),
+        ("explanation", LIST, _list("explanation")),
+        *ACTION_COLUMNS,
+    ],
+    "meeting_followup": [
+        ("confidence", FLOAT, _get("confidence")),
+        ("requires_approval", BOOL, _get("requires_approval")),
+        ("requirements", LIST, _list("extracted", "requirements")),
+        ("competition", LIST, _list("extracted", "competition")),
+        ("metrics", LIST, _list("extracted", "metrics")),
+        ("seller_actions", LIST, _list("extracted", "next_steps", "seller_actions")),
+        ("customer_actions", LIST, _list("extracted", "next_steps", "customer_actions")),
+        ("due_dates", LIST, _list("extracted", "next_steps", "due_dates")),
+        ("risks", LIST, _list("extracted", "next_steps", "risks")),
+        *ACTION_COLUMNS,
+    ],
+    "pipeline_risk_inspector": [
+        ("risk_score", FLOAT, _get("risk_score")),
+        ("confidence", FLOAT, _get("confidence")),
+        ("flag_bits", INT, lambda out: None if out.get("flags") is None else flag_bits(out["flags"])),
+        ("flag_count", INT, _count("flags")),
+        ("explanation", LIST, _list("explanation")),
+        ("evidence", LIST, _list("evidence")),
+    ],
+}
+
+# Every table starts with the input line (to join back to the source) and the
+# error, if the agent raised on that record; the agent columns are then null.
+LEADING: List[Column] = [("line", INT, _get("line")), ("error", STR, _get("error"))]
+
+FORMATS = {".arrow": "arrow", ".feather": "arrow", ".ipc": "arrow", ".parquet": "parquet", ".csv": "csv"}
+
+
+def _columns(agent: str) -> List[Column]:
+    if agent not in SCHEMAS:
+        raise KeyError(f"no columnar schema for agent {agent!r}; expected one of {sorted(SCHEMAS)}")
+    return LEADING + SCHEMAS[agent]
+
+
+class _CsvWriter:
+    def __init__(self, path: str, columns: List[Column]) -> None:
+        self._f = open(path, "w", encoding="utf-8", newline="")
+        self._w = csv.writer(self._f)
+        self._w.writerow([name for name, _, _ in columns])
+        self._lists = [i for i, (_, kind, _) in enumerate(columns) if kind == LIST]
+
+    def write(self, data: List[List[Any]]) -> None:
+        for i in self._lists:
+            data[i] = [None if v is None else LIST_SEP.join(v) for v in data[i]]
+        self._w.writerows(zip(*data))
+
+    def close(self) -> None:
+        self._f.close()
+
+
+class _ArrowWriter:
+    def __init__(self, path: str, columns: List[Column], fmt: str, agent: str) -> None:
+        import json
+
+        import pyarrow as pa
+
+        types = {STR: pa.string(), INT: pa.int64(), FLOAT: pa.float64(), BOOL: pa.bool_(), LIST: pa.list_(pa.string())}
+        metadata = {"agent": agent}
+        if agent == "pipeline_risk_inspector":
+            metadata["flag_bits"] = json.dumps(FLAG_BITS)
+        self._pa = pa
+        self._schema = pa.schema([(name, types[kind]) for name, kind, _ in columns], metadata=metadata)
+        if fmt == "parquet":
+            import pyarrow.parquet as pq
+
+            self._writer = pq.ParquetWriter(path, self._schema)
+        else:
+            self._writer = pa.ipc.new_file(path, self._schema)
+
+    def write(self, data: List[List[Any]]) -> None:
+        # Each flush becomes one Arrow record batch / one Parquet row group.
+        self._writer.write_table(self._pa.Table.from_arrays(data, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+def _arrow_available() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class ResultSink:
+    """Streams agent results into a columnar file.
+
+    The format follows the extension of `path`. When pyarrow is missing, an
+    Arrow or Parquet path is written as CSV next to it (same name, .csv
+    suffix); `path` and `format` report what was actually written.
+    """
+
+    def __init__(self, path: str, agent: str, row_group_size: int = DEFAULT_ROW_GROUP) -> None:
+        if row_group_size < 1:
+            raise ValueError(f"row_group_size must be >= 1, got {row_group_size}")
+        self.agent = agent
+        self.columns = _columns(agent)
+        self.row_group_size = row_group_size
+        self.rows = 0
+        self.row_groups = 0
+
+        root, ext = os.path.splitext(path)
+        fmt = FORMATS.get(ext.lower())
+        if fmt is None:
+            raise ValueError(f"unknown columnar format {ext!r}; expected one of {sorted(FORMATS)}")
+        if fmt != "csv" and not _arrow_available():
+            print(f"pyarrow is not installed; writing {root}.csv instead of {path}", file=sys.stderr)
+            path, fmt = root + ".csv", "csv"
+        self.path = path
+        self.format = fmt
+        self._writer = _CsvWriter(path, self.columns) if fmt == "csv" else _ArrowWriter(path, self.columns, fmt, agent)
+        self._buffer: List[List[Any]] = [[] for _ in self.columns]
+        self._getters = [get for _, _, get in self.columns[1:]]
+
+    def add(self, out: Dict[str, Any], line: Optional[int] = None) -> None:
+        # An error record carries its own input line, which wins over `line`.
+        buf = self._buffer
+        buf[0].append(out.get("line", line))
+        for col, get in zip(buf[1:], self._getters):
+            col.append(get(out))
+        if len(buf[0]) >= self.row_group_size:
+            self.flush()
+
+    def flush(self) -> None:
+        n = len(self._buffer[0])
+        if not n:
+            return
+        self._writer.write(self._buffer)
+        self._buffer = [[] for _ in self.columns]
+        self.rows += n
+        self.row_groups += 1
+
+    def close(self) -> None:
+        self.flush()
+        self._writer.close()
+
+    def __enter__(self) -> "ResultSink":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def write_results(
+    path: str,
+    agent: str,
+    results: Iterable[Dict[str, Any]],
+    row_group_size: int = DEFAULT_ROW_GROUP,
+) -> ResultSink:
+    """Write `results` (line = 1-based position) and return the closed sink."""
+    with ResultSink(path, agent, row_group_size) as sink:
+        for line, out in enumerate(results, start=1):
+            sink.add(out, line)
+    return sink
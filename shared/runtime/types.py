@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import sys
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+# Compact records for the shapes agents pass around as nested dicts. Each
+# record keeps one slot per known key and parks anything else in `extra`, so
+# from_dict(d).to_dict() == d for the inputs in this repo. Low-cardinality
+# string fields (industry, stage, action type, ...) are interned, so a
+# million leads share one "Manufacturing" instead of a million copies.
+#
+# Records also answer .get(key, default) like the dicts they replace, so the
+# scalar agent code paths accept them unchanged.
+
+_intern = sys.intern
+
+
+def parse_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    return str(value or "").strip().lower() in {"true", "yes", "y", "1"}
+
+
+class Record:
+    __slots__ = ("extra",)
+
+    FIELDS: Tuple[str, ...] = ()
+    INTERNED: frozenset = frozenset()
+    _KEYS: frozenset = frozenset()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._KEYS = frozenset(cls.FIELDS)
+
+    def __init__(self, **fields: Any) -> None:
+        self.extra = None
+        for name in self.FIELDS:
+            setattr(self, name, fields.pop(name, None))
+        if fields:
+            self.extra = fields
+
+    @classmethod
+    def from_dict(cls, d: Optional[Dict[str, Any]]) -> "Record":
+        obj = cls.__new__(cls)
+        d = d or {}
+        get = d.get
+        interned = cls.INTERNED
+        for name in cls.FIELDS:
+            value = get(name)
+            if name in interned and value.__class__ is str:
+                value = _intern(value)
+            setattr(obj, name, value)
+        obj.extra = None
+        # Only build an extras dict when some key is not a known field.
+        if not cls._KEYS.issuperset(d):
+            keys = cls._KEYS
+            obj.extra = {k: v for k, v in d.items() if k not in keys}
+        return obj
+
+    def to_dict(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {}
+        for name in self.FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                out[name] = value
+        if self.extra:
+            out.update(self.extra)
+        return out
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._KEYS:
+            value = getattr(self, key)
+        elif self.extra:
+            value = self.extra.get(key)
+        else:
+            value = None
+        return default if value is None else value
+
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{k}={v!r}" for k, v in self.to_dict().items())
+        return f"{self.__class__.__name__}({fields})"
+
+
+class Meddpicc(Record):
+    FIELDS = (
+        "metrics",
+        "economic_buyer",
+        "decision_criteria",
+        "decision_process",
+        "paper_process",
+        "identify_pain",
+        "champion",
+        "competition",
+    )
+    __slots__ = FIELDS
+
+
+class Lead(Record):
+    FIELDS = (
+        "company",
+        "industry",
+        "employees",
+        "region",
+        "title",
+        "source",
+        "use_case",
+        "budget",
+        "timeline",
+        "notes",
+    )
+    INTERNED = frozenset({"industry", "region", "title", "source", "budget", "timeline"})
+    __slots__ = FIELDS
+
+
+class Opportunity(Record):
+    FIELDS = (
+        "id",
+        "name",
+        "stage",
+        "amount",
+        "close_date",
+        "last_activity_date",
+        "age_days",
+        "champion_confirmed",
+        "security_review",
+        "budget_status",
+        "owner",
+        "meddpicc",
+    )
+    INTERNED = frozenset({"stage", "close_date", "last_activity_date", "budget_status", "owner"})
+    __slots__ = FIELDS
+
+    @classmethod
+    def from_dict(cls, d: Optional[Dict[str, Any]]) -> "Opportunity":
+        obj = super().from_dict(d)
+        if isinstance(obj.meddpicc, dict):
+            obj.meddpicc = Meddpicc.from_dict(obj.meddpicc)
+        return obj
+
+    def to_dict(self) -> Dict[str, Any]:
+        out = super().to_dict()
+        if isinstance(self.meddpicc, Meddpicc):
+            out["meddpicc"] = self.meddpicc.to_dict()
+        return out
+
+
+class Action(Record):
+    # payload stays a plain dict: its shape differs per action type and it is
+    # handed to connectors as-is.
+    FIELDS = ("type", "target", "risk", "requires_approval", "payload")
+    INTERNED = frozenset({"type", "target", "risk"})
+    __slots__ = FIELDS
+
+
+# ---------------------------------------------------------------------------
+# Columnar batches
+#
+# One list or typed array per field instead of one object per row. Numbers
+# live in array('d'/'q'), flags in a bytearray, categorical strings are
+# interned. Values are normalized the way the agents read them (missing
+# text -> "", missing numbers -> 0), so batches are scoring inputs rather
+# than lossless copies; use the record types when the original dict matters.
+# ---------------------------------------------------------------------------
+
+RowLike = Union[Dict[str, Any], Record]
+
+
+class LeadBatch:
+    TEXT = ("company", "industry", "region", "title", "source", "use_case", "budget", "timeline", "notes")
+    INTERNED = Lead.INTERNED
+
+    __slots__ = TEXT + ("employees",)
+
+    def __init__(self) -> None:
+        for name in self.TEXT:
+            setattr(self, name, [])
+        self.employees = array("q")
+
+    @classmethod
+    def from_dicts(cls, leads: Iterable[Optional[RowLike]]) -> "LeadBatch":
+        batch = cls()
+        for lead in leads:
+            batch.append(lead)
+        return batch
+
+    def append(self, lead: Optional[RowLike]) -> None:
+        lead = lead or {}
+        get = lead.get
+        interned = self.INTERNED
+        for name in self.TEXT:
+            value = get(name) or ""
+            getattr(self, name).append(_intern(value) if name in interned else value)
+        self.employees.append(int(get("employees") or 0))
+
+    def __len__(self) -> int:
+        return len(self.employees)
+
+    def __getitem__(self, i: int) -> Lead:
+        lead = Lead(employees=self.employees[i])
+        for name in self.TEXT:
+            setattr(lead, name, getattr(self, name)[i])
+        return lead
+
+    def __iter__(self) -> Iterator[Lead]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        return [lead.to_dict() for lead in self]
+
+
+class OpportunityBatch:
+    TEXT = ("id", "name", "stage", "close_date", "last_activity_date", "budget_status", "owner")
+    INTERNED = Opportunity.INTERNED
+    FLAGS = ("champion_confirmed", "security_review")
+
+    __slots__ = TEXT + FLAGS + ("amount", "age_days", "meddpicc")
+
+    def __init__(self) -> None:
+        for name in self.TEXT:
+            setattr(self, name, [])
+        self.champion_confirmed = bytearray()
+        self.security_review = bytearray()
+        self.amount = array("d")
+        self.age_days = array("q")
+        self.meddpicc: Dict[str, List[str]] = {name: [] for name in Meddpicc.FIELDS}
+
+    @classmethod
+    def from_dicts(cls, opportunities: Iterable[Optional[RowLike]]) -> "OpportunityBatch":
+        batch = cls()
+        for opp in opportunities:
+            batch.append(opp)
+        return batch
+
+    def append(self, opp: Optional[RowLike]) -> None:
+        opp = opp or {}
+        get = opp.get
+        interned = self.INTERNED
+        for name in self.TEXT:
+            if name == "budget_status":
+                value = get("budget_status") or get("budget") or ""
+            else:
+                value = get(name) or ""
+            getattr(self, name).append(_intern(value) if name in interned else value)
+        self.champion_confirmed.append(parse_bool(get("champion_confirmed")))
+        self.security_review.append(parse_bool(get("security_review")))
+        self.amount.append(float(get("amount") or 0))
+        self.age_days.append(int(get("age_days") or 0))
+
+        # Flat CRM fields win over the nested MEDDPICC block, as in the agent.
+        meddpicc = get("meddpicc") or {}
+        for name, column in self.meddpicc.items():
+            column.append(get(name) or meddpicc.get(name) or "")
+
+    def __len__(self) -> int:
+        return len(self.amount)
+
+    def __getitem__(self, i: int) -> Opportunity:
+        opp = Opportunity(
+            amount=self.amount[i],
+            age_days=self.age_days[i],
+            champion_confirmed=bool(self.champion_confirmed[i]),
+            security_review=bool(self.security_review[i]),
+            meddpicc=Meddpicc(**{name: column[i] for name, column in self.meddpicc.items()}),
+        )
+        for name in self.TEXT:
+            setattr(opp, name, getattr(self, name)[i])
+        return opp
+
+    def __iter__(self) -> Iterator[Opportunity]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        return [opp.to_dict() for opp in self]
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+from typing import Iterable, List, Optional, Set
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SHARED_IMPORT = re.compile(r"^\s*import\s+(shared(?:\.\w+)+)", re.M)
+# `from shared.pkg import a, b as c` (optionally parenthesized over several
+# lines): the names may be submodules, e.g. `from shared.observability
+# import logging as tracing` runs shared/observability/logging.py.
+SHARED_FROM_IMPORT = re.compile(r"^\s*from\s+(shared(?:\.\w+)*)\s+import\s+(?:\(([^)]*)\)|([^\n#]+))", re.M)
+
+
+def _module_file(module: str) -> Optional[str]:
+    base = os.path.join(REPO_ROOT, *module.split("."))
+    for candidate in (base + ".py", os.path.join(base, "__init__.py")):
+        if os.path.exists(candidate):
+            return candidate
+    return None
+
+
+def imported_modules(source: str) -> List[str]:
+    modules = SHARED_IMPORT.findall(source)
+    for package, grouped, inline in SHARED_FROM_IMPORT.findall(source):
+        modules.append(package)
+        for name in (grouped or inline).replace("\\", " ").split(","):
+            name = name.split("#")[0].split()
+            if name:
+                modules.append(f"{package}.{name[0]}")
+    return modules
+
+
+def package_files(package_dir: str) -> List[str]:
+    files: List[str] = []
+    for root, dirs, names in os.walk(package_dir):
+        dirs[:] = [d for d in dirs if d != "__pycache__"]
+        files.extend(os.path.join(root, n) for n in names if not n.endswith(".pyc"))
+    return sorted(files)
+
+
+def version_files(agent: str) -> List[str]:
+    """Every file whose change can alter the agent's output: its sources and
+    prompts plus the shared modules they import, followed transitively."""
+    agent_dir = os.path.join(REPO_ROOT, "agents", agent)
+    files: Set[str] = set()
+    for sub in ("src", "prompts"):
+        files.update(package_files(os.path.join(agent_dir, sub)))
+
+    queue = [f for f in files if f.endswith(".py")]
+    while queue:
+        with open(queue.pop(), "r", encoding="utf-8") as f:
+            source = f.read()
+        for module in imported_modules(source):
+            # Names that are not submodules (functions, classes) resolve to no file.
+            path = _module_file(module)
+            if path and path not in files:
+                files.add(path)
+                queue.append(path)
+    return sorted(files)
+
+
+def files_version(paths: Iterable[str]) -> str:
+    h = hashlib.sha256()
+    for path in sorted(set(paths)):
+        h.update(os.path.relpath(path, REPO_ROOT).replace(os.sep, "/").encode("utf-8"))
+        h.update(b"\0")
+        with open(path, "rb") as f:
+            # Normalize line endings so a CRLF checkout hashes like an LF one.
+            h.update(f.read().replace(b"\r\n", b"\n"))
+        h.update(b"\0")
+    return h.hexdigest()[:16]
+
+
+def agent_version(agent: str) -> str:
+    return files_version(version_files(agent))